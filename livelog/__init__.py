@@ -1,3 +1,4 @@
 # -*- coding: utf-8 -*-
 
-from livelog.logger import Logger, LoggerSingleton
+from livelog.logger import Logger, LoggerSingleton, AsyncLogger
+from livelog.handler import LivelogHandler
@@ -2,26 +2,71 @@
 
 from platform import system
 from tempfile import gettempdir
+from glob import has_magic
 from pathlib import Path
-from argparse import ArgumentParser
+from argparse import ArgumentParser, ArgumentTypeError
+from livelog.network import DEFAULT_ADDRESS
 from livelog.reader import start_reader
 
 
+def _parse_field(value: str):
+    """Parse a key=value field filter.
+
+    Args:
+        value (str): Provided field filter
+
+    Returns:
+        tuple: Field key and value
+    """
+
+    key, separator, field_value = value.partition("=")
+    if not separator or not key:
+        raise ArgumentTypeError(f'Invalid field filter "{value}", expected key=value')
+    return key, field_value
+
+
+def _positive_float(value: str):
+    """Parse a strictly positive number.
+
+    Args:
+        value (str): Provided number
+
+    Returns:
+        float: Number
+    """
+
+    try:
+        number = float(value)
+    except ValueError:
+        number = 0
+    if number <= 0:
+        raise ArgumentTypeError(f'Invalid value "{value}", expected a positive number')
+    return number
+
+
 def _parse_args():
     """Parse CLI arguments.
 
     Returns:
-        tuple: Provided arguments
+        dict: Reader arguments
     """
 
     parser = ArgumentParser(description="Live read a log file")
+    parser.add_argument(
+        "command",
+        nargs="?",
+        choices=("read", "serve", "connect"),
+        default="read",
+        help="Read file, serve its new records to remote readers or connect to "
+        "a server. Default: read",
+    )
     parser.add_argument(
         "-f",
         "--file",
-        action="store",
+        action="append",
         type=str,
         required=False,
-        help="Log file to be read",
+        help="Log file to be read, can be repeated or be a glob pattern",
     )
     parser.add_argument(
         "-l",
@@ -38,10 +83,172 @@ def _parse_args():
         required=False,
         help="Do not color lines",
     )
+    parser.add_argument(
+        "--refresh-rate",
+        action="store",
+        type=_positive_float,
+        default=30,
+        required=False,
+        help="Maximum screen refreshes per second. Default: 30",
+    )
+    parser.add_argument(
+        "--max-lines",
+        action="store",
+        type=int,
+        default=0,
+        required=False,
+        help="Maximum lines printed per refresh, older ones are skipped. "
+        "Default: no limit",
+    )
+    parser.add_argument(
+        "-n",
+        "--lines",
+        action="store",
+        type=int,
+        default=None,
+        required=False,
+        help="Only print this number of last lines at startup",
+    )
+    parser.add_argument(
+        "--from-end",
+        action="store_true",
+        required=False,
+        help="Skip preexisting content, only print new lines",
+    )
+    parser.add_argument(
+        "--since",
+        action="store",
+        type=str,
+        default=None,
+        required=False,
+        help="Only print records logged from this HH:MM:SS time at startup",
+    )
+    parser.add_argument(
+        "--field",
+        action="append",
+        type=_parse_field,
+        default=[],
+        required=False,
+        help="Only print JSON records with this key=value field, can be repeated",
+    )
+    parser.add_argument(
+        "--grep",
+        action="append",
+        type=str,
+        default=[],
+        required=False,
+        help="Only print records containing this text, can be repeated",
+    )
+    parser.add_argument(
+        "--exclude",
+        action="append",
+        type=str,
+        default=[],
+        required=False,
+        help="Do not print records containing this text, can be repeated",
+    )
+    parser.add_argument(
+        "--regex",
+        action="append",
+        type=str,
+        default=[],
+        required=False,
+        help="Only print records matching this regex, can be repeated",
+    )
+    parser.add_argument(
+        "--highlight",
+        action="store_true",
+        required=False,
+        help="Highlight --grep and --regex matches",
+    )
+    parser.add_argument(
+        "-i",
+        "--interactive",
+        action="store_true",
+        required=False,
+        help="Page through read lines, search them and change level on the fly",
+    )
+    parser.add_argument(
+        "--buffer-size",
+        action="store",
+        type=int,
+        default=100000,
+        required=False,
+        help="Count of last lines kept in memory in interactive mode. Default: 100000",
+    )
+    parser.add_argument(
+        "--poll",
+        action="store_true",
+        required=False,
+        help="Poll files instead of watching filesystem events",
+    )
+    parser.add_argument(
+        "--poll-interval",
+        action="store",
+        type=_positive_float,
+        default=0.1,
+        required=False,
+        help="Minimum seconds between file checks when polling. Default: 0.1",
+    )
+    parser.add_argument(
+        "--max-poll-interval",
+        action="store",
+        type=_positive_float,
+        default=2.0,
+        required=False,
+        help="Maximum seconds between checks of an idle file when polling. Default: 2",
+    )
+    parser.add_argument(
+        "--stats-interval",
+        action="store",
+        type=float,
+        default=0,
+        required=False,
+        help="Dump reader stats as JSON every given seconds. Default: disabled",
+    )
+    parser.add_argument(
+        "--stats-file",
+        action="store",
+        type=str,
+        required=False,
+        help="Stats dump file. Default: stderr",
+    )
+    parser.add_argument(
+        "--address",
+        action="store",
+        type=str,
+        default=DEFAULT_ADDRESS,
+        required=False,
+        help=f"Server HOST:PORT or Unix socket path. Default: {DEFAULT_ADDRESS}",
+    )
+    parser.add_argument(
+        "--client-buffer",
+        action="store",
+        type=int,
+        default=10000,
+        required=False,
+        help="Maximum lines waiting for a slow client, older ones are dropped. "
+        "Default: 10000",
+    )
+    parser.add_argument(
+        "--listen",
+        action="store",
+        type=str,
+        required=False,
+        help="Print records sent by loggers to this UDP HOST:PORT or Unix socket "
+        "path instead of reading a file",
+    )
     args = parser.parse_args()
+    several = args.file is not None and (len(args.file) > 1 or has_magic(args.file[0]))
+    if args.interactive and several:
+        parser.error("--interactive only supports a single file")
+    if args.command == "serve" and several:
+        parser.error("serve only supports a single file")
 
-    if args.file is not None:
-        file = Path(args.file).resolve()
+    if several:
+        file = args.file
+    elif args.file is not None:
+        file = Path(args.file[0]).resolve()
     else:
         file = (
             Path("/tmp/livelog.log")
@@ -49,9 +256,88 @@ def _parse_args():
             else Path(gettempdir()) / "livelog.log"
         )
 
-    return file, args.level, args.nocolors
+    return {
+        "command": args.command,
+        "address": args.address,
+        "client_buffer": args.client_buffer,
+        "listen": args.listen,
+        "file": file,
+        "level": args.level,
+        "nocolors": args.nocolors,
+        "refresh_rate": args.refresh_rate,
+        "max_lines": args.max_lines,
+        "lines": args.lines,
+        "from_end": args.from_end,
+        "since": args.since,
+        "fields": dict(args.field),
+        "grep": args.grep,
+        "exclude": args.exclude,
+        "regex": args.regex,
+        "highlight": args.highlight,
+        "interactive": args.interactive,
+        "buffer_size": args.buffer_size,
+        "poll": args.poll,
+        "poll_interval": args.poll_interval,
+        "max_poll_interval": args.max_poll_interval,
+        "stats_interval": args.stats_interval,
+        "stats_file": args.stats_file,
+    }
+
+
+def main():
+    """CLI entry point."""
+
+    options = _parse_args()
+    command = options.pop("command")
+    address = options.pop("address")
+    client_buffer = options.pop("client_buffer")
+    listen_address = options.pop("listen")
+    if command == "read" and listen_address is not None:
+        from livelog.remote import listen
+
+        listen(
+            listen_address,
+            level=options["level"],
+            nocolors=options["nocolors"],
+            max_lines=options["max_lines"],
+            grep=options["grep"],
+            exclude=options["exclude"],
+            regex=options["regex"],
+            highlight=options["highlight"],
+        )
+    elif command == "serve":
+        from livelog.remote import serve
+
+        serve(
+            options["file"],
+            address,
+            level=options["level"],
+            buffer_size=client_buffer,
+            poll_interval=options["poll_interval"],
+            lines=options["lines"],
+            from_end=options["from_end"],
+            since=options["since"],
+            fields=options["fields"],
+            grep=options["grep"],
+            exclude=options["exclude"],
+            regex=options["regex"],
+        )
+    elif command == "connect":
+        from livelog.remote import connect
+
+        connect(
+            address,
+            level=options["level"],
+            nocolors=options["nocolors"],
+            max_lines=options["max_lines"],
+            grep=options["grep"],
+            exclude=options["exclude"],
+            regex=options["regex"],
+            highlight=options["highlight"],
+        )
+    else:
+        start_reader(**options)
 
 
 if __name__ == "__main__":
-    file, level, nocolors = _parse_args()
-    start_reader(file=file, level=level, nocolors=nocolors)
+    main()
@@ -0,0 +1,521 @@
+# -*- coding: utf-8 -*-
+"""Benchmark suite for Logger write throughput, logging handler, timestamp
+formatting, Reader filtering and tail latency.
+
+Results are printed as JSON, to be saved and compared between runs.
+
+Usage: python -m livelog.bench [--records N] [--output results.json]
+"""
+
+from argparse import ArgumentParser
+from datetime import datetime
+from json import dumps
+from logging import DEBUG, INFO, FileHandler, Formatter, LogRecord, getLogger
+from multiprocessing import Process
+from pathlib import Path
+from platform import platform, python_version
+from statistics import median
+from tempfile import TemporaryDirectory
+from threading import Event, Thread
+from time import perf_counter, sleep
+from timeit import repeat
+from tracemalloc import get_traced_memory, start, stop
+from watchdog.observers import Observer
+from livelog import LivelogHandler, Logger
+from livelog.reader import Reader
+from livelog.timestamps import TimestampFormatter
+
+METHODS = ("error", "warn", "info", "debug")
+CONFIGURATIONS = {
+    "default": {},
+    "buffered": {"buffered": True, "flush_interval": 0},
+    "threaded": {"threaded": True, "queue_size": 1_000_000},
+}
+TAGS = ("ERR!", "WARN", "INFO", "DBUG")
+USERS = ("alice", "bob", "carol", "dave", "eve")
+
+
+class _QuietReader(Reader):
+    """Reader signaling each render instead of printing it."""
+
+    CLEAR_CMD = ""
+
+    def __init__(self, *args, **kwargs):
+        self.rendered = Event()
+        super().__init__(*args, **kwargs)
+
+    def render(self, rows):
+        self.rendered.set()
+        return ""
+
+    def render_skipped(self, count: int):
+        return ""
+
+
+def _result(name: str, value: float, unit: str, **parameters):
+    return {"name": name, "value": round(value, 3), "unit": unit, **parameters}
+
+
+def bench_methods(directory: Path, records: int):
+    """Measure records written per second for each method and configuration.
+
+    Args:
+        directory (Path): Directory of log files
+        records (int): Count of records per run
+
+    Returns:
+        list: Results
+    """
+
+    results = []
+    for configuration, options in CONFIGURATIONS.items():
+        for method in METHODS:
+            file = directory / f"{configuration}-{method}.log"
+            logger = Logger(file=file, level="DEBUG", **options)
+            log = getattr(logger, method)
+            start_time = perf_counter()
+            for i in range(records):
+                log("benchmark record %d", i)
+            logger.close()
+            elapsed = perf_counter() - start_time
+            results.append(
+                _result(
+                    "logger_throughput",
+                    records / elapsed,
+                    "records/s",
+                    method=method,
+                    configuration=configuration,
+                )
+            )
+    return results
+
+
+def bench_filtered(directory: Path, records: int):
+    """Measure cost of calls filtered out by the level.
+
+    Args:
+        directory (Path): Directory of log files
+        records (int): Count of calls
+
+    Returns:
+        list: Results
+    """
+
+    logger = Logger(file=directory / "filtered.log", level="ERROR")
+    results = []
+    for method in METHODS[1:]:
+        log = getattr(logger, method)
+        start_time = perf_counter()
+        for i in range(records):
+            log("benchmark record %d", i)
+        elapsed = perf_counter() - start_time
+        results.append(
+            _result("filtered_call", elapsed / records * 1e9, "ns/call", method=method)
+        )
+    return results
+
+
+def _write_records(file: Path, records: int, options: dict):
+    logger = Logger(file=file, **options)
+    for i in range(records):
+        logger.info("benchmark record %d", i)
+    logger.close()
+
+
+def bench_threads(directory: Path, records: int, threads: int):
+    """Measure records written per second by several threads sharing a
+    logger.
+
+    Args:
+        directory (Path): Directory of log files
+        records (int): Total count of records
+        threads (int): Count of threads
+
+    Returns:
+        list: Results
+    """
+
+    results = []
+    for configuration, options in CONFIGURATIONS.items():
+        logger = Logger(file=directory / f"threads-{configuration}.log", **options)
+
+        def write():
+            for i in range(records // threads):
+                logger.info("benchmark record %d", i)
+
+        workers = [Thread(target=write) for _ in range(threads)]
+        start_time = perf_counter()
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+        logger.close()
+        elapsed = perf_counter() - start_time
+        results.append(
+            _result(
+                "thread_contention",
+                records // threads * threads / elapsed,
+                "records/s",
+                threads=threads,
+                configuration=configuration,
+            )
+        )
+    return results
+
+
+def bench_processes(directory: Path, records: int, processes: int):
+    """Measure records written per second by several processes sharing a
+    log file.
+
+    Args:
+        directory (Path): Directory of log files
+        records (int): Total count of records
+        processes (int): Count of processes
+
+    Returns:
+        list: Results
+    """
+
+    file = directory / "processes.log"
+    workers = [
+        Process(
+            target=_write_records,
+            args=(file, records // processes, {"multiprocess": True}),
+        )
+        for _ in range(processes)
+    ]
+    start_time = perf_counter()
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    elapsed = perf_counter() - start_time
+    return [
+        _result(
+            "process_contention",
+            records // processes * processes / elapsed,
+            "records/s",
+            processes=processes,
+        )
+    ]
+
+
+def bench_latency(directory: Path, samples: int, refresh_rate: float):
+    """Measure delay between a record write and its render by a reader
+    watching the file.
+
+    Args:
+        directory (Path): Directory of log files
+        samples (int): Count of measured records
+        refresh_rate (float): Reader maximum renders per second
+
+    Returns:
+        list: Results
+    """
+
+    file = directory / "latency.log"
+    logger = Logger(file=file)
+    logger.info("start")
+    reader = _QuietReader(
+        file=file, level="DEBUG", nocolors=True, refresh_rate=refresh_rate
+    )
+    reader.start_rendering()
+    observer = Observer()
+    observer.schedule(reader, str(directory.resolve()), recursive=False)
+    observer.start()
+
+    delays = []
+    for i in range(samples):
+        reader.rendered.clear()
+        start_time = perf_counter()
+        logger.info("benchmark record %d", i)
+        if reader.rendered.wait(5):
+            delays.append((perf_counter() - start_time) * 1e3)
+        # Let the render loop throttle expire.
+        sleep(2 / refresh_rate)
+    observer.stop()
+    observer.join()
+
+    delays.sort()
+    if not delays:
+        return []
+    return [
+        _result(
+            "reader_latency",
+            value,
+            "ms",
+            statistic=statistic,
+            refresh_rate=refresh_rate,
+            lost=samples - len(delays),
+        )
+        for statistic, value in (
+            ("median", median(delays)),
+            ("p99", delays[int(len(delays) * 0.99) - 1 if len(delays) > 1 else 0]),
+            ("max", delays[-1]),
+        )
+    ]
+
+
+def bench_memory(directory: Path, records: int):
+    """Measure peak memory allocated by large bursts of records, written
+    through a threaded logger and read at once by a reader.
+
+    Args:
+        directory (Path): Directory of log files
+        records (int): Count of records in the burst
+
+    Returns:
+        list: Results
+    """
+
+    results = []
+    file = directory / "memory.log"
+    for configuration, options in CONFIGURATIONS.items():
+        start()
+        _write_records(file, records, {"erase": True, **options})
+        peak = get_traced_memory()[1]
+        stop()
+        results.append(
+            _result(
+                "logger_burst_memory",
+                peak / 1e6,
+                "MB",
+                records=records,
+                configuration=configuration,
+            )
+        )
+
+    start()
+    _QuietReader(file=file, level="DEBUG", nocolors=True, max_lines=1000)
+    peak = get_traced_memory()[1]
+    stop()
+    results.append(
+        _result(
+            "reader_burst_memory",
+            peak / 1e6,
+            "MB",
+            records=records,
+            file_bytes=file.stat().st_size,
+        )
+    )
+    return results
+
+
+def _file_handler(path: Path):
+    handler = FileHandler(path)
+    # Same line format as livelog.
+    handler.setFormatter(
+        Formatter("%(levelname).4s | %(asctime)s.%(msecs)03d - %(message)s", "%H:%M:%S")
+    )
+    return handler
+
+
+def bench_handler(directory: Path, records: int, threads: int):
+    """Measure records written per second through `LivelogHandler`, compared
+    with `logging.FileHandler` writing the same lines.
+
+    Whole logging calls are measured, including the standard library record
+    creation shared by all handlers, from one or several threads, as well as
+    handlers alone.
+
+    Args:
+        directory (Path): Directory of log files
+        records (int): Count of records per run
+        threads (int): Count of threads for contention runs
+
+    Returns:
+        list: Results
+    """
+
+    handlers = {
+        "stdlib": _file_handler,
+        "unbuffered": lambda path: LivelogHandler(path, buffered=False),
+        "buffered": LivelogHandler,
+        "threaded": lambda path: LivelogHandler(path, threaded=True),
+    }
+    # Record creation is left out of handler only runs.
+    record = LogRecord("bench", INFO, __file__, 0, "benchmark record %d", (0,), None)
+    results = []
+    for mode in ("single", "threads", "handler_only"):
+        for name, create in handlers.items():
+            handler = create(directory / f"handler-{name}.log")
+            logger = getLogger(f"livelog.bench.{name}.{mode}")
+            logger.propagate = False
+            logger.setLevel(DEBUG)
+            logger.handlers = [handler]
+
+            def write(count: int):
+                for i in range(count):
+                    logger.info("benchmark record %d", i)
+
+            count = records
+            start_time = perf_counter()
+            if mode == "single":
+                write(count)
+            elif mode == "threads":
+                count = records // threads * threads
+                workers = [
+                    Thread(target=write, args=(records // threads,))
+                    for _ in range(threads)
+                ]
+                for worker in workers:
+                    worker.start()
+                for worker in workers:
+                    worker.join()
+            else:
+                handle = handler.handle
+                for _ in range(count):
+                    handle(record)
+            handler.close()
+            elapsed = perf_counter() - start_time
+            results.append(
+                _result(
+                    "handler_throughput",
+                    count / elapsed,
+                    "records/s",
+                    handler=name,
+                    mode=mode,
+                )
+            )
+    return results
+
+
+def _strftime_timestamp():
+    return datetime.now().strftime("%H:%M:%S.%f")[:-3]
+
+
+def bench_timestamp(records: int):
+    """Measure cost of formatting a record timestamp, compared with
+    `datetime.strftime`.
+
+    Args:
+        records (int): Count of timestamps per run
+
+    Returns:
+        list: Results
+    """
+
+    formatters = {
+        "strftime": _strftime_timestamp,
+        "time_ns": TimestampFormatter(),
+        "monotonic": TimestampFormatter(clock="monotonic"),
+        "iso": TimestampFormatter(format="iso"),
+    }
+    return [
+        _result(
+            "timestamp_format",
+            min(repeat(formatter, number=records, repeat=5)) / records * 1e9,
+            "ns/record",
+            formatter=name,
+        )
+        for name, formatter in formatters.items()
+    ]
+
+
+def bench_reader_filter(directory: Path, records: int):
+    """Measure lines processed per second by the reader level filtering,
+    pattern matching and coloring.
+
+    Args:
+        directory (Path): Directory of log files
+        records (int): Count of processed lines
+
+    Returns:
+        list: Results
+    """
+
+    lines = [
+        f"{TAGS[i % 4]} | 12:00:00.000 - user {USERS[i % 5]} request {i} done\n"
+        for i in range(records)
+    ]
+    file = directory / "filter.log"
+    file.touch()
+    filters = {
+        "level": ("WARNING", {}, False),
+        "none": ("DEBUG", {}, False),
+        "grep": ("DEBUG", {"grep": ["alice"]}, False),
+        "3_greps": ("DEBUG", {"grep": ["alice", "bob", "carol"]}, False),
+        "regex_exclude": (
+            "DEBUG",
+            {"regex": [r"request \d+5 "], "exclude": ["eve"]},
+            False,
+        ),
+        "highlight": ("DEBUG", {"grep": ["alice", "bob"]}, True),
+    }
+    results = []
+    for nocolors in (True, False):
+        reader = _QuietReader(file=file, level="DEBUG", nocolors=nocolors)
+        for name, (level, patterns, highlight) in filters.items():
+            reader.set_level(level)
+            reader.set_patterns(**patterns)
+            reader.highlight = highlight
+            start_time = perf_counter()
+            shown = len(reader.process_lines(lines))
+            elapsed = perf_counter() - start_time
+            results.append(
+                _result(
+                    "reader_filter",
+                    records / elapsed,
+                    "lines/s",
+                    filter=name,
+                    colors=not nocolors,
+                    shown=shown,
+                )
+            )
+    return results
+
+
+def run(records: int, threads: int, processes: int, samples: int, refresh_rate: float):
+    """Run all benchmarks.
+
+    Args:
+        records (int): Count of records per run
+        threads (int): Count of threads for contention benchmark
+        processes (int): Count of processes for contention benchmark
+        samples (int): Count of records for latency benchmark
+        refresh_rate (float): Reader maximum renders per second
+
+    Returns:
+        dict: Environment and results
+    """
+
+    with TemporaryDirectory() as directory:
+        directory = Path(directory)
+        results = (
+            bench_methods(directory, records)
+            + bench_filtered(directory, records)
+            + bench_handler(directory, records, threads)
+            + bench_timestamp(records)
+            + bench_reader_filter(directory, records)
+            + bench_threads(directory, records, threads)
+            + bench_processes(directory, records, processes)
+            + bench_latency(directory, samples, refresh_rate)
+            + bench_memory(directory, records)
+        )
+
+    return {
+        "python": python_version(),
+        "platform": platform(),
+        "records": records,
+        "results": results,
+    }
+
+
+if __name__ == "__main__":
+    parser = ArgumentParser(description="Benchmark livelog")
+    parser.add_argument("--records", type=int, default=100_000)
+    parser.add_argument("--threads", type=int, default=8)
+    parser.add_argument("--processes", type=int, default=4)
+    parser.add_argument("--samples", type=int, default=100)
+    parser.add_argument("--refresh-rate", type=float, default=30)
+    parser.add_argument("--output", type=str, help="JSON output file, default stdout")
+    args = parser.parse_args()
+
+    report = dumps(
+        run(args.records, args.threads, args.processes, args.samples, args.refresh_rate),
+        indent=2,
+    )
+    if args.output:
+        Path(args.output).write_text(report + "\n")
+    else:
+        print(report)
@@ -0,0 +1,163 @@
+# -*- coding: utf-8 -*-
+
+from array import array
+
+
+class LineBuffer:
+    """Ring buffer of the last read lines.
+
+    Lines are stored encoded in a single bytes arena, located by arrays of
+    offsets and lengths, along with their level in a bytearray. This avoids
+    keeping one str object per line. Space of evicted lines is reclaimed when
+    it exceeds half of the arena.
+
+    Lines are addressed by their sequence number, counting all appended lines,
+    so evictions do not shift them.
+
+    Attributes:
+        NO_LEVEL (int): Level of lines read before any level tag, always
+            displayed
+        capacity (int): Maximum count of stored lines
+        total (int): Count of appended lines
+    """
+
+    NO_LEVEL = 255
+
+    def __init__(self, capacity: int):
+        """LineBuffer initialization.
+
+        Args:
+            capacity (int): Maximum count of stored lines
+        """
+
+        self.capacity = max(1, capacity)
+        self.total = 0
+        self._offsets = array("Q", bytes(8 * self.capacity))
+        self._lengths = array("L", bytes(array("L").itemsize * self.capacity))
+        self._levels = bytearray(self.capacity)
+        self._arena = bytearray()
+        # Absolute offset of the first arena byte.
+        self._base = 0
+        self._head = 0
+        self._count = 0
+
+    def __len__(self):
+        return self._count
+
+    @property
+    def first(self):
+        """Sequence number of the oldest stored line.
+
+        Returns:
+            int: Sequence number
+        """
+
+        return self.total - self._count
+
+    def append(self, level: int, line: str):
+        """Store a line, evicting the oldest one if full.
+
+        Args:
+            level (int): Line level value, `NO_LEVEL` if unknown
+            line (str): Line to be stored
+        """
+
+        data = line.encode("utf-8")
+        if self._count == self.capacity:
+            self._head = (self._head + 1) % self.capacity
+            self._count -= 1
+            self._compact()
+
+        slot = (self._head + self._count) % self.capacity
+        self._offsets[slot] = self._base + len(self._arena)
+        self._lengths[slot] = len(data)
+        self._levels[slot] = level
+        self._arena += data
+        self._count += 1
+        self.total += 1
+
+    def _compact(self):
+        """Drop evicted lines bytes once they take half of the arena."""
+
+        dead = self._offsets[self._head] - self._base
+        if dead > len(self._arena) // 2:
+            del self._arena[:dead]
+            self._base += dead
+
+    def _slot(self, sequence: int):
+        """Get ring slot of a stored line.
+
+        Args:
+            sequence (int): Line sequence number
+
+        Raises:
+            IndexError: If line is not stored anymore or yet
+
+        Returns:
+            int: Slot
+        """
+
+        position = sequence - self.first
+        if not 0 <= position < self._count:
+            raise IndexError(sequence)
+        return (self._head + position) % self.capacity
+
+    def _bounds(self, slot: int):
+        start = self._offsets[slot] - self._base
+        return start, start + self._lengths[slot]
+
+    def get(self, sequence: int):
+        """Get a stored line.
+
+        Args:
+            sequence (int): Line sequence number
+
+        Returns:
+            str: Line
+        """
+
+        start, end = self._bounds(self._slot(sequence))
+        return self._arena[start:end].decode("utf-8", "replace")
+
+    def select(self, threshold: int):
+        """Filter stored lines on their level.
+
+        Args:
+            threshold (int): Minimum level value
+
+        Returns:
+            list: Sequence numbers of lines at or above threshold, oldest first
+        """
+
+        first, head, capacity = self.first, self._head, self.capacity
+        levels = self._levels
+        return [
+            first + position
+            for position in range(self._count)
+            if levels[(head + position) % capacity] >= threshold
+        ]
+
+    def search(self, pattern, sequences: list, start: int, backward: bool = False):
+        """Search lines for a compiled bytes pattern, directly in the arena.
+
+        Args:
+            pattern (Pattern): Compiled bytes regex
+            sequences (list): Sequence numbers of searched lines
+            start (int): Position in `sequences` to start from
+            backward (bool, optional): Search toward oldest lines ? Defaults
+                to False.
+
+        Returns:
+            int: Position in `sequences` of the first matching line, None if
+                not found
+        """
+
+        if backward:
+            positions = range(min(start, len(sequences) - 1), -1, -1)
+        else:
+            positions = range(max(start, 0), len(sequences))
+        for position in positions:
+            start, end = self._bounds(self._slot(sequences[position]))
+            if pattern.search(self._arena, start, end) is not None:
+                return position
+        return None
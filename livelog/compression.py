@@ -0,0 +1,165 @@
+# -*- coding: utf-8 -*-
+
+from zlib import DEFLATED, Z_FINISH, Z_SYNC_FLUSH, compressobj, decompressobj
+from .errors import CompressionIsUnavailable
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+
+COMPRESSIONS = ("gzip", "zstd")
+MAGIC_BYTES = {
+    "gzip": b"\x1f\x8b",
+    "zstd": b"\x28\xb5\x2f\xfd",
+}
+# zlib window bits value selecting gzip header and trailer.
+_GZIP_WBITS = 31
+
+
+class Compressor:
+    """Streaming compressor.
+
+    Data compressed so far can be made decodable with `sync` without ending
+    the stream, so a partially written file stays readable.
+
+    Attributes:
+        name (str): Compression, "gzip" or "zstd"
+
+    Raises:
+        CompressionIsUnavailable: If user provide an unknown compression or
+            zstandard package is not installed
+    """
+
+    def __init__(self, name: str):
+        """Compressor initialization.
+
+        Args:
+            name (str): Compression, "gzip" or "zstd"
+        """
+
+        self.name = _verify(name)
+        if self.name == "gzip":
+            self._compressor = compressobj(6, DEFLATED, _GZIP_WBITS)
+            self._sync, self._finish = Z_SYNC_FLUSH, Z_FINISH
+        else:
+            self._compressor = zstandard.ZstdCompressor().compressobj()
+            self._sync = zstandard.COMPRESSOBJ_FLUSH_BLOCK
+            self._finish = zstandard.COMPRESSOBJ_FLUSH_FINISH
+
+    def compress(self, data: bytes):
+        """Compress data, output may be held until next sync point.
+
+        Args:
+            data (bytes): Data to be compressed
+
+        Returns:
+            bytes: Compressed data
+        """
+
+        return self._compressor.compress(data)
+
+    def sync(self):
+        """Get pending compressed data, making the stream decodable up to
+        there.
+
+        Returns:
+            bytes: Compressed data
+        """
+
+        return self._compressor.flush(self._sync)
+
+    def finish(self):
+        """End stream.
+
+        Returns:
+            bytes: Remaining compressed data and stream trailer
+        """
+
+        return self._compressor.flush(self._finish)
+
+
+class Decompressor:
+    """Streaming decompressor, fed with raw file content as it is read.
+
+    Concatenated streams, like a compressed file appended by several loggers,
+    are decompressed one after the other.
+
+    Attributes:
+        name (str): Compression, "gzip" or "zstd"
+
+    Raises:
+        CompressionIsUnavailable: If zstandard package is not installed
+    """
+
+    def __init__(self, name: str):
+        """Decompressor initialization.
+
+        Args:
+            name (str): Compression, "gzip" or "zstd"
+        """
+
+        self.name = _verify(name)
+        self._decompressor = self._create()
+
+    def _create(self):
+        if self.name == "gzip":
+            return decompressobj(_GZIP_WBITS)
+        return zstandard.ZstdDecompressor().decompressobj()
+
+    def decompress(self, data: bytes):
+        """Decompress new raw content.
+
+        Args:
+            data (bytes): Raw content following previously provided one
+
+        Returns:
+            bytes: Decompressed data, empty if more raw content is needed
+        """
+
+        output = []
+        while data:
+            output.append(self._decompressor.decompress(data))
+            if not self._decompressor.eof:
+                break
+            data = self._decompressor.unused_data
+            self._decompressor = self._create()
+        return b"".join(output)
+
+
+def detect(data: bytes):
+    """Detect compression from magic bytes.
+
+    Args:
+        data (bytes): File first bytes
+
+    Returns:
+        str: Compression, None if data is not compressed
+    """
+
+    for name, magic in MAGIC_BYTES.items():
+        if data.startswith(magic):
+            return name
+    return None
+
+
+def _verify(name: str):
+    """Verify compression availability.
+
+    Args:
+        name (str): Compression
+
+    Raises:
+        CompressionIsUnavailable: If compression is unknown or unavailable
+
+    Returns:
+        str: Lowercase compression
+    """
+
+    name = name.lower()
+    if name not in COMPRESSIONS:
+        raise CompressionIsUnavailable(name, 'choose between "gzip" and "zstd"')
+    if name == "zstd" and zstandard is None:
+        raise CompressionIsUnavailable(name, "zstandard package is not installed")
+    return name
@@ -36,3 +36,112 @@ class LogLevelDoesNotExist(Exception):
             f'Provided log level ("{level}") does not exist. Choose between '
             '"ERROR", "WARNING", "INFO" and "DEBUG".'
         )
+
+
+class OverflowPolicyDoesNotExist(Exception):
+    """Raised when user provided queue overflow policy does not exist."""
+
+    def __init__(self, policy):
+        super().__init__(
+            f'Provided overflow policy ("{policy}") does not exist. Choose between '
+            '"block", "drop_oldest" and "drop_newest".'
+        )
+
+
+class ClockDoesNotExist(Exception):
+    """Raised when user provided timestamp clock does not exist."""
+
+    def __init__(self, clock):
+        super().__init__(
+            f'Provided clock ("{clock}") does not exist. Choose between '
+            '"time_ns" and "monotonic".'
+        )
+
+
+class TimestampFormatDoesNotExist(Exception):
+    """Raised when user provided timestamp format does not exist."""
+
+    def __init__(self, format):
+        super().__init__(
+            f'Provided timestamp format ("{format}") does not exist. Choose between '
+            '"time" and "iso".'
+        )
+
+
+class TimeFormatIsInvalid(Exception):
+    """Raised when user provided time does not match HH:MM:SS format."""
+
+    def __init__(self, time):
+        super().__init__(
+            f'Provided time ("{time}") is invalid. Expected format is '
+            '"HH:MM:SS" or "HH:MM:SS.mmm".'
+        )
+
+
+class LogFormatDoesNotExist(Exception):
+    """Raised when user provided log format does not exist."""
+
+    def __init__(self, format):
+        super().__init__(
+            f'Provided log format ("{format}") does not exist. Choose between '
+            '"text", "json" and "binary".'
+        )
+
+
+class PatternIsInvalid(Exception):
+    """Raised when user provided filtering pattern is not a valid regex."""
+
+    def __init__(self, pattern):
+        super().__init__(f'Provided pattern ("{pattern}") is not a valid regex.')
+
+
+class StatsAreDisabled(Exception):
+    """Raised when stats are requested from an instance created without them."""
+
+    def __init__(self):
+        super().__init__("Stats are disabled, enable them with stats=True.")
+
+
+class RateLimitKeyDoesNotExist(Exception):
+    """Raised when user provided rate limit key does not exist."""
+
+    def __init__(self, key):
+        super().__init__(
+            f'Provided rate limit key ("{key}") does not exist. Choose between '
+            '"message" and "call_site".'
+        )
+
+
+class CompressionIsUnavailable(Exception):
+    """Raised when user provided compression does not exist or cannot be
+    used.
+    """
+
+    def __init__(self, compression, reason):
+        super().__init__(
+            f'Provided compression ("{compression}") is unavailable, {reason}.'
+        )
+
+
+class AddressIsInvalid(Exception):
+    """Raised when user provided address is neither a host:port pair nor a
+    Unix socket path.
+    """
+
+    def __init__(self, address):
+        super().__init__(
+            f'Provided address ("{address}") is invalid. Use HOST:PORT or a Unix '
+            "socket path."
+        )
+
+
+class AddressIsInUse(Exception):
+    """Raised when user provided Unix socket path to listen on is an existing
+    file or the socket of another reader.
+    """
+
+    def __init__(self, address):
+        super().__init__(
+            f'Provided address ("{address}") is already in use by another file or '
+            "reader."
+        )
@@ -0,0 +1,188 @@
+# -*- coding: utf-8 -*-
+
+from struct import Struct
+
+try:
+    from orjson import dumps as _dumps, loads
+
+    def dumps(record: dict):
+        return _dumps(record, default=str)
+
+except ImportError:
+    from json import dumps as _dumps, loads
+
+    def dumps(record: dict):
+        return _dumps(
+            record, ensure_ascii=False, separators=(",", ":"), default=str
+        ).encode("utf-8")
+
+
+FORMATS = ("text", "json", "binary")
+TAG_TO_LEVEL = {
+    "ERR!": "ERROR",
+    "WARN": "WARNING",
+    "INFO": "INFO",
+    "DBUG": "DEBUG",
+}
+LEVEL_TO_TAG = {level: tag for tag, level in TAG_TO_LEVEL.items()}
+
+# Binary records: marker, level code, epoch timestamp in nanoseconds and
+# payload length, followed by the UTF-8 payload.
+RECORD_MARKER = b"\x1e"
+RECORD_HEADER = Struct("<cBqI")
+TAG_TO_CODE = {
+    "DBUG": 0,
+    "INFO": 1,
+    "WARN": 2,
+    "ERR!": 3,
+}
+CODE_TO_TAG = {code: tag for tag, code in TAG_TO_CODE.items()}
+# Sidecar index entries: epoch timestamp in nanoseconds and record offset.
+INDEX_ENTRY = Struct("<qQ")
+
+
+def format_fields(fields: dict):
+    """Format record fields for text output.
+
+    Args:
+        fields (dict): Record fields
+
+    Returns:
+        str: Space separated key=value pairs, with a leading space
+    """
+
+    return "".join(f" {key}={value}" for key, value in fields.items())
+
+
+def format_json_value(value):
+    """Format a JSON record field value for text output, as it is written in
+    JSON except for strings which are left unquoted.
+
+    Args:
+        value: Parsed field value
+
+    Returns:
+        str: Field text
+    """
+
+    if isinstance(value, str):
+        return value
+    return dumps(value).decode("utf-8")
+
+
+def format_json(tag: str, timestamp: int, message: str, fields: dict):
+    """Serialize a record to a JSON line, using orjson if available.
+
+    Fields named like record keys are ignored.
+
+    Args:
+        tag (str): Log level tag
+        timestamp (int): Epoch timestamp in nanoseconds
+        message (str): Log message
+        fields (dict): Additional record fields
+
+    Returns:
+        bytes: JSON line
+    """
+
+    record = {
+        **fields,
+        "level": TAG_TO_LEVEL[tag],
+        "timestamp": timestamp / 1e9,
+        "message": message,
+    }
+    return dumps(record) + b"\n"
+
+
+def parse_json(line: str):
+    """Parse a JSON line record.
+
+    Args:
+        line (str): JSON line
+
+    Returns:
+        tuple: Log level tag, epoch timestamp in nanoseconds, message and
+            additional fields, None if line is not a valid record
+    """
+
+    try:
+        record = loads(line)
+        tag = LEVEL_TO_TAG[record.pop("level")]
+        timestamp = int(record.pop("timestamp") * 1e9)
+        message = record.pop("message")
+    except (ValueError, KeyError, TypeError, AttributeError):
+        return None
+
+    return tag, timestamp, message, record
+
+
+def format_binary(tag: str, timestamp: int, message: str, fields: dict):
+    """Serialize a record to the binary format.
+
+    Args:
+        tag (str): Log level tag
+        timestamp (int): Epoch timestamp in nanoseconds
+        message (str): Log message
+        fields (dict): Additional record fields
+
+    Returns:
+        bytes: Binary record
+    """
+
+    payload = f"{message}{format_fields(fields)}".encode("utf-8")
+    header = RECORD_HEADER.pack(
+        RECORD_MARKER, TAG_TO_CODE[tag], timestamp, len(payload)
+    )
+    return header + payload
+
+
+def parse_binary(data: bytes):
+    """Parse complete binary records from given data. Invalid bytes are
+    skipped up to the next record marker.
+
+    Args:
+        data (bytes): Binary records
+
+    Returns:
+        tuple: List of records as log level tag, epoch timestamp in nanoseconds
+            and payload bytes, and count of consumed bytes
+    """
+
+    records = []
+    position = 0
+    size = len(data)
+    header_size = RECORD_HEADER.size
+    while position + header_size <= size:
+        marker, code, timestamp, length = RECORD_HEADER.unpack_from(data, position)
+        if marker != RECORD_MARKER or code not in CODE_TO_TAG:
+            position = data.find(RECORD_MARKER, position + 1)
+            if position < 0:
+                return records, size
+            continue
+        end = position + header_size + length
+        if end > size:
+            break
+        records.append((CODE_TO_TAG[code], timestamp, data[end - length : end]))
+        position = end
+
+    return records, position
+
+
+def read_index(path: str):
+    """Read a binary log sidecar index.
+
+    Args:
+        path (str): Index file path
+
+    Returns:
+        list: Entries as epoch timestamp in nanoseconds and record offset
+    """
+
+    try:
+        with open(path, "rb") as f:
+            data = f.read()
+    except FileNotFoundError:
+        return []
+
+    end = len(data) - len(data) % INDEX_ENTRY.size
+    return list(INDEX_ENTRY.iter_unpack(data[:end]))
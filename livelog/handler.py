@@ -0,0 +1,107 @@
+# -*- coding: utf-8 -*-
+
+from logging import Formatter, Handler, NOTSET, ERROR, WARNING, INFO
+from .logger import Logger
+
+_EXCEPTION_FORMATTER = Formatter()
+
+
+class LivelogHandler(Handler):
+    """Standard library `logging` handler writing records in livelog format,
+    to be followed with livelog reader.
+
+    Records are formatted once in `emit` and written through a livelog
+    `Logger`, buffered by default. As livelog writers are thread-safe, the
+    handler lock is not taken for each record.
+
+    Standard library levels are mapped to the closest livelog level: ERROR
+    and above to "ERR!", WARNING to "WARN", INFO to "INFO" and below to
+    "DBUG".
+
+    Attributes:
+        logger (Logger): Underlying livelog logger
+    """
+
+    def __init__(self, file: str = None, level: int = NOTSET, **options):
+        """LivelogHandler initialization.
+
+        Args:
+            file (str, optional): Output file path. Defaults to None.
+            level (int, optional): Minimum standard library level. Defaults
+                to NOTSET.
+            **options: Other `Logger` options, `buffered` defaults to True
+        """
+
+        super().__init__(level=level)
+        options.setdefault("buffered", True)
+        self.logger = Logger(file=file, **options)
+
+    @staticmethod
+    def _tag(levelno: int):
+        """Get livelog level tag of a standard library level.
+
+        Args:
+            levelno (int): Standard library level
+
+        Returns:
+            str: Level tag
+        """
+
+        if levelno >= ERROR:
+            return "ERR!"
+        if levelno >= WARNING:
+            return "WARN"
+        if levelno >= INFO:
+            return "INFO"
+        return "DBUG"
+
+    def handle(self, record):
+        """Filter and emit a record, without taking the handler lock.
+
+        Args:
+            record (LogRecord): Standard library record
+
+        Returns:
+            bool: Record passed filters
+        """
+
+        passed = self.filter(record)
+        if passed:
+            self.emit(record)
+        return passed
+
+    def emit(self, record):
+        """Format and write a record. Exception and stack information are
+        appended as continuation lines.
+
+        Args:
+            record (LogRecord): Standard library record
+        """
+
+        try:
+            if self.formatter is not None:
+                message = self.formatter.format(record)
+            else:
+                message = record.getMessage()
+                if record.exc_info and not record.exc_text:
+                    record.exc_text = _EXCEPTION_FORMATTER.formatException(
+                        record.exc_info
+                    )
+                if record.exc_text:
+                    message = f"{message}\n{record.exc_text}"
+                if record.stack_info:
+                    message = f"{message}\n{record.stack_info}"
+            self.logger._write(level=self._tag(record.levelno), content=message)
+        except Exception:
+            self.handleError(record)
+
+    def flush(self):
+        """Write pending records to log file."""
+
+        self.logger.flush()
+
+    def close(self):
+        """Write pending records and release log file."""
+
+        self.logger.close()
+        super().close()
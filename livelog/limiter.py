@@ -0,0 +1,65 @@
+# -*- coding: utf-8 -*-
+
+from collections import OrderedDict
+from threading import Lock
+from time import monotonic
+
+
+class RateLimiter:
+    """Token bucket rate limiter keeping one bucket per key.
+
+    Each bucket holds up to `burst` tokens and is refilled with `rate` tokens
+    per second, a message consuming a token. Buckets are kept in a bounded
+    LRU, least recently used keys being forgotten, so memory stays flat
+    whatever the count of distinct keys.
+
+    Attributes:
+        rate (float): Tokens added to each bucket per second
+        burst (int): Maximum tokens in a bucket
+        max_keys (int): Maximum count of tracked keys
+    """
+
+    def __init__(self, rate: float, burst: int = 10, max_keys: int = 10000):
+        """RateLimiter initialization.
+
+        Args:
+            rate (float): Allowed messages per second per key
+            burst (int, optional): Messages allowed at once. Defaults to 10.
+            max_keys (int, optional): Maximum tracked keys. Defaults to 10000.
+        """
+
+        self.rate = rate
+        self.burst = max(1, burst)
+        self.max_keys = max_keys
+        # Key to tokens count and last refill time.
+        self._buckets = OrderedDict()
+        self._lock = Lock()
+
+    def allow(self, key):
+        """Consume a token of a key bucket.
+
+        Args:
+            key (Hashable): Rate limited key
+
+        Returns:
+            bool: Message is allowed
+        """
+
+        now = monotonic()
+        buckets = self._buckets
+        with self._lock:
+            bucket = buckets.get(key)
+            if bucket is None:
+                tokens = self.burst
+                if len(buckets) >= self.max_keys:
+                    buckets.popitem(last=False)
+            else:
+                tokens, last = bucket
+                tokens = min(self.burst, tokens + (now - last) * self.rate)
+                buckets.move_to_end(key)
+
+            if tokens < 1:
+                buckets[key] = (tokens, now)
+                return False
+            buckets[key] = (tokens - 1, now)
+            return True
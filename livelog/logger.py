@@ -1,11 +1,45 @@
 # -*- coding: utf-8 -*-
 
 from os import access, X_OK
+from asyncio import Queue, QueueFull, get_event_loop, iscoroutinefunction
+from atexit import register
+from time import perf_counter_ns
+from threading import Lock
 from pathlib import Path
 from platform import system
+from random import random
+from sys import _getframe
 from tempfile import gettempdir
-from datetime import datetime
+from weakref import WeakSet
 from .errors import *
+from .timestamps import TimestampFormatter
+from .formats import FORMATS, TAG_TO_LEVEL, format_binary, format_fields, format_json
+from .compression import Compressor
+from .limiter import RateLimiter
+from .stats import StatsDumper
+from .writers import (
+    FileWriter,
+    BufferedWriter,
+    CompressedWriter,
+    ThreadedWriter,
+    AtomicWriter,
+    RotatingWriter,
+    IndexWriter,
+    SocketWriter,
+)
+
+# Loggers holding records not handed to their writer yet.
+_pending_loggers = WeakSet()
+
+
+@register
+def _write_pending_records():
+    """Hand records still held by loggers to their writer at interpreter
+    shutdown. Registered after writers exit hook, so it runs before it.
+    """
+
+    for logger in list(_pending_loggers):
+        logger._write_pending()
 
 
 class Logger:
@@ -13,13 +47,33 @@ class Logger:
 
     Attributes:
         LEVELS (dict): Log levels value for fast filtering
+        METHODS (dict): Logging methods and their log level
         enabled (bool): If logging is enabled
         erase (bool): If preexisting file should be erased
         file (str): Log file path
         level (str): Minimum log level to be displayed
+        buffered (bool): If log file should be kept open and writes buffered
+        threaded (bool): If records should be written by a background thread
+        multiprocess (bool): If log file is shared with other processes
+        clock (str): Clock used for records timestamp
+        timestamp_format (str): Records timestamp format
+        format (str): Records format, "text", "json" or "binary"
+        max_bytes (int): Log file size triggering a rotation
+        rotate_interval (float): Seconds between log file rotations
+        compression (str): Log file streaming compression, None for plain
+            file
+        socket (str): Address of a listening reader records are sent to
+        dropped (int): Count of records dropped by a full queue
 
     Raises:
         LogLevelDoesNotExist: If user provide an unknown log level
+        OverflowPolicyDoesNotExist: If user provide an unknown overflow policy
+        ClockDoesNotExist: If user provide an unknown clock
+        TimestampFormatDoesNotExist: If user provide an unknown timestamp format
+        LogFormatDoesNotExist: If user provide an unknown log format
+        CompressionIsUnavailable: If user provide an unknown compression,
+            zstd without zstandard package or compression in multiprocess mode
+        AddressIsInvalid: If user provide an invalid socket address
         LogFileIsADirectory: If user provide a directory as output path
         LogPathDoesNotExist: If user provide a non existing output path
         LogPathInsufficientPermissions: If user does not have permissions to
@@ -32,6 +86,12 @@ class Logger:
         "INFO": 1,
         "DEBUG": 0,
     }
+    _METHODS = {
+        "error": "ERROR",
+        "warn": "WARNING",
+        "info": "INFO",
+        "debug": "DEBUG",
+    }
 
     def __init__(
         self,
@@ -39,6 +99,31 @@ class Logger:
         level: str = "DEBUG",
         enabled: bool = True,
         erase: bool = True,
+        buffered: bool = False,
+        buffer_size: int = 8192,
+        flush_interval: float = 1.0,
+        threaded: bool = False,
+        queue_size: int = 10000,
+        overflow: str = "block",
+        multiprocess: bool = False,
+        clock: str = "time_ns",
+        timestamp_format: str = "time",
+        format: str = "text",
+        max_bytes: int = 0,
+        rotate_interval: float = 0,
+        backup_count: int = 5,
+        compress_rotated: bool = False,
+        compression: str = None,
+        socket: str = None,
+        stats: bool = False,
+        stats_interval: float = 0,
+        stats_file: str = None,
+        rate_limit: float = 0,
+        rate_burst: int = 10,
+        rate_key: str = "message",
+        max_keys: int = 10000,
+        sample_rate: float = 1.0,
+        collapse_duplicates: bool = False,
     ):
         """Logger initialization.
 
@@ -47,10 +132,87 @@ class Logger:
             level (str, optional): Minimum log level. Defaults to "DEBUG".
             enabled (bool, optional): Is log enabled ? Defaults to True.
             erase (bool, optional): Should preexisting file be erased ? Defaults to True.
+            buffered (bool, optional): Keep file open and buffer writes ? Defaults to False.
+            buffer_size (int, optional): Buffered bytes count triggering a
+                write. Defaults to 8192.
+            flush_interval (float, optional): Maximum delay in seconds before
+                buffered records are written. Defaults to 1.0.
+            threaded (bool, optional): Write from a background thread ? Defaults to False.
+            queue_size (int, optional): Maximum count of records waiting for
+                the background thread. Defaults to 10000.
+            overflow (str, optional): Behavior when queue is full, "block",
+                "drop_oldest" or "drop_newest". Defaults to "block".
+            multiprocess (bool, optional): Is log file shared with other
+                processes ? Only the first one erases the file. Defaults to False.
+            clock (str, optional): Timestamp clock, "time_ns" for system time or
+                "monotonic" to be immune to system time changes. Defaults to "time_ns".
+            timestamp_format (str, optional): Timestamp format, "time" for
+                HH:MM:SS.mmm or "iso" for full ISO 8601 date. Defaults to "time".
+            format (str, optional): Records format, "text", "json" for JSON
+                lines or "binary" for length-prefixed records with a sidecar
+                index. Defaults to "text".
+            max_bytes (int, optional): Rotate log file before it exceeds this
+                size, 0 to disable. Defaults to 0.
+            rotate_interval (float, optional): Rotate log file every given
+                seconds, 0 to disable. Defaults to 0.
+            backup_count (int, optional): Count of rotated files kept. Defaults to 5.
+            compress_rotated (bool, optional): Gzip rotated files ? Defaults to False.
+            compression (str, optional): Write log file through a streaming
+                compressor, "gzip" or "zstd", None for plain text. Buffered
+                records are compressed at each flush. Defaults to None.
+            socket (str, optional): Send records as datagrams to a reader
+                listening on this Unix socket path or UDP HOST:PORT, writing
+                them to the log file only when they cannot be sent. Defaults
+                to None.
+            stats (bool, optional): Count records, bytes and time spent
+                writing, see `stats()` ? Defaults to False.
+            stats_interval (float, optional): Dump stats every given seconds,
+                0 to disable. Defaults to 0.
+            stats_file (str, optional): Stats dump file path, None for
+                stderr. Defaults to None.
+            rate_limit (float, optional): Maximum warning, info and debug
+                messages per second for each key, 0 to disable. Defaults to 0.
+            rate_burst (int, optional): Messages allowed at once for each key
+                before rate limiting applies. Defaults to 10.
+            rate_key (str, optional): Rate limiting key, "message" for the
+                message before formatting, lazy messages being keyed by their
+                code, or "call_site" for the calling line. Defaults to
+                "message".
+            max_keys (int, optional): Maximum count of rate limited keys
+                tracked at once. Defaults to 10000.
+            sample_rate (float, optional): Probability of info and debug
+                messages to be written. Defaults to 1.0.
+            collapse_duplicates (bool, optional): Replace consecutive
+                identical messages with a "last message repeated N times"
+                line ? Defaults to False.
         """
 
         self._enabled = enabled
         self._erase = erase
+        self._buffered = buffered
+        self._buffer_size = buffer_size
+        self._flush_interval = flush_interval
+        self._threaded = threaded
+        self._queue_size = queue_size
+        self._overflow = overflow
+        self._multiprocess = multiprocess
+        self._timestamp = TimestampFormatter(clock=clock, format=timestamp_format)
+        format = format.lower()
+        if format not in FORMATS:
+            raise LogFormatDoesNotExist(format)
+        self._format_name = format
+        self._max_bytes = max_bytes
+        self._rotate_interval = rotate_interval
+        self._backup_count = backup_count
+        self._compress_rotated = compress_rotated
+        self._compression = None
+        if compression is not None:
+            if multiprocess:
+                raise CompressionIsUnavailable(
+                    compression, "processes cannot share a compressed stream"
+                )
+            self._compression = Compressor(compression).name
+        self._socket = socket
 
         if file is None:
             self._file = Path(
@@ -67,6 +229,35 @@ class Logger:
         if level not in self._LEVELS:
             raise LogLevelDoesNotExist(level)
         self._level = level
+        self._threshold = self._LEVELS[level]
+        rate_key = rate_key.lower()
+        if rate_key not in ("message", "call_site"):
+            raise RateLimitKeyDoesNotExist(rate_key)
+        self._rate_key = rate_key
+        self._limiter = None
+        if rate_limit:
+            self._limiter = RateLimiter(rate_limit, rate_burst, max_keys)
+        self._sample_rate = sample_rate
+        self._suppressed = 0
+        self._flush_repeats = None
+        if collapse_duplicates:
+            self._enable_collapse()
+        self._stats = None
+        if stats:
+            self._enable_stats()
+        self._update_methods()
+
+        self._writer = self._create_writer()
+        self._stats_dumper = None
+        if stats and stats_interval > 0:
+            self._stats_dumper = StatsDumper(self.stats, stats_interval, stats_file)
+            self._stats_dumper.start()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
 
     @property
     def file(self):
@@ -77,6 +268,12 @@ class Logger:
         path = Path(value)
         self._verify_file()
         self._file = path
+        self._writer.close()
+        self._writer = self._create_writer()
+
+    @property
+    def dropped(self):
+        return self._writer.dropped
 
     @property
     def level(self):
@@ -88,6 +285,8 @@ class Logger:
         if level not in self._LEVELS:
             raise LogLevelDoesNotExist(level)
         self._level = level
+        self._threshold = self._LEVELS[level]
+        self._update_methods()
 
     @property
     def enabled(self):
@@ -96,6 +295,7 @@ class Logger:
     @enabled.setter
     def enabled(self, value: bool):
         self._enabled = value
+        self._update_methods()
 
     def _verify_file(self):
         """Verify if provided file path is a valid log file and clear its
@@ -114,29 +314,230 @@ class Logger:
             raise LogPathInsufficientPermissions(path=dir)
         self._clear_file()
 
+    def _create_writer(self):
+        """Create the writer matching logger configuration.
+
+        Returns:
+            FileWriter: Log file writer
+        """
+
+        if self._multiprocess:
+            writer = AtomicWriter(
+                self._file, erase=self._erase, text=self._format_name != "binary"
+            )
+        elif self._compression:
+            # Unbuffered loggers make each record a sync point.
+            buffered = self._buffered or self._threaded
+            writer = CompressedWriter(
+                self._file,
+                compression=self._compression,
+                buffer_size=self._buffer_size if buffered else 0,
+                flush_interval=0 if self._threaded else self._flush_interval,
+            )
+        elif self._threaded:
+            writer = BufferedWriter(
+                self._file, buffer_size=self._buffer_size, flush_interval=0
+            )
+        elif self._buffered:
+            writer = BufferedWriter(
+                self._file,
+                buffer_size=self._buffer_size,
+                flush_interval=self._flush_interval,
+            )
+        else:
+            writer = FileWriter(self._file)
+
+        # Index offsets would not account for other processes writes, nor for
+        # compression.
+        if (
+            self._format_name == "binary"
+            and not self._multiprocess
+            and not self._compression
+        ):
+            writer = IndexWriter(self._file, target=writer)
+        if self._max_bytes or self._rotate_interval:
+            writer = RotatingWriter(
+                self._file,
+                target=writer,
+                max_bytes=self._max_bytes,
+                interval=self._rotate_interval,
+                backup_count=self._backup_count,
+                compress=self._compress_rotated and not self._compression,
+            )
+        if self._socket is not None:
+            writer = SocketWriter(self._file, address=self._socket, target=writer)
+        if self._threaded:
+            writer = ThreadedWriter(
+                self._file,
+                target=writer,
+                queue_size=self._queue_size,
+                overflow=self._overflow,
+            )
+        return writer
+
+    def flush(self):
+        """Write pending records to log file."""
+
+        if self._flush_repeats is not None:
+            self._flush_repeats()
+        self._writer.flush()
+
+    def close(self):
+        """Write pending records and release log file."""
+
+        if self._flush_repeats is not None:
+            self._flush_repeats()
+        self._writer.close()
+        self._stop_stats()
+
+    def stats(self):
+        """Get logger counters.
+
+        Raises:
+            StatsAreDisabled: If logger has been created without stats
+
+        Returns:
+            dict: Records written and filtered out per level, bytes written,
+                seconds spent in `_write`, buffer flushes, dropped records and
+                records suppressed by rate limiting or sampling
+        """
+
+        if self._stats is None:
+            raise StatsAreDisabled()
+        return {
+            "written": dict(self._stats["written"]),
+            "filtered": dict(self._stats["filtered"]),
+            "bytes": self._stats["bytes"],
+            "write_time": self._stats["write_ns"] / 1e9,
+            "flushes": self._writer.flushes,
+            "dropped": self.dropped,
+            "suppressed": self._suppressed,
+        }
+
+    def _enable_stats(self):
+        """Wrap record formatting and writing with counters. Loggers created
+        without stats run unwrapped methods.
+        """
+
+        stats = self._stats = {
+            "written": dict.fromkeys(self._LEVELS, 0),
+            "filtered": dict.fromkeys(self._LEVELS, 0),
+            "bytes": 0,
+            "write_ns": 0,
+        }
+        written = stats["written"]
+        format, write = self._format, self._write
+
+        def counted_format(level: str, content: str, fields: dict = None):
+            record = format(level=level, content=content, fields=fields)
+            written[TAG_TO_LEVEL[level]] += 1
+            stats["bytes"] += len(record)
+            return record
+
+        def timed_write(level: str, content: str, fields: dict = None):
+            start = perf_counter_ns()
+            write(level=level, content=content, fields=fields)
+            stats["write_ns"] += perf_counter_ns() - start
+
+        self._format = counted_format
+        self._write = timed_write
+
+    def _enable_collapse(self):
+        """Wrap record writing to count consecutive identical records
+        instead of writing them, a "last message repeated N times" record
+        being written before the next different one or on flush.
+        """
+
+        write = self._write
+        lock = Lock()
+        # Last written record and count of its repetitions.
+        state = [None, 0]
+
+        def flush_repeats():
+            with lock:
+                if state[1]:
+                    write(
+                        level=state[0][0],
+                        content=f"last message repeated {state[1]} times",
+                    )
+                    state[1] = 0
+
+        def collapsed_write(level: str, content: str, fields: dict = None):
+            record = (level, content, fields or None)
+            with lock:
+                if record == state[0]:
+                    state[1] += 1
+                    return
+                if state[1]:
+                    write(
+                        level=state[0][0],
+                        content=f"last message repeated {state[1]} times",
+                    )
+                    state[1] = 0
+                state[0] = record
+                write(level=level, content=content, fields=fields)
+
+        self._write = collapsed_write
+        self._flush_repeats = flush_repeats
+        _pending_loggers.add(self)
+
+    def _write_pending(self):
+        """Write pending repetitions record, at interpreter shutdown."""
+
+        if self._flush_repeats is not None:
+            self._flush_repeats()
+
+    def _stop_stats(self):
+        """Stop periodic stats dump, dumping final stats."""
+
+        if self._stats_dumper is not None:
+            self._stats_dumper.stop()
+            self._stats_dumper = None
+
     def _clear_file(self):
-        """Clear output file content."""
+        """Clear output file content. In multiprocess mode, the writer takes
+        care of it.
+        """
 
-        if not self._erase or not self._file.is_file():
+        if not self._erase or self._multiprocess or not self._file.is_file():
             return
         with open(self._file, "w") as f:
             pass
 
-    def _write(self, level: str, content: str):
+    def _write(self, level: str, content: str, fields: dict = None):
         """Write provided content to output file.
 
         Args:
             level (str); Log level
             content (str): Content to be written
+            fields (dict, optional): Additional record fields. Defaults to None.
         """
 
         if not self._enabled:
             return
 
-        time = datetime.now().strftime("%H:%M:%S.%f")[:-3]
+        self._writer.write(self._format(level=level, content=content, fields=fields))
+
+    def _format(self, level: str, content: str, fields: dict = None):
+        """Format a log record.
+
+        Args:
+            level (str); Log level
+            content (str): Record content
+            fields (dict, optional): Additional record fields. Defaults to None.
+
+        Returns:
+            bytes: Formatted record
+        """
 
-        with open(self._file, "a") as f:
-            f.write(f"{level} | {time} - {content}\n")
+        if self._format_name == "json":
+            return format_json(level, self._timestamp.clock(), content, fields or {})
+        if self._format_name == "binary":
+            return format_binary(level, self._timestamp.clock(), content, fields or {})
+        if fields:
+            content = f"{content}{format_fields(fields)}"
+
+        return f"{level} | {self._timestamp()} - {content}\n".encode("utf-8")
 
     def _is_valid_level(self, level: str):
         """Verify if the given log level should be written.
@@ -148,59 +549,476 @@ class Logger:
             bool: Level is valid
         """
 
-        return self._LEVELS[self._level] <= self._LEVELS[level]
+        return self._threshold <= self._LEVELS[level]
+
+    def _update_methods(self):
+        """Replace logging methods filtered out by current level, or all of
+        them if logging is disabled, with a no-op so filtered calls cost
+        nothing.
+        """
+
+        for method, level in self._METHODS.items():
+            if self._enabled and self._is_valid_level(level):
+                if self._is_limited(level):
+                    self.__dict__[method] = self._limited_method(method, level)
+                else:
+                    self.__dict__.pop(method, None)
+            elif self._stats is None:
+                self.__dict__[method] = self._disabled_method(method)
+            else:
+                self.__dict__[method] = self._counted_method(method, level)
+
+    def _disabled_method(self, method: str):
+        """Get the no-op replacing a filtered out logging method.
+
+        Args:
+            method (str): Logging method name
+
+        Returns:
+            function: No-op function
+        """
+
+        return _disabled
+
+    def _is_limited(self, level: str):
+        """Check if messages of a level are rate limited or sampled.
+
+        Args:
+            level (str): Log level
+
+        Returns:
+            bool: Level is limited
+        """
+
+        if level == "ERROR":
+            return False
+        return self._limiter is not None or (
+            self._sample_rate < 1 and level in ("INFO", "DEBUG")
+        )
+
+    def _limited_method(self, method: str, level: str):
+        """Get a logging method applying sampling and rate limiting before
+        any message formatting.
+
+        Args:
+            method (str): Logging method name
+            level (str): Logging method level
+
+        Returns:
+            function: Limited logging method
+        """
+
+        original = getattr(type(self), method)
+        limiter = self._limiter
+        sample_rate = self._sample_rate if level in ("INFO", "DEBUG") else 1
+        call_site = self._rate_key == "call_site"
+
+        def allow(message):
+            if sample_rate < 1 and random() >= sample_rate:
+                self._suppressed += 1
+                return False
+            if limiter is None:
+                return True
+            code = getattr(message, "__code__", None)
+            if call_site or (code is None and callable(message)):
+                frame = _getframe(2)
+                key = (level, frame.f_code, frame.f_lineno)
+            elif code is not None:
+                # Inline lazy messages are new functions at every call.
+                key = (level, code)
+            else:
+                key = (level, message)
+            if limiter.allow(key):
+                return True
+            self._suppressed += 1
+            return False
+
+        if iscoroutinefunction(original):
+
+            async def limited(message, *args, **fields):
+                if allow(message):
+                    await original(self, message, *args, **fields)
+
+        else:
+
+            def limited(message, *args, **fields):
+                if allow(message):
+                    original(self, message, *args, **fields)
+
+        return limited
+
+    def _counted_method(self, method: str, level: str):
+        """Get the no-op replacing a filtered out logging method, counting
+        calls when stats are enabled.
+
+        Args:
+            method (str): Logging method name
+            level (str): Logging method level
+
+        Returns:
+            function: No-op function
+        """
+
+        filtered = self._stats["filtered"]
+        if iscoroutinefunction(self._disabled_method(method)):
+
+            async def counted(*args, **kwargs):
+                filtered[level] += 1
+
+        else:
+
+            def counted(*args, **kwargs):
+                filtered[level] += 1
+
+        return counted
+
+    @staticmethod
+    def _render(message, args: tuple):
+        """Render a lazy log message.
+
+        Args:
+            message (str): Log message, or callable returning it
+            args (tuple): Arguments merged into message with % operator
+
+        Returns:
+            str: Rendered message
+        """
+
+        if callable(message):
+            message = message()
+        if args:
+            message = message % args
+        return message
 
-    def error(self, message: str):
+    def error(self, message: str, *args, **fields):
         """Write error message.
 
         Args:
-            message (str): Log message
+            message (str): Log message, or callable returning it
+            *args: Arguments merged into message with % operator
+            **fields: Additional record fields
         """
 
-        self._write(level="ERR!", content=message)
+        self._write(level="ERR!", content=self._render(message, args), fields=fields)
 
-    def warn(self, message: str):
+    def warn(self, message: str, *args, **fields):
         """Write warning message.
 
         Args:
-            message (str): Log message
+            message (str): Log message, or callable returning it
+            *args: Arguments merged into message with % operator
+            **fields: Additional record fields
         """
 
-        if not self._is_valid_level("WARNING"):
-            return
-        self._write(level="WARN", content=message)
+        self._write(level="WARN", content=self._render(message, args), fields=fields)
 
-    def info(self, message: str):
+    def info(self, message: str, *args, **fields):
         """Write info message.
 
         Args:
-            message (str): Log message
+            message (str): Log message, or callable returning it
+            *args: Arguments merged into message with % operator
+            **fields: Additional record fields
         """
 
-        if not self._is_valid_level("INFO"):
-            return
-        self._write(level="INFO", content=message)
+        self._write(level="INFO", content=self._render(message, args), fields=fields)
 
-    def debug(self, message: str):
+    def debug(self, message: str, *args, **fields):
         """Write debug message.
 
         Args:
-            message (str): Log message
+            message (str): Log message, or callable returning it
+            *args: Arguments merged into message with % operator
+            **fields: Additional record fields
         """
 
-        if not self._is_valid_level("DEBUG"):
-            return
-        self._write(level="DBUG", content=message)
+        self._write(level="DBUG", content=self._render(message, args), fields=fields)
+
+
+def _disabled(*args, **kwargs):
+    """Replacement for filtered out logging methods."""
+
+
+async def _disabled_async(*args, **kwargs):
+    """Replacement for filtered out asynchronous logging methods."""
 
 
 class Singleton(type):
     _instances = {}
+    _lock = Lock()
 
     def __call__(cls, *args, **kwargs):
-        if cls not in cls._instances:
-            cls._instances[cls] = super(Singleton, cls).__call__(*args, **kwargs)
-        return cls._instances[cls]
+        # Instance lookup is lock free once created, creation is serialized so
+        # a second instance never erases the log file.
+        instance = cls._instances.get(cls)
+        if instance is None:
+            with Singleton._lock:
+                instance = cls._instances.get(cls)
+                if instance is None:
+                    instance = super(Singleton, cls).__call__(*args, **kwargs)
+                    cls._instances[cls] = instance
+        return instance
 
 
 class LoggerSingleton(Logger, metaclass=Singleton):
     pass
+
+
+class AsyncLogger(Logger):
+    """Asyncio logging handler.
+
+    Logging coroutines queue records which are written by batches from a single
+    background task, file writes being run in the default executor so they
+    never block the event loop. Each logging method has a `_nowait`
+    counterpart, e.g. `info_nowait`, queueing the record without waiting and
+    dropping it if the queue is full.
+
+    Attributes:
+        dropped (int): Count of records dropped by a full queue
+    """
+
+    def __init__(
+        self,
+        file: str = None,
+        level: str = "DEBUG",
+        enabled: bool = True,
+        erase: bool = True,
+        buffer_size: int = 65536,
+        queue_size: int = 10000,
+        format: str = "text",
+        compression: str = None,
+        stats: bool = False,
+        stats_interval: float = 0,
+        stats_file: str = None,
+    ):
+        """AsyncLogger initialization.
+
+        Args:
+            file (str, optional): Output file path. Defaults to None.
+            level (str, optional): Minimum log level. Defaults to "DEBUG".
+            enabled (bool, optional): Is log enabled ? Defaults to True.
+            erase (bool, optional): Should preexisting file be erased ? Defaults to True.
+            buffer_size (int, optional): Size of the write buffer. Defaults to 65536.
+            queue_size (int, optional): Maximum count of records waiting to be
+                written. Defaults to 10000.
+            format (str, optional): Records format, "text" or "json" for JSON
+                lines. Defaults to "text".
+            compression (str, optional): Write log file through a streaming
+                compressor, "gzip" or "zstd", None for plain text. Defaults
+                to None.
+            stats (bool, optional): Count records, bytes and time spent
+                queueing, see `stats()` ? Defaults to False.
+            stats_interval (float, optional): Dump stats every given seconds,
+                0 to disable. Defaults to 0.
+            stats_file (str, optional): Stats dump file path, None for
+                stderr. Defaults to None.
+        """
+
+        super().__init__(
+            file=file,
+            level=level,
+            enabled=enabled,
+            erase=erase,
+            buffered=True,
+            buffer_size=buffer_size,
+            flush_interval=0,
+            queue_size=queue_size,
+            format=format,
+            compression=compression,
+            stats=stats,
+            stats_interval=stats_interval,
+            stats_file=stats_file,
+        )
+        self._dropped = 0
+        self._queue = None
+        self._flusher = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        await self.close()
+
+    @property
+    def dropped(self):
+        return self._dropped
+
+    def _get_queue(self):
+        """Get records queue, creating it and starting the flusher task on
+        first use from the running event loop.
+
+        Returns:
+            Queue: Records queue
+        """
+
+        if self._flusher is None:
+            self._queue = Queue(maxsize=self._queue_size)
+            self._flusher = get_event_loop().create_task(self._flush_queue())
+            _pending_loggers.add(self)
+        return self._queue
+
+    def _write_pending(self):
+        """Write queued records synchronously, once event loop is gone."""
+
+        queue = self._queue
+        if queue is None:
+            return
+        batch = []
+        while not queue.empty():
+            batch.append(queue.get_nowait())
+        if batch:
+            self._write_batch(b"".join(batch))
+
+    async def _flush_queue(self):
+        """Background task writing queued records by batches."""
+
+        loop = get_event_loop()
+        while True:
+            batch = [await self._queue.get()]
+            while not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+            try:
+                await loop.run_in_executor(None, self._write_batch, b"".join(batch))
+            except OSError:
+                self._dropped += len(batch)
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+    def _write_batch(self, data: bytes):
+        """Write a batch of records, run in the executor.
+
+        Args:
+            data (bytes): Formatted records
+        """
+
+        self._writer.write(data)
+        self._writer.flush()
+
+    def _write(self, level: str, content: str, fields: dict = None):
+        """Queue provided content without waiting, drop it if queue is full.
+
+        Args:
+            level (str); Log level
+            content (str): Content to be written
+            fields (dict, optional): Additional record fields. Defaults to None.
+        """
+
+        if not self._enabled:
+            return
+
+        record = self._format(level=level, content=content, fields=fields)
+        try:
+            self._get_queue().put_nowait(record)
+        except QueueFull:
+            self._dropped += 1
+
+    async def _put(self, level: str, content: str, fields: dict = None):
+        """Queue provided content, waiting for space if queue is full.
+
+        Args:
+            level (str); Log level
+            content (str): Content to be written
+            fields (dict, optional): Additional record fields. Defaults to None.
+        """
+
+        if not self._enabled:
+            return
+
+        record = self._format(level=level, content=content, fields=fields)
+        await self._get_queue().put(record)
+
+    async def flush(self):
+        """Wait for every queued record to be written."""
+
+        if self._queue is not None:
+            await self._queue.join()
+        await get_event_loop().run_in_executor(None, self._writer.flush)
+
+    async def close(self):
+        """Write queued records, stop flusher task and release log file."""
+
+        await self.flush()
+        if self._flusher is not None:
+            self._flusher.cancel()
+            self._flusher = None
+            self._queue = None
+        await get_event_loop().run_in_executor(None, self._writer.close)
+        self._stop_stats()
+
+    _METHODS = {
+        **Logger._METHODS,
+        "error_nowait": "ERROR",
+        "warn_nowait": "WARNING",
+        "info_nowait": "INFO",
+        "debug_nowait": "DEBUG",
+    }
+
+    def _disabled_method(self, method: str):
+        """Get the no-op replacing a filtered out logging method.
+
+        Args:
+            method (str): Logging method name
+
+        Returns:
+            function: No-op function, a coroutine function for awaitable methods
+        """
+
+        return _disabled if method.endswith("_nowait") else _disabled_async
+
+    error_nowait = Logger.error
+    warn_nowait = Logger.warn
+    info_nowait = Logger.info
+    debug_nowait = Logger.debug
+
+    async def error(self, message: str, *args, **fields):
+        """Write error message.
+
+        Args:
+            message (str): Log message, or callable returning it
+            *args: Arguments merged into message with % operator
+            **fields: Additional record fields
+        """
+
+        await self._put(
+            level="ERR!", content=self._render(message, args), fields=fields
+        )
+
+    async def warn(self, message: str, *args, **fields):
+        """Write warning message.
+
+        Args:
+            message (str): Log message, or callable returning it
+            *args: Arguments merged into message with % operator
+            **fields: Additional record fields
+        """
+
+        await self._put(
+            level="WARN", content=self._render(message, args), fields=fields
+        )
+
+    async def info(self, message: str, *args, **fields):
+        """Write info message.
+
+        Args:
+            message (str): Log message, or callable returning it
+            *args: Arguments merged into message with % operator
+            **fields: Additional record fields
+        """
+
+        await self._put(
+            level="INFO", content=self._render(message, args), fields=fields
+        )
+
+    async def debug(self, message: str, *args, **fields):
+        """Write debug message.
+
+        Args:
+            message (str): Log message, or callable returning it
+            *args: Arguments merged into message with % operator
+            **fields: Additional record fields
+        """
+
+        await self._put(
+            level="DBUG", content=self._render(message, args), fields=fields
+        )
@@ -0,0 +1,101 @@
+# -*- coding: utf-8 -*-
+
+import os
+from socket import SOCK_DGRAM, getaddrinfo, socket
+from stat import S_ISSOCK
+from .errors import AddressIsInUse, AddressIsInvalid
+
+try:
+    from socket import AF_UNIX
+except ImportError:
+    # Windows, only UDP is available.
+    AF_UNIX = None
+
+DEFAULT_ADDRESS = "127.0.0.1:4680"
+
+
+def parse_address(address: str):
+    """Parse a socket address.
+
+    Args:
+        address (str): HOST:PORT, or Unix socket path if it contains a slash
+
+    Raises:
+        AddressIsInvalid: If address is not a HOST:PORT pair nor a path
+
+    Returns:
+        tuple: Host and port, or socket path and None
+    """
+
+    if "/" in address:
+        return address, None
+    host, _, port = address.rpartition(":")
+    if not host or not port.isdigit():
+        raise AddressIsInvalid(address)
+    return host, int(port)
+
+
+def datagram_socket(address: str, bind: bool = False):
+    """Create a non-blocking datagram socket, Unix domain for a path or UDP
+    for a HOST:PORT pair.
+
+    Args:
+        address (str): HOST:PORT or Unix socket path
+        bind (bool, optional): Listen on address instead of sending to it ?
+            A stale Unix socket file is replaced. Defaults to False.
+
+    Raises:
+        AddressIsInvalid: If address is invalid
+        AddressIsInUse: If Unix socket path to listen on is an existing file
+            or a socket still listened on
+        OSError: If socket cannot be connected or bound
+
+    Returns:
+        socket: Connected or bound socket
+    """
+
+    host, port = parse_address(address)
+    if port is None:
+        if AF_UNIX is None:
+            raise AddressIsInvalid(address)
+        family, target = AF_UNIX, host
+        if bind and os.path.exists(host):
+            _remove_stale_socket(host)
+    else:
+        family, _, _, _, target = getaddrinfo(host, port, 0, SOCK_DGRAM)[0]
+
+    sock = socket(family, SOCK_DGRAM)
+    try:
+        if bind:
+            sock.bind(target)
+        else:
+            sock.connect(target)
+    except OSError:
+        sock.close()
+        raise
+    sock.setblocking(False)
+    return sock
+
+
+def _remove_stale_socket(path: str):
+    """Remove a Unix socket file left by a listener which did not exit
+    cleanly.
+
+    Args:
+        path (str): Existing socket path
+
+    Raises:
+        AddressIsInUse: If path is not a socket or is still listened on
+    """
+
+    if not S_ISSOCK(os.stat(path).st_mode):
+        raise AddressIsInUse(path)
+    probe = socket(AF_UNIX, SOCK_DGRAM)
+    try:
+        probe.connect(path)
+    except ConnectionRefusedError:
+        os.remove(path)
+        return
+    finally:
+        probe.close()
+    raise AddressIsInUse(path)
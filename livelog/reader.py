@@ -1,13 +1,43 @@
 # -*- coding: utf-8 -*-
 
-from os import getenv, system, access, R_OK
+from fnmatch import fnmatch
+from glob import glob, has_magic
+from heapq import merge
+from operator import itemgetter
+from os import getenv, system, access, stat, fstat, R_OK
+from re import compile, error, escape, fullmatch
+from mmap import mmap, ACCESS_READ
+from pathlib import Path
 from sys import exit as _exit
 from platform import system as system_
-from time import sleep
+from time import monotonic, perf_counter_ns, sleep
+from shutil import get_terminal_size
+from threading import Event, RLock, Thread
+from bisect import bisect_left
+from collections import deque
 from watchdog.observers import Observer
 from watchdog.events import FileSystemEventHandler
-from colorama import Style, Fore
+from colorama import Style, Fore, Back, just_fix_windows_console
 from .errors import *
+from .formats import (
+    RECORD_HEADER,
+    RECORD_MARKER,
+    format_fields,
+    format_json_value,
+    parse_binary,
+    parse_json,
+    read_index,
+)
+from .buffer import LineBuffer
+from .compression import Decompressor, detect
+from .stats import StatsDumper
+from .timestamps import TimestampFormatter
+
+
+_UNKNOWN = object()
+_HIGHLIGHT = Back.YELLOW + Fore.BLACK
+_INLINE_FLAGS = compile(r"\(\?([aiLmsux]+)\)")
+_TIMESTAMP_FORMATTER = TimestampFormatter()
 
 
 class Reader(FileSystemEventHandler):
@@ -21,10 +51,29 @@ class Reader(FileSystemEventHandler):
         file (str): Log file path
         level (str): Minimum log level to be displayed
         nocolors (bool): If colors should not be printed
-        read_index (int): Current position of the cursor in the log file
+        refresh_rate (float): Maximum count of renders per second
+        max_lines (int): Maximum count of lines printed per render, older
+            ones are skipped, 0 for no limit
+        lines (int): Only print this count of last lines at startup
+        from_end (bool): If preexisting content should be skipped
+        since (str): Only print records from this time at startup
+        fields (dict): Fields values JSON records must match to be displayed
+        highlight (bool): If pattern matches should be highlighted
+        poll_interval (float): Minimum seconds between file checks when
+            polling, at least `MIN_POLL_INTERVAL`
+        max_poll_interval (float): Maximum seconds between file checks when
+            polling
+        read_index (int): Current position of the cursor in the log file, in
+            bytes
+        CHUNK_SIZE (int): Maximum bytes read at once
+        MAX_LINE_SIZE (int): Size after which an unterminated line is
+            printed anyway
+        MIN_POLL_INTERVAL (float): Lowest seconds between file checks
 
     Raises:
         LogLevelDoesNotExist: If user provide an unknown log level
+        TimeFormatIsInvalid: If user provide an invalid start time
+        PatternIsInvalid: If user provide an invalid regex
         LogFileIsADirectory: If user provide a directory as output path
         LogPathDoesNotExist: If user provide a non existing output path
         LogPathInsufficientPermissions: If user does not have permissions to
@@ -55,26 +104,114 @@ class Reader(FileSystemEventHandler):
         "INFO": 1,
         "DBUG": 0,
     }
+    CHUNK_SIZE = 65536
+    MAX_LINE_SIZE = 1048576
+    MIN_POLL_INTERVAL = 0.01
 
-    def __init__(self, file: str, level: str, nocolors: bool):
+    def __init__(
+        self,
+        file: str,
+        level: str,
+        nocolors: bool,
+        refresh_rate: float = 30,
+        max_lines: int = 0,
+        lines: int = None,
+        from_end: bool = False,
+        since: str = None,
+        fields: dict = None,
+        grep: list = None,
+        exclude: list = None,
+        regex: list = None,
+        highlight: bool = False,
+        poll_interval: float = 0.1,
+        max_poll_interval: float = 2.0,
+        stats: bool = False,
+        stats_interval: float = 0,
+        stats_file: str = None,
+    ):
         """Reader initialization.
 
         Args:
             file (str): Path of file to monitor
             level (str): Minimum log level to be displayed
             nocolors (bool): If colors should not be printed
+            refresh_rate (float, optional): Maximum renders per second. Defaults to 30.
+            max_lines (int, optional): Maximum lines per render, 0 for no
+                limit. Defaults to 0.
+            lines (int, optional): Count of last lines printed at startup,
+                None for all. Defaults to None.
+            from_end (bool, optional): Skip preexisting content ? Defaults to False.
+            since (str, optional): Print records from this HH:MM:SS time at
+                startup. Defaults to None.
+            fields (dict, optional): Fields values JSON records must match.
+                Defaults to None.
+            grep (list, optional): Substrings, records must contain one of
+                them or match a regex. Defaults to None.
+            exclude (list, optional): Substrings, records containing one of
+                them are hidden. Defaults to None.
+            regex (list, optional): Regexes, records must match one of them or
+                contain a substring. Defaults to None.
+            highlight (bool, optional): Highlight matches ? Defaults to False.
+            poll_interval (float, optional): Minimum seconds between file
+                checks when polling. Defaults to 0.1.
+            max_poll_interval (float, optional): Maximum seconds between file
+                checks when polling an idle file. Defaults to 2.0.
+            stats (bool, optional): Count events, lines and time spent
+                rendering, see `stats()` ? Defaults to False.
+            stats_interval (float, optional): Dump stats every given seconds,
+                0 to disable. Defaults to 0.
+            stats_file (str, optional): Stats dump file path, None for
+                stderr. Defaults to None.
         """
 
         self.file = file
         self.verify_file()
-        level = level.upper()
-        if level not in self.LONG_LEVEL_TO_SHORT:
-            raise LogLevelDoesNotExist(level)
-        self.level = self.LONG_LEVEL_TO_SHORT[level]
+        if level.upper() not in self.LONG_LEVEL_TO_SHORT:
+            raise LogLevelDoesNotExist(level.upper())
+        self.set_level(level)
         self.nocolors = nocolors
+        # Display state of the last processed record, followed by lines
+        # without level tag.
+        self._keep = True
+        self._color = ""
+        self.refresh_rate = refresh_rate
+        self.max_lines = max_lines
+        self.lines = lines
+        self.from_end = from_end
+        if since is not None and not fullmatch(
+            r"[0-9]{2}:[0-9]{2}:[0-9]{2}(\.[0-9]{1,3})?", since
+        ):
+            raise TimeFormatIsInvalid(since)
+        self.since = since
+        self.fields = fields or {}
+        self.highlight = highlight
+        self.set_patterns(grep=grep, exclude=exclude, regex=regex)
+        # A null interval would never grow while idle and spin on the file.
+        self.poll_interval = max(poll_interval, self.MIN_POLL_INTERVAL)
+        self.max_poll_interval = max(self.poll_interval, max_poll_interval)
 
+        # Set by file events, cleared by the render loop once started.
+        self._dirty = Event()
+        self._rendering = False
         self.read_index = 0
+        self._handle = None
+        # Last line bytes, waiting for their newline.
+        self._partial = b""
+        self._stats = None
+        if stats:
+            self._stats = dict.fromkeys(
+                ("events", "coalesced", "parsed", "shown", "renders", "render_ns"), 0
+            )
+            if stats_interval > 0:
+                StatsDumper(self.stats, stats_interval, stats_file).start()
+        self.start()
+
+    def start(self):
+        """Wait for log file creation and print its content from the startup
+        position.
+        """
 
+        self._path = str(Path(self.file).resolve())
         system(self.CLEAR_CMD)
         if not self.file_exists() and getenv("LIVELOG_ENV") == "TEST":
             print("FILE NOT FOUND:", self.file)
@@ -84,6 +221,7 @@ class Reader(FileSystemEventHandler):
             sleep(1)
             system(self.CLEAR_CMD)
 
+        self.seek_start()
         self.on_modified()
 
     def verify_file(self):
@@ -109,48 +247,456 @@ class Reader(FileSystemEventHandler):
 
         return self.file.is_file()
 
+    def seek_start(self):
+        """Move cursor to the startup position requested by `from_end`,
+        `lines` or `since`. The file is memory-mapped so the position is found
+        without reading the whole file.
+        """
+
+        self._open()
+        if not self.from_end and self.lines is None and self.since is None:
+            return
+        if detect(self._handle.read(4)) is not None:
+            self._handle.seek(0)
+            self._seek_compressed()
+            return
+        self._handle.seek(0)
+
+        size = fstat(self._handle.fileno()).st_size
+        if size == 0:
+            return
+        with mmap(self._handle.fileno(), 0, access=ACCESS_READ) as mm:
+            self._binary = mm[:1] == RECORD_MARKER
+            if self.from_end:
+                offset = size
+            elif self._binary:
+                # Sparse index lets binary logs skip most of the file.
+                index = read_index(f"{self.file}.idx")
+                if self.lines is not None:
+                    offset = _binary_last_records_offset(mm, self.lines, index)
+                else:
+                    offset = _binary_time_offset(mm, self.since.encode(), index)
+            elif self.lines is not None:
+                offset = _last_lines_offset(mm, self.lines)
+            else:
+                offset = _time_offset(mm, self.since.encode())
+
+        self._handle.seek(offset)
+        self.read_index = offset
+
+    def _seek_compressed(self):
+        """Move cursor to the startup position of a compressed log file. As
+        it cannot be seeked, content is decompressed up to the startup
+        position. Lines of the last chunk from that position are kept, to be
+        returned first by `get_new_lines`, so memory use stays bounded.
+        """
+
+        if self.from_end:
+            for _ in iter(self.get_new_lines, None):
+                pass
+            return
+        if self.lines is not None:
+            kept = deque(maxlen=max(self.lines, 0))
+            for rows in iter(self.get_new_lines, None):
+                kept.extend(rows)
+            self._pending = list(kept)
+            return
+
+        # Stop reading at the first record logged from `since`, following
+        # content being read as usual.
+        for rows in iter(self.get_new_lines, None):
+            for position, row in enumerate(rows):
+                if row[4:7] != " | ":
+                    continue
+                separator = row.find(" - ", 7)
+                if row[7:separator].rpartition("T")[2] >= self.since:
+                    self._pending = rows[position:]
+                    return
+
     def print_output(self):
         """Drive the printing process by getting new lines, filtering log
-        level and coloring the output.
+        level and coloring the output. New content is processed chunk by chunk
+        to keep memory use bounded.
+
+        If `max_lines` is set, only the most recent lines are printed, preceded
+        by the count of skipped ones.
         """
 
-        rows = self.get_new_lines()
-        if rows is None:
+        if not self.max_lines:
+            for rows in self.iter_rows():
+                if rows:
+                    print(self.render(rows), end="")
+            print(end="", flush=True)
             return
-        rows = self.filter_log_level(rows)
+
+        kept = deque(maxlen=self.max_lines)
+        total = 0
+        for rows in self.iter_rows():
+            total += len(rows)
+            kept.extend(rows)
+
+        if total > len(kept):
+            print(self.render_skipped(total - len(kept)), end="")
+        if kept:
+            print(self.render(kept), end="")
+        print(end="", flush=True)
+
+    def iter_rows(self):
+        """Iterate over new content, chunk by chunk.
+
+        Yields:
+            list: Printable lines
+        """
+
+        while True:
+            rows = self.get_new_lines()
+            if rows is None:
+                return
+            output = self.process_lines(rows)
+            if self._stats is not None:
+                self._stats["parsed"] += len(rows)
+                self._stats["shown"] += len(output)
+            yield output
+
+    def stats(self):
+        """Get reader counters.
+
+        Raises:
+            StatsAreDisabled: If reader has been created without stats
+
+        Returns:
+            dict: Relevant file events received and coalesced with a pending
+                render, lines parsed and filtered out, renders count and
+                seconds spent rendering
+        """
+
+        if self._stats is None:
+            raise StatsAreDisabled()
+        stats = self._stats
+        return {
+            "events": stats["events"],
+            "coalesced": stats["coalesced"],
+            "lines_parsed": stats["parsed"],
+            "lines_filtered": stats["parsed"] - stats["shown"],
+            "renders": stats["renders"],
+            "render_time": stats["render_ns"] / 1e9,
+        }
+
+    def _print(self):
+        """Print new content, measuring time spent if stats are enabled."""
+
+        if self._stats is None:
+            self.print_output()
+            return
+        start = perf_counter_ns()
+        self.print_output()
+        self._stats["renders"] += 1
+        self._stats["render_ns"] += perf_counter_ns() - start
+
+    def render(self, rows):
+        """Build printable output for given processed lines.
+
+        Args:
+            rows (list): Lines to be printed
+
+        Returns:
+            str: Output
+        """
 
         if self.nocolors:
-            output = "".join(rows)
-            print(output, end="")
-        else:
-            colored_lines = map(self.color_line, rows)
-            output = "".join(list(colored_lines))
-            print(Style.RESET_ALL + output + Style.RESET_ALL, end="")
+            return "".join(rows)
+        return Style.RESET_ALL + "".join(rows) + Style.RESET_ALL
+
+    def render_skipped(self, count: int):
+        """Build printable notice for skipped lines.
+
+        Args:
+            count (int): Skipped lines count
+
+        Returns:
+            str: Output
+        """
+
+        notice = f"... {count} lines skipped ...\n"
+        if self.nocolors:
+            return notice
+        return f"{Style.DIM}{notice}{Style.RESET_ALL}"
 
     def get_new_lines(self):
-        """Get newly created lines in log file based on stored cursor index.
+        """Get lines completed by the next chunk of the log file.
+
+        The log file is kept open and read in binary mode from stored cursor
+        index. If it has been rotated, remaining content of the previous file
+        is read before switching to the new one. If it has been truncated, it
+        is read again from its start. Binary format records are decoded to
+        text lines. Gzip and zstd compressed files, detected from their magic
+        bytes, are decompressed as they are read.
 
         Returns:
-            list: List of new lines
+            list: List of new lines, None if end of file is reached
         """
 
-        with open(self.file, "r") as f:
-            f.seek(self.read_index)
-            rows = list(f)
-            if not rows and self.read_index > 0:
-                # If a modification event was triggered without any
-                # new rows, we should verify if there is content just before
-                # current cursor position to determine if file have been reset
-                # or just a false positive.
-                f.seek(self.read_index - 1)
-                if len(list(f)) > 0:
-                    return None
-                self.read_index = 0
-                return self.get_new_lines()
-            self.read_index += sum(map(len, rows))
+        if self._handle is None:
+            self._open()
+        if self._pending:
+            rows, self._pending = self._pending, []
+            return rows
+        chunk = self._handle.read(self.CHUNK_SIZE)
+        if not chunk:
+            if not self._follow():
+                return None
+            chunk = self._handle.read(self.CHUNK_SIZE)
+            if not chunk:
+                return None
+        if self.read_index == 0:
+            compression = detect(chunk)
+            self._decompressor = None
+            if compression is not None:
+                self._decompressor = Decompressor(compression)
+            start = True
+        else:
+            start = self._decompressor is not None
+        self.read_index += len(chunk)
+        if self._decompressor is not None:
+            chunk = self._decompressor.decompress(chunk)
+            if not chunk:
+                return []
+        if self._binary is None:
+            self._binary = start and chunk[:1] == RECORD_MARKER
+
+        data = self._partial + chunk
+        if self._binary:
+            records, consumed = parse_binary(data)
+            self._partial = data[consumed:]
+            return self.convert_binary(records)
 
+        end = data.rfind(b"\n") + 1
+        if end == 0:
+            if len(data) < self.MAX_LINE_SIZE:
+                self._partial = data
+                return []
+            data += b"\n"
+            end = len(data)
+        self._partial = data[end:]
+
+        text = data[:end].decode("utf-8", "replace")
+        rows = [row + "\n" for row in text[:-1].split("\n")]
+        if text[0] == "{" or "\n{" in text:
+            rows = self.convert_json(rows)
         return rows
 
+    def convert_binary(self, records: list):
+        """Convert binary records to text format.
+
+        Args:
+            records (list): Records as log level tag, epoch timestamp in
+                nanoseconds and payload
+
+        Returns:
+            list: Converted lines
+        """
+
+        format = _TIMESTAMP_FORMATTER.format
+        return [
+            f"{tag} | {format(timestamp)} - {payload.decode('utf-8', 'replace')}\n"
+            for tag, timestamp, payload in records
+        ]
+
+    def convert_json(self, rows: list):
+        """Convert JSON lines records to text format and filter them on
+        fields. Other lines are kept as is.
+
+        Args:
+            rows (list): Lines to be converted
+
+        Returns:
+            list: Converted lines
+        """
+
+        output = []
+        for row in rows:
+            if row[0] == "{":
+                record = parse_json(row)
+                if record is not None:
+                    tag, timestamp, message, fields = record
+                    fields = {
+                        key: format_json_value(value) for key, value in fields.items()
+                    }
+                    if any(
+                        fields.get(key) != value for key, value in self.fields.items()
+                    ):
+                        continue
+                    time = _TIMESTAMP_FORMATTER.format(timestamp)
+                    row = f"{tag} | {time} - {message}{format_fields(fields)}\n"
+            output.append(row)
+
+        return output
+
+    def _follow(self):
+        """Check if log file has been rotated or truncated and move cursor
+        accordingly.
+
+        Returns:
+            bool: Cursor has been moved
+        """
+
+        try:
+            current = stat(self.file)
+        except FileNotFoundError:
+            # Rotated file not created yet, keep following the previous one.
+            return False
+        if current.st_ino != self._inode:
+            self._open()
+            return True
+        if current.st_size < self.read_index:
+            self._handle.seek(0)
+            self.read_index = 0
+            self._partial = b""
+            return True
+        return False
+
+    def _open(self):
+        """Open log file and keep track of its inode to detect rotations."""
+
+        if self._handle is not None:
+            self._handle.close()
+        self._handle = open(self.file, "rb", buffering=0)
+        self._inode = fstat(self._handle.fileno()).st_ino
+        self.read_index = 0
+        self._partial = b""
+        # Format and compression are detected from the first bytes of the file.
+        self._binary = None
+        self._decompressor = None
+        # Lines before cursor kept at startup, see `_seek_compressed`.
+        self._pending = []
+
+    def set_level(self, level: str):
+        """Set minimum log level and precompute level tags lookups.
+
+        Args:
+            level (str): Minimum log level to be displayed, long or short format
+        """
+
+        level = level.upper()
+        level = self.LONG_LEVEL_TO_SHORT.get(level, level)
+        if level not in self.LEVELS:
+            raise LogLevelDoesNotExist(level)
+        self.level = level
+
+        threshold = self.LEVELS[level]
+        self._visible = {tag: value >= threshold for tag, value in self.LEVELS.items()}
+        # Colored separator and message prefix for displayed level tags,
+        # None for filtered out ones.
+        self._tails = {
+            tag: f"{Style.BRIGHT} - {Style.NORMAL}{self.LEVEL_COLORS[tag]}"
+            if visible
+            else None
+            for tag, visible in self._visible.items()
+        }
+
+    def set_patterns(self, grep: list = None, exclude: list = None, regex: list = None):
+        """Compile filtering patterns, each list being combined in a single
+        alternation regex.
+
+        Args:
+            grep (list, optional): Substrings to be included. Defaults to None.
+            exclude (list, optional): Substrings to be excluded. Defaults to None.
+            regex (list, optional): Regexes to be included. Defaults to None.
+        """
+
+        include = [escape(pattern) for pattern in grep or []]
+        for pattern in regex or []:
+            try:
+                compile(pattern)
+            except error:
+                raise PatternIsInvalid(pattern)
+            # Leading global flags become flags of the wrapping group.
+            flags = ""
+            match = _INLINE_FLAGS.match(pattern)
+            while match is not None:
+                flags += match.group(1)
+                pattern = pattern[match.end() :]
+                match = _INLINE_FLAGS.match(pattern)
+            include.append(f"(?{flags}:{pattern})")
+        exclude = [escape(pattern) for pattern in exclude or []]
+
+        try:
+            self._include = compile("|".join(include)) if include else None
+        except error:
+            raise PatternIsInvalid("|".join(regex))
+        self._exclude = compile("|".join(exclude)) if exclude else None
+
+    def process_lines(self, lines: list):
+        """Filter lines on log level and patterns, and color them in a single
+        pass.
+
+        Lines not starting with a known level tag, like multi-line messages
+        continuation, follow the previous line.
+
+        Args:
+            lines (list): Lines to be processed
+
+        Returns:
+            list: Printable lines
+        """
+
+        output = []
+        append = output.append
+        keep, color = self._keep, self._color
+        include = self._include.search if self._include is not None else None
+        exclude = self._exclude.search if self._exclude is not None else None
+
+        if self.nocolors:
+            visible = self._visible
+            for line in lines:
+                state = visible.get(line[:4])
+                if state is not None:
+                    keep = (
+                        state
+                        and (include is None or include(line) is not None)
+                        and (exclude is None or exclude(line) is None)
+                    )
+                if keep:
+                    append(line)
+            self._keep = keep
+            return output
+
+        if self.highlight and self._include is not None:
+            highlight = self._include.sub
+        else:
+            highlight = None
+
+        tails = self._tails
+        colors = self.LEVEL_COLORS
+        dim, reset = Style.DIM, Style.RESET_ALL
+        for line in lines:
+            level = line[:4]
+            tail = tails.get(level, _UNKNOWN)
+            if tail is _UNKNOWN:
+                if keep:
+                    append(f"{color}{line}{reset}")
+                continue
+            keep = (
+                tail is not None
+                and (include is None or include(line) is not None)
+                and (exclude is None or exclude(line) is None)
+            )
+            if not keep:
+                continue
+            color = colors[level]
+            # Timestamp length depends on its format.
+            separator = line.find(" - ", 7)
+            if separator < 0:
+                append(f"{color}{line}{reset}")
+                continue
+            message = line[separator + 3 :]
+            if highlight is not None:
+                message = highlight(f"{_HIGHLIGHT}\\g<0>{Back.RESET}{color}", message)
+            append(f"{dim}{line[7:separator]}{tail}{message}{reset}")
+
+        self._keep, self._color = keep, color
+        return output
+
     def filter_log_level(self, lines: list):
         """Remove lines based on log level.
 
@@ -161,15 +707,15 @@ class Reader(FileSystemEventHandler):
             list: Filtered lines
         """
 
-        i = 0
-        for _ in range(len(lines)):
-            level = lines[i][:4]
-            if self.LEVELS[self.level] > self.LEVELS[level]:
-                del lines[i]
-                continue
-            i += 1
+        visible = self._visible
+        keep = True
+        output = []
+        for line in lines:
+            keep = visible.get(line[:4], keep)
+            if keep:
+                output.append(line)
 
-        return lines
+        return output
 
     def color_line(self, line: str):
         """Parse and color a line based on its log level.
@@ -182,51 +728,835 @@ class Reader(FileSystemEventHandler):
         """
 
         level = line[:4]
+        # Timestamp length depends on its format.
+        separator = line.find(" - ", 7)
+        if level not in self.LEVEL_COLORS or separator < 0:
+            return line
 
         output = (
-            f"{Style.DIM}{line[7:19]}{Style.BRIGHT} - {Style.NORMAL}"
-            f"{self.LEVEL_COLORS[level]}{line[22:]}{Style.RESET_ALL}"
+            f"{Style.DIM}{line[7:separator]}{Style.BRIGHT} - {Style.NORMAL}"
+            f"{self.LEVEL_COLORS[level]}{line[separator + 3:]}{Style.RESET_ALL}"
         )
         return output
 
+    def dispatch(self, event):
+        """Filter events of the watched directory to those concerning the log
+        file, including its creation or rotation.
+
+        Args:
+            event (FileSystemEvent): Watchdog event
+        """
+
+        if self._path in (event.src_path, getattr(event, "dest_path", None)):
+            self.on_modified()
+
     def on_modified(self, *args, **kwargs):
-        """File modification callback."""
+        """File modification callback. Once the render loop is started, only
+        flag new content so events are coalesced.
+        """
 
-        self.print_output()
+        if self._stats is not None:
+            self._stats["events"] += 1
+            if self._rendering and self._dirty.is_set():
+                self._stats["coalesced"] += 1
+        if self._rendering:
+            self._dirty.set()
+        else:
+            self._print()
+
+    def start_rendering(self):
+        """Run render loop in a background thread. Events are left to the
+        loop as soon as this returns, so they never print concurrently.
+        """
 
-    def loop_without_event(self):
-        """If inotify instance limit reached, loop without watching file."""
+        self._rendering = True
+        Thread(target=self.run, name="livelog-render", daemon=True).start()
+
+    def run(self):
+        """Render loop, print new content at most `refresh_rate` times per
+        second.
+        """
+
+        self._rendering = True
+        interval = 1 / self.refresh_rate
+        while True:
+            self._dirty.wait()
+            self._dirty.clear()
+            start = monotonic()
+            self._print()
+            sleep(max(0, interval - (monotonic() - start)))
+
+    def signature(self):
+        """Get file state compared by the poller to detect changes.
+
+        Returns:
+            tuple: File size, modification time in nanoseconds and inode,
+                None if the file does not exist
+        """
+
+        try:
+            current = stat(self.file)
+        except FileNotFoundError:
+            return None
+        return current.st_size, current.st_mtime_ns, current.st_ino
+
+    def poll(self):
+        """Follow file without filesystem events, for when inotify instances
+        are exhausted or events are not delivered like on network mounts.
+
+        File is only read when its `signature` changes. Polling interval is
+        doubled while the file is idle, up to `max_poll_interval`, and reset to
+        `poll_interval` on activity.
+        """
+
+        last = None
+        interval = self.poll_interval
+        while True:
+            current = self.signature()
+            if current == last:
+                interval = min(interval * 2, self.max_poll_interval)
+            else:
+                last = current
+                interval = self.poll_interval
+                self.on_modified()
+            sleep(interval)
+
+
+class _Source(Reader):
+    """Incremental reader of one of the files followed by a `MultiReader`,
+    only producing lines.
+
+    Attributes:
+        index (int): Position of the file among followed ones
+        prefix (str): Prefix of printed lines
+    """
+
+    def __init__(
+        self,
+        file: Path,
+        index: int,
+        prefix: str,
+        lines: int = None,
+        from_end: bool = False,
+        since: str = None,
+        fields: dict = None,
+    ):
+        """Source initialization.
+
+        Args:
+            file (Path): Path of file to read
+            index (int): Position of the file among followed ones
+            prefix (str): Prefix of printed lines
+            lines (int, optional): Count of last lines read at startup, None
+                for all. Defaults to None.
+            from_end (bool, optional): Skip preexisting content ? Defaults to False.
+            since (str, optional): Read records from this HH:MM:SS time at
+                startup. Defaults to None.
+            fields (dict, optional): Fields values JSON records must match.
+                Defaults to None.
+        """
+
+        self.file = file
+        self.index = index
+        self.prefix = prefix
+        self.lines = lines
+        self.from_end = from_end
+        self.since = since
+        self.fields = fields or {}
+        self.read_index = 0
+        self._handle = None
+        self._partial = b""
+        self.seek_start()
+
+    def iter_records(self):
+        """Iterate over new records, as read in the file.
+
+        Yields:
+            tuple: Record time, file position and lines, the record one
+                followed by its continuation lines
+        """
+
+        record = None
+        levels = self.LEVELS
+        for rows in iter(self.get_new_lines, None):
+            for row in rows:
+                if row[:4] not in levels:
+                    if record is None:
+                        record = ("", self.index, [])
+                    record[2].append(row)
+                    continue
+                if record is not None:
+                    yield record
+                separator = row.find(" - ", 7)
+                record = (row[7:separator] if separator > 0 else "", self.index, [row])
+        if record is not None:
+            yield record
+
+
+class MultiReader(Reader):
+    """Reading handler following several files and merging their records in
+    timestamp order.
+
+    Records are merged among content read within a same render, each file
+    being already ordered.
+
+    Attributes:
+        FILE_COLORS (list): Colors of files prefixes
+        files (list): Paths or glob patterns of files to monitor
+        BATCH_SIZE (int): Count of merged records processed at once
+    """
+
+    FILE_COLORS = [
+        Fore.CYAN,
+        Fore.MAGENTA,
+        Fore.GREEN,
+        Fore.LIGHTBLUE_EX,
+        Fore.LIGHTYELLOW_EX,
+        Fore.LIGHTRED_EX,
+    ]
+    BATCH_SIZE = 4096
+
+    def __init__(self, files: list, level: str, nocolors: bool, **kwargs):
+        """Reader initialization.
+
+        Args:
+            files (list): Paths or glob patterns of files to monitor, patterns
+                being only allowed in file names
+            level (str): Minimum log level to be displayed
+            nocolors (bool): If colors should not be printed
+            **kwargs: Other `Reader` options
+        """
+
+        self.files = [Path(file).expanduser() for file in files]
+        self._patterns = [
+            str(file.parent.resolve() / file.name) for file in self.files
+        ]
+        self._sources = {}
+        super().__init__(file=None, level=level, nocolors=nocolors, **kwargs)
+
+    @property
+    def directories(self):
+        """Directories containing followed files.
+
+        Returns:
+            list: Resolved directories paths
+        """
+
+        return sorted({str(Path(pattern).parent) for pattern in self._patterns})
+
+    def verify_file(self):
+        """Verify if provided paths are valid log files locations."""
+
+        for file in self.files:
+            dir = file.parent.resolve()
+            if not has_magic(file.name) and file.is_dir():
+                raise LogFileIsADirectory(path=file)
+            if not dir.is_dir():
+                raise LogPathDoesNotExist(path=dir)
+            if not access(dir, R_OK):
+                raise LogPathInsufficientPermissions(path=dir)
+
+    def start(self):
+        """Follow matching files and print their content from the startup
+        position.
+        """
+
+        system(self.CLEAR_CMD)
+        self.discover(startup=True)
+        if not self._sources:
+            if getenv("LIVELOG_ENV") == "TEST":
+                print("FILE NOT FOUND:", *self.files)
+                _exit()
+            print("No matching file, waiting for creation.")
+        self.on_modified()
+
+    def discover(self, startup: bool = False):
+        """Follow files matching provided patterns and not followed yet.
+
+        Args:
+            startup (bool, optional): Apply startup options to found files ?
+                Defaults to False.
+        """
+
+        for pattern in self._patterns:
+            for path in sorted(glob(pattern)):
+                self.add_source(path, startup=startup)
+
+    def add_source(self, path: str, startup: bool = False):
+        """Follow a file, new files being read from their start.
+
+        Args:
+            path (str): Resolved file path
+            startup (bool, optional): Apply startup options ? Defaults to False.
+        """
+
+        if path in self._sources or not Path(path).is_file():
+            return
+        index = len(self._sources)
+        name = Path(path).name
+        if self.nocolors:
+            prefix = f"[{name}] "
+        else:
+            color = self.FILE_COLORS[index % len(self.FILE_COLORS)]
+            prefix = f"{color}[{name}]{Style.RESET_ALL} "
+        try:
+            source = _Source(
+                Path(path),
+                index,
+                prefix,
+                lines=self.lines if startup else None,
+                from_end=self.from_end and startup,
+                since=self.since if startup else None,
+                fields=self.fields,
+            )
+        except FileNotFoundError:
+            return
+        self._sources[path] = source
+
+    def iter_rows(self):
+        """Merge new records of all files with a heap based k-way merge and
+        process them.
+
+        Yields:
+            list: Printable lines
+        """
+
+        sources = list(self._sources.values())
+        merged = merge(
+            *(source.iter_records() for source in sources), key=itemgetter(0)
+        )
+        output = []
+        stats = self._stats
+        for count, (_, index, rows) in enumerate(merged, 1):
+            prefix = sources[index].prefix
+            shown = self.process_lines(rows)
+            if stats is not None:
+                stats["parsed"] += len(rows)
+                stats["shown"] += len(shown)
+            output += [prefix + row for row in shown]
+            if count % self.BATCH_SIZE == 0:
+                yield output
+                output = []
+        yield output
+
+    def dispatch(self, event):
+        """Filter events of watched directories to those concerning followed
+        files or new files matching provided patterns.
+
+        Args:
+            event (FileSystemEvent): Watchdog event
+        """
+
+        for path in (event.src_path, getattr(event, "dest_path", None)):
+            if path in self._sources:
+                self.on_modified()
+            elif path and any(fnmatch(path, pattern) for pattern in self._patterns):
+                self.add_source(path)
+                self.on_modified()
+
+    def signature(self):
+        """Get files state compared by the poller to detect changes, looking
+        for new matching files first.
+
+        Returns:
+            tuple: Followed files signatures
+        """
+
+        self.discover()
+        return tuple(source.signature() for source in list(self._sources.values()))
+
+
+class InteractiveReader(Reader):
+    """Reading handler keeping the last read lines in memory to page through
+    them, search them and change the level filter without reading the file
+    again.
+
+    Commands are read from the standard input:
+        - Enter or "f": Next page
+        - "b": Previous page
+        - "g": First page
+        - "G": Last page, following new lines
+        - "/text" or "?text": Search forward or backward, regex allowed
+        - "n" or "N": Repeat last search forward or backward
+        - "l LEVEL": Change minimum log level
+        - "q": Quit
+
+    Attributes:
+        CLEAR_SEQUENCE (str): ANSI sequence clearing terminal, cheaper than
+            `CLEAR_CMD` at every render
+        buffer (LineBuffer): Last read lines
+        page_size (int): Lines per page, from terminal height by default
+    """
+
+    CLEAR_SEQUENCE = "" if getenv("LIVELOG_ENV") == "TEST" else "\x1b[2J\x1b[H"
+
+    def __init__(self, *args, buffer_size: int = 100000, page_size: int = 0, **kwargs):
+        """Reader initialization.
+
+        Args:
+            buffer_size (int, optional): Count of last lines kept in memory.
+                Defaults to 100000.
+            page_size (int, optional): Lines per page, 0 for terminal height.
+                Defaults to 0.
+            *args, **kwargs: Other `Reader` options
+        """
+
+        self.buffer = LineBuffer(buffer_size)
+        self.page_size = page_size
+        # Position of the first printed line among visible ones, None when
+        # following new lines.
+        self._top = None
+        self._search = None
+        self._last_level = LineBuffer.NO_LEVEL
+        # Sequence numbers of stored lines at or above `_threshold`, extended
+        # as lines are read and only rebuilt on level change.
+        self._sequences = []
+        self._threshold = None
+        self._lock = RLock()
+        just_fix_windows_console()
+        super().__init__(*args, **kwargs)
+
+    def _visible_lines(self):
+        """Get stored lines at or above current level.
+
+        Returns:
+            list: Sequence numbers of visible lines, oldest first
+        """
+
+        threshold = self.LEVELS[self.level]
+        if threshold != self._threshold:
+            self._threshold = threshold
+            self._sequences = self.buffer.select(threshold)
+        else:
+            evicted = bisect_left(self._sequences, self.buffer.first)
+            if evicted:
+                del self._sequences[:evicted]
+        return self._sequences
+
+    def print_output(self):
+        """Store new lines and print last page if following them."""
+
+        levels = self.LEVELS
+        with self._lock:
+            buffer = self.buffer
+            visible = self._visible_lines()
+            threshold = self._threshold
+            last_level = self._last_level
+            for rows in iter(self.get_new_lines, None):
+                for row in rows:
+                    last_level = levels.get(row[:4], last_level)
+                    if last_level >= threshold:
+                        visible.append(buffer.total)
+                    buffer.append(last_level, row)
+                if self._stats is not None:
+                    self._stats["parsed"] += len(rows)
+                    self._stats["shown"] += len(rows)
+            self._last_level = last_level
+            if self._top is None:
+                self.show()
+
+    def show(self, message: str = ""):
+        """Print current page and status line.
+
+        Args:
+            message (str, optional): Message appended to status line.
+                Defaults to "".
+        """
+
+        with self._lock:
+            visible = self._visible_lines()
+            page_size = self.page_size or max(1, get_terminal_size().lines - 1)
+            last_top = max(0, len(visible) - page_size)
+            if self._top is None:
+                top = last_top
+            else:
+                top = self._top = max(0, min(self._top, last_top))
+
+            self._keep, self._color = True, ""
+            rows = self.process_lines(
+                [self.buffer.get(sequence) for sequence in visible[top : top + page_size]]
+            )
+            status = (
+                f"-- {top + 1 if visible else 0}-{min(top + page_size, len(visible))}"
+                f"/{len(visible)} {self.level}"
+                f"{' following' if self._top is None else ''} -- {message}"
+            )
+            print(self.CLEAR_SEQUENCE, end="")
+            print(self.render(rows) if rows else "", end="")
+            print(status if self.nocolors else f"{Style.DIM}{status}{Style.RESET_ALL}")
+
+    def command(self, command: str):
+        """Apply an interactive command.
+
+        Args:
+            command (str): Command to be applied
+
+        Returns:
+            bool: False if user asked to quit
+        """
+
+        with self._lock:
+            page_size = self.page_size or max(1, get_terminal_size().lines - 1)
+            visible = self._visible_lines()
+            last_top = max(0, len(visible) - page_size)
+            top = last_top if self._top is None else self._top
+            message = ""
+
+            if command == "q":
+                return False
+            elif command in ("", "f"):
+                # Follow new lines again once last page is reached.
+                self._top = top + page_size if top + page_size < last_top else None
+            elif command == "b":
+                self._top = max(0, top - page_size)
+            elif command == "g":
+                self._top = 0
+            elif command == "G":
+                self._top = None
+            elif command[:1] in ("/", "?") and command[1:]:
+                self._search = (command[1:], command[0] == "?")
+                message = self._find(top, *self._search)
+            elif command in ("n", "N") and self._search is not None:
+                pattern, backward = self._search
+                message = self._find(top, pattern, backward != (command == "N"))
+            elif command[:2] == "l ":
+                try:
+                    self.set_level(command[2:].strip())
+                    self._top = None
+                except LogLevelDoesNotExist:
+                    message = f"Unknown level {command[2:].strip()}"
+            else:
+                message = f"Unknown command {command}"
+
+            self.show(message)
+            return True
+
+    def _find(self, top: int, pattern: str, backward: bool):
+        """Move to next visible line matching a pattern.
+
+        Args:
+            top (int): Current first printed line position
+            pattern (str): Searched regex, or text if invalid
+            backward (bool): Search toward oldest lines ?
+
+        Returns:
+            str: Status message
+        """
+
+        try:
+            regex = compile(pattern.encode("utf-8"))
+        except error:
+            regex = compile(escape(pattern.encode("utf-8")))
+        visible = self._visible_lines()
+        position = self.buffer.search(
+            regex, visible, top - 1 if backward else top + 1, backward=backward
+        )
+        if position is None:
+            return f"Pattern not found: {pattern}"
+        self._top = position
+        return ""
+
+    def interact(self):
+        """Read and apply user commands until user quits."""
 
         if getenv("LIVELOG_ENV") == "TEST":
-            self.print_output()
+            sleep(2)
             _exit()
-
         while True:
-            self.print_output()
-            sleep(1)
+            try:
+                command = input("")
+            except EOFError:
+                return
+            if not self.command(command.strip()):
+                return
+
+
+def _last_lines_offset(mm: mmap, count: int):
+    """Find the offset of the last lines by scanning newlines backward.
+
+    Args:
+        mm (mmap): Mapped log file
+        count (int): Count of lines
+
+    Returns:
+        int: Offset of the first line
+    """
+
+    end = len(mm)
+    if count <= 0:
+        return end
+    if mm[end - 1 : end] == b"\n":
+        end -= 1
+    for _ in range(count):
+        end = mm.rfind(b"\n", 0, end)
+        if end < 0:
+            return 0
+
+    return end + 1
+
+
+def _record_time(mm: mmap, position: int):
+    """Find the first record starting at or after given position.
+
+    Args:
+        mm (mmap): Mapped log file
+        position (int): Offset to start from
+
+    Returns:
+        tuple: Record offset and HH:MM:SS.mmm time, None if no record is found
+    """
+
+    if position > 0:
+        position = mm.find(b"\n", position - 1) + 1
+        if position == 0:
+            return None
+
+    while position < len(mm):
+        end = mm.find(b"\n", position)
+        if end < 0:
+            end = len(mm)
+        if mm[position : position + 1] == b"{":
+            record = parse_json(mm[position:end].decode("utf-8", "replace"))
+            if record is not None:
+                return position, _TIMESTAMP_FORMATTER.format(record[1]).encode()
+        elif mm[position + 4 : position + 7] == b" | ":
+            separator = mm.find(b" - ", position + 7, end)
+            if separator >= 0:
+                # Keep time part of ISO 8601 timestamps.
+                time = mm[position + 7 : separator].rpartition(b"T")[2]
+                return position, time
+        position = end + 1
+
+    return None
+
+
+def _time_offset(mm: mmap, since: bytes):
+    """Binary search the first record logged at or after given time.
+
+    Args:
+        mm (mmap): Mapped log file
+        since (bytes): HH:MM:SS time, optionally with milliseconds
+
+    Returns:
+        int: Offset of the first record
+    """
+
+    low, high = 0, len(mm)
+    while low < high:
+        middle = (low + high) // 2
+        record = _record_time(mm, middle)
+        if record is None or record[1] >= since:
+            high = middle
+        else:
+            low = middle + 1
+
+    record = _record_time(mm, low)
+    return len(mm) if record is None else record[0]
 
 
-def start_reader(file: str, level: str, nocolors: bool):
+def _binary_records(mm: mmap, start: int):
+    """Iterate over binary records headers.
+
+    Args:
+        mm (mmap): Mapped log file
+        start (int): Offset of a record
+
+    Yields:
+        tuple: Record offset and epoch timestamp in nanoseconds
+    """
+
+    position = start
+    header_size = RECORD_HEADER.size
+    while position + header_size <= len(mm):
+        marker, _, timestamp, length = RECORD_HEADER.unpack_from(mm, position)
+        if marker != RECORD_MARKER:
+            position = mm.find(RECORD_MARKER, position + 1)
+            if position < 0:
+                return
+            continue
+        yield position, timestamp
+        position += header_size + length
+
+
+def _binary_last_records_offset(mm: mmap, count: int, index: list):
+    """Find the offset of the last binary records, scanning forward from the
+    closest index entry holding enough records.
+
+    Args:
+        mm (mmap): Mapped log file
+        count (int): Count of records
+        index (list): Sidecar index entries
+
+    Returns:
+        int: Offset of the first record
+    """
+
+    if count <= 0:
+        return len(mm)
+    for start in reversed([0] + [offset for _, offset in index]):
+        offsets = deque((offset for offset, _ in _binary_records(mm, start)), count)
+        if len(offsets) == count or start == 0:
+            return offsets[0] if offsets else len(mm)
+
+
+def _binary_time_offset(mm: mmap, since: bytes, index: list):
+    """Find the first binary record logged at or after given time, with a
+    binary search over the sidecar index and a scan from the found entry.
+
+    Args:
+        mm (mmap): Mapped log file
+        since (bytes): HH:MM:SS time, optionally with milliseconds
+        index (list): Sidecar index entries
+
+    Returns:
+        int: Offset of the first record
+    """
+
+    format = _TIMESTAMP_FORMATTER.format
+    times = [format(timestamp).encode() for timestamp, _ in index]
+    position = bisect_left(times, since)
+    start = index[position - 1][1] if position > 0 else 0
+    for offset, timestamp in _binary_records(mm, start):
+        if format(timestamp).encode() >= since:
+            return offset
+
+    return len(mm)
+
+
+def start_reader(
+    file: str,
+    level: str,
+    nocolors: bool,
+    refresh_rate: float = 30,
+    max_lines: int = 0,
+    lines: int = None,
+    from_end: bool = False,
+    since: str = None,
+    fields: dict = None,
+    grep: list = None,
+    exclude: list = None,
+    regex: list = None,
+    highlight: bool = False,
+    interactive: bool = False,
+    buffer_size: int = 100000,
+    poll: bool = False,
+    poll_interval: float = 0.1,
+    max_poll_interval: float = 2.0,
+    stats_interval: float = 0,
+    stats_file: str = None,
+):
     """Start reader process.
 
     Args:
-        file (str): File to be read
+        file (str): File to be read, or list of files or glob patterns to be
+            read together
         level (str): Minimum log level to be displayed
         nocolors (bool): If colors should not be printed
+        refresh_rate (float, optional): Maximum renders per second. Defaults to 30.
+        max_lines (int, optional): Maximum lines per render, 0 for no limit.
+            Defaults to 0.
+        lines (int, optional): Count of last lines printed at startup, None
+            for all. Defaults to None.
+        from_end (bool, optional): Skip preexisting content ? Defaults to False.
+        since (str, optional): Print records from this HH:MM:SS time at
+            startup. Defaults to None.
+        fields (dict, optional): Fields values JSON records must match.
+            Defaults to None.
+        grep (list, optional): Substrings, records must contain one of them or
+            match a regex. Defaults to None.
+        exclude (list, optional): Substrings, records containing one of them
+            are hidden. Defaults to None.
+        regex (list, optional): Regexes, records must match one of them or
+            contain a substring. Defaults to None.
+        highlight (bool, optional): Highlight matches ? Defaults to False.
+        interactive (bool, optional): Page through read lines with user
+            commands ? Only supported with a single file. Defaults to False.
+        buffer_size (int, optional): Count of last lines kept in memory in
+            interactive mode. Defaults to 100000.
+        poll (bool, optional): Poll files instead of watching filesystem
+            events ? Defaults to False.
+        poll_interval (float, optional): Minimum seconds between file checks
+            when polling. Defaults to 0.1.
+        max_poll_interval (float, optional): Maximum seconds between file
+            checks when polling an idle file. Defaults to 2.0.
+        stats_interval (float, optional): Dump reader stats every given
+            seconds, 0 to disable. Defaults to 0.
+        stats_file (str, optional): Stats dump file path, None for stderr.
+            Defaults to None.
     """
 
-    event_handler = Reader(file=file, level=level, nocolors=nocolors)
+    if isinstance(file, (list, tuple)):
+        handler, options = MultiReader, {"files": file}
+    elif interactive:
+        handler, options = InteractiveReader, {"file": file, "buffer_size": buffer_size}
+    else:
+        handler, options = Reader, {"file": file}
+    event_handler = handler(
+        **options,
+        level=level,
+        nocolors=nocolors,
+        refresh_rate=refresh_rate,
+        max_lines=max_lines,
+        lines=lines,
+        from_end=from_end,
+        since=since,
+        fields=fields,
+        grep=grep,
+        exclude=exclude,
+        regex=regex,
+        highlight=highlight,
+        poll_interval=poll_interval,
+        max_poll_interval=max_poll_interval,
+        stats=stats_interval > 0,
+        stats_interval=stats_interval,
+        stats_file=stats_file,
+    )
+    event_handler.start_rendering()
+    if poll:
+        _start_poller(event_handler)
+        return
+
     observer = Observer()
-    observer.schedule(event_handler, file, recursive=True)
+    # Watch parent directories to keep receiving events after a rotation.
+    if isinstance(event_handler, MultiReader):
+        directories = event_handler.directories
+    else:
+        directories = [str(Path(file).resolve().parent)]
+    for directory in directories:
+        observer.schedule(event_handler, directory, recursive=False)
     try:
         observer.start()
-        if getenv("LIVELOG_ENV") == "TEST":
-            sleep(2)
-            _exit()
-        else:
-            input("")
-        observer.stop()
-        observer.join()
     except OSError:
         # Handle "OSError: [Errno 24] inotify instance limit reached" exception
-        event_handler.loop_without_event()
+        _start_poller(event_handler)
+        return
+    _wait(event_handler)
+    observer.stop()
+    observer.join()
+
+
+def _start_poller(event_handler: Reader):
+    """Follow files by polling them until user exits.
+
+    Args:
+        event_handler (Reader): Reader to be polled
+    """
+
+    Thread(target=event_handler.poll, name="livelog-poll", daemon=True).start()
+    _wait(event_handler)
+
+
+def _wait(event_handler: Reader):
+    """Wait for user to exit.
+
+    Args:
+        event_handler (Reader): Running reader
+    """
+
+    if isinstance(event_handler, InteractiveReader):
+        event_handler.interact()
+        return
+    if getenv("LIVELOG_ENV") == "TEST":
+        sleep(2)
+        _exit()
+    input("")
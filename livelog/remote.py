@@ -0,0 +1,488 @@
+# -*- coding: utf-8 -*-
+"""Remote live tailing: a server following a log file and streaming its new
+records to connected clients, over TCP or a Unix socket.
+
+Protocol is newline separated UTF-8 text. A client first sends its minimum
+level, then receives matching lines. Lines dropped because the client could
+not keep up are replaced by a `DROPPED` prefixed line holding their count.
+
+Loggers can also bypass files and send records as datagrams to a listening
+reader, see `ListenReader`.
+"""
+
+from asyncio import Event, get_event_loop, open_connection, run, sleep, start_server
+from collections import deque
+from os import remove
+from pathlib import Path
+from .errors import AddressIsInvalid, LogLevelDoesNotExist
+from .formats import RECORD_MARKER, parse_binary
+from .network import DEFAULT_ADDRESS, datagram_socket, parse_address
+from .reader import Reader
+
+try:
+    from asyncio import open_unix_connection, start_unix_server
+except ImportError:
+    # Windows, only TCP is available.
+    open_unix_connection = start_unix_server = None
+
+DROPPED = "\x00"
+
+
+def _parse_stream_address(address: str):
+    """Parse a stream socket address.
+
+    Args:
+        address (str): HOST:PORT, or Unix socket path if it contains a slash
+
+    Raises:
+        AddressIsInvalid: If address is invalid, or is a path while Unix
+            sockets are unavailable
+
+    Returns:
+        tuple: Host and port, or socket path and None
+    """
+
+    host, port = parse_address(address)
+    if port is None and start_unix_server is None:
+        raise AddressIsInvalid(address)
+    return host, port
+
+
+class _Tail(Reader):
+    """Incremental reader producing uncolored lines, without printing."""
+
+    def start(self):
+        """Move cursor to the startup position if log file exists."""
+
+        self._path = str(Path(self.file).resolve())
+        if self.file_exists():
+            self.seek_start()
+
+
+class _Client:
+    """Connected client, with its level filter and a bounded buffer of
+    lines waiting to be sent.
+
+    Attributes:
+        dropped (int): Count of lines dropped since last send
+    """
+
+    def __init__(self, writer, level: str, buffer_size: int):
+        """Client initialization.
+
+        Args:
+            writer (StreamWriter): Client stream
+            level (str): Minimum log level, long or short format
+            buffer_size (int): Maximum count of lines waiting to be sent
+
+        Raises:
+            LogLevelDoesNotExist: If client provide an unknown log level
+        """
+
+        level = level.upper()
+        level = Reader.LONG_LEVEL_TO_SHORT.get(level, level)
+        if level not in Reader.LEVELS:
+            raise LogLevelDoesNotExist(level)
+        threshold = Reader.LEVELS[level]
+        self._visible = {
+            tag: value >= threshold for tag, value in Reader.LEVELS.items()
+        }
+        self._keep = True
+        self._writer = writer
+        self._lines = deque(maxlen=max(1, buffer_size))
+        self._ready = Event()
+        self.dropped = 0
+
+    def push(self, lines: list):
+        """Queue lines at or above client level, dropping oldest queued ones
+        if buffer is full.
+
+        Args:
+            lines (list): Uncolored lines
+        """
+
+        visible, keep = self._visible, self._keep
+        queue = self._lines
+        for line in lines:
+            keep = visible.get(line[:4], keep)
+            if keep:
+                if line[:1] == DROPPED:
+                    # Would be taken for a drop notice.
+                    line = line.lstrip(DROPPED)
+                if len(queue) == queue.maxlen:
+                    self.dropped += 1
+                queue.append(line)
+        self._keep = keep
+        if queue:
+            self._ready.set()
+
+    async def send(self):
+        """Send queued lines as they come, until client disconnects."""
+
+        writer = self._writer
+        while True:
+            await self._ready.wait()
+            self._ready.clear()
+            lines = list(self._lines)
+            self._lines.clear()
+            if self.dropped:
+                lines.insert(0, f"{DROPPED}{self.dropped}\n")
+                self.dropped = 0
+            writer.write("".join(lines).encode("utf-8"))
+            await writer.drain()
+
+    def close(self):
+        """Disconnect client."""
+
+        self._writer.close()
+
+
+class LogServer:
+    """Server following a log file and streaming its new records to any
+    number of clients.
+
+    The file is polled from the event loop with the incremental reader, and
+    each batch of new lines is filtered on each client level before being
+    queued. Every client is sent its lines by its own task, so a slow client
+    only fills its own buffer, oldest lines being dropped.
+
+    Attributes:
+        address (str): HOST:PORT or Unix socket path
+        buffer_size (int): Maximum count of lines waiting for a client
+        poll_interval (float): Seconds between file checks
+    """
+
+    def __init__(
+        self,
+        file: str,
+        address: str = DEFAULT_ADDRESS,
+        level: str = "DEBUG",
+        buffer_size: int = 10000,
+        poll_interval: float = 0.1,
+        **options,
+    ):
+        """LogServer initialization.
+
+        Args:
+            file (str): Path of file to follow
+            address (str, optional): HOST:PORT or Unix socket path to listen
+                on. Defaults to DEFAULT_ADDRESS.
+            level (str, optional): Minimum log level of every client.
+                Defaults to "DEBUG".
+            buffer_size (int, optional): Maximum count of lines waiting for a
+                client. Defaults to 10000.
+            poll_interval (float, optional): Seconds between file checks.
+                Defaults to 0.1.
+            **options: Other `Reader` filtering and startup options
+
+        Raises:
+            AddressIsInvalid: If address is invalid
+        """
+
+        self.address = address
+        self._host, self._port = _parse_stream_address(address)
+        self.buffer_size = buffer_size
+        self.poll_interval = max(poll_interval, Reader.MIN_POLL_INTERVAL)
+        self._tail = _Tail(file=Path(file), level=level, nocolors=True, **options)
+        self._clients = set()
+        self._server = None
+
+    async def start(self):
+        """Start listening and following log file."""
+
+        if self._port is None:
+            self._server = await start_unix_server(self._accept, self._host)
+        else:
+            self._server = await start_server(self._accept, self._host, self._port)
+        get_event_loop().create_task(self._follow())
+
+    async def serve_forever(self):
+        """Start server and run until cancelled."""
+
+        await self.start()
+        await self._server.serve_forever()
+
+    async def close(self):
+        """Stop listening and disconnect clients."""
+
+        self._server.close()
+        for client in list(self._clients):
+            client.close()
+        await self._server.wait_closed()
+
+    async def _follow(self):
+        """Read new lines whenever log file changes and queue them for
+        clients.
+        """
+
+        last = None
+        tail = self._tail
+        while self._server.is_serving():
+            current = tail.signature()
+            if current != last:
+                last = current
+                if current is not None:
+                    for rows in tail.iter_rows():
+                        for client in self._clients:
+                            client.push(rows)
+                        # Let connections and sends proceed between chunks.
+                        await sleep(0)
+            await sleep(self.poll_interval)
+
+    async def _accept(self, reader, writer):
+        """Register a client once it has sent its level, and send it lines
+        until it disconnects.
+
+        Args:
+            reader (StreamReader): Client input stream
+            writer (StreamWriter): Client output stream
+        """
+
+        line = await reader.readline()
+        if not line:
+            writer.close()
+            return
+        try:
+            level = line.decode("utf-8", "replace").strip() or "DEBUG"
+            client = _Client(writer, level, self.buffer_size)
+        except LogLevelDoesNotExist as e:
+            writer.write(f"{e}\n".encode("utf-8"))
+            writer.close()
+            return
+
+        self._clients.add(client)
+        try:
+            await client.send()
+        except ConnectionError:
+            pass
+        finally:
+            self._clients.discard(client)
+            writer.close()
+
+
+class RemoteReader(Reader):
+    """Reading handler rendering lines streamed by a `LogServer`, like
+    `Reader` renders file content.
+
+    Attributes:
+        address (str): Server HOST:PORT or Unix socket path
+    """
+
+    def __init__(
+        self,
+        address: str,
+        level: str,
+        nocolors: bool,
+        max_lines: int = 0,
+        grep: list = None,
+        exclude: list = None,
+        regex: list = None,
+        highlight: bool = False,
+    ):
+        """RemoteReader initialization.
+
+        Args:
+            address (str): Server HOST:PORT or Unix socket path
+            level (str): Minimum log level to be displayed, applied by the
+                server
+            nocolors (bool): If colors should not be printed
+            max_lines (int, optional): Maximum lines per render, 0 for no
+                limit. Defaults to 0.
+            grep (list, optional): Substrings, records must contain one of
+                them or match a regex. Defaults to None.
+            exclude (list, optional): Substrings, records containing one of
+                them are hidden. Defaults to None.
+            regex (list, optional): Regexes, records must match one of them or
+                contain a substring. Defaults to None.
+            highlight (bool, optional): Highlight matches ? Defaults to False.
+
+        Raises:
+            AddressIsInvalid: If address is invalid
+            LogLevelDoesNotExist: If user provide an unknown log level
+        """
+
+        self.address = address
+        self._host, self._port = _parse_stream_address(address)
+        if level.upper() not in self.LONG_LEVEL_TO_SHORT:
+            raise LogLevelDoesNotExist(level.upper())
+        self.set_level(level)
+        self.nocolors = nocolors
+        self._keep = True
+        self._color = ""
+        self.max_lines = max_lines
+        self.highlight = highlight
+        self.set_patterns(grep=grep, exclude=exclude, regex=regex)
+        self.fields = {}
+        self._stats = None
+        self._partial = b""
+        self._received = None
+
+    def get_new_lines(self):
+        """Get last received lines.
+
+        Returns:
+            list: Received lines, None if they have already been returned
+        """
+
+        rows, self._received = self._received, None
+        return rows
+
+    async def connect(self):
+        """Connect to server and print received lines until it disconnects."""
+
+        if self._port is None:
+            reader, writer = await open_unix_connection(self._host)
+        else:
+            reader, writer = await open_connection(self._host, self._port)
+        writer.write(f"{self.level}\n".encode("utf-8"))
+        await writer.drain()
+        try:
+            while True:
+                chunk = await reader.read(self.CHUNK_SIZE)
+                if not chunk:
+                    return
+                self.receive(chunk)
+        finally:
+            writer.close()
+
+    def receive(self, chunk: bytes):
+        """Print lines completed by received data.
+
+        Args:
+            chunk (bytes): Received data
+        """
+
+        data = self._partial + chunk
+        end = data.rfind(b"\n") + 1
+        self._partial = data[end:]
+        if end == 0:
+            return
+
+        rows = []
+        text = data[:end].decode("utf-8", "replace")
+        for row in text[:-1].split("\n"):
+            if row[:1] != DROPPED or not row[1:].isdigit():
+                rows.append(row + "\n")
+                continue
+            self._show(rows)
+            rows = []
+            print(self.render_skipped(int(row[1:])), end="", flush=True)
+        self._show(rows)
+
+    def _show(self, rows: list):
+        """Print lines through the regular output process.
+
+        Args:
+            rows (list): Received lines
+        """
+
+        if rows:
+            self._received = rows
+            self.print_output()
+
+
+class ListenReader(RemoteReader):
+    """Reading handler rendering records sent as datagrams by loggers with a
+    `socket` address, over a Unix domain socket or UDP.
+
+    Each datagram holds complete records, in any logger format. Datagrams
+    already received are rendered together, without waiting for more.
+
+    Attributes:
+        address (str): HOST:PORT or Unix socket path to listen on
+        MAX_DATAGRAM_SIZE (int): Maximum size of a received datagram
+        BATCH_SIZE (int): Maximum count of datagrams rendered at once
+    """
+
+    MAX_DATAGRAM_SIZE = 262144
+    BATCH_SIZE = 1024
+
+    def listen(self):
+        """Receive and print records until interrupted."""
+
+        sock = datagram_socket(self.address, bind=True)
+        buffer = bytearray(self.MAX_DATAGRAM_SIZE)
+        view = memoryview(buffer)
+        try:
+            while True:
+                sock.setblocking(True)
+                datagrams = [bytes(view[: sock.recv_into(buffer)])]
+                sock.setblocking(False)
+                try:
+                    while len(datagrams) < self.BATCH_SIZE:
+                        datagrams.append(bytes(view[: sock.recv_into(buffer)]))
+                except BlockingIOError:
+                    pass
+                self._show(self.convert(datagrams))
+        finally:
+            sock.close()
+            if self._port is None:
+                remove(self._host)
+
+    def convert(self, datagrams: list):
+        """Convert received records to text lines.
+
+        Args:
+            datagrams (list): Received datagrams
+
+        Returns:
+            list: Lines
+        """
+
+        rows = []
+        for data in datagrams:
+            if data[:1] == RECORD_MARKER:
+                rows += self.convert_binary(parse_binary(data)[0])
+                continue
+            text = data.decode("utf-8", "replace")
+            lines = [line + "\n" for line in text.rstrip("\n").split("\n")]
+            if text[:1] == "{":
+                lines = self.convert_json(lines)
+            rows += lines
+        return rows
+
+
+def serve(file: str, address: str = DEFAULT_ADDRESS, **options):
+    """Run a log server until interrupted.
+
+    Args:
+        file (str): Path of file to follow
+        address (str, optional): HOST:PORT or Unix socket path to listen on.
+            Defaults to DEFAULT_ADDRESS.
+        **options: Other `LogServer` options
+    """
+
+    try:
+        run(LogServer(file, address, **options).serve_forever())
+    except KeyboardInterrupt:
+        pass
+
+
+def connect(address: str = DEFAULT_ADDRESS, **options):
+    """Print lines streamed by a log server until it disconnects or user
+    interrupts.
+
+    Args:
+        address (str, optional): Server HOST:PORT or Unix socket path.
+            Defaults to DEFAULT_ADDRESS.
+        **options: Other `RemoteReader` options
+    """
+
+    try:
+        run(RemoteReader(address, **options).connect())
+    except KeyboardInterrupt:
+        pass
+
+
+def listen(address: str, **options):
+    """Print records sent by loggers to given address until user interrupts.
+
+    Args:
+        address (str): HOST:PORT or Unix socket path to listen on
+        **options: Other `ListenReader` options
+    """
+
+    try:
+        ListenReader(address, **options).listen()
+    except KeyboardInterrupt:
+        pass
@@ -0,0 +1,56 @@
+# -*- coding: utf-8 -*-
+
+from json import dumps
+from sys import stderr
+from threading import Event, Thread
+from time import time
+
+
+class StatsDumper(Thread):
+    """Background thread periodically appending stats as JSON lines to a
+    file or to stderr.
+
+    Attributes:
+        interval (float): Seconds between dumps
+        file (str): Output file path, None for stderr
+    """
+
+    def __init__(self, stats, interval: float, file: str = None):
+        """StatsDumper initialization.
+
+        Args:
+            stats (function): Function returning stats to be dumped
+            interval (float): Seconds between dumps
+            file (str, optional): Output file path, None for stderr.
+                Defaults to None.
+        """
+
+        super().__init__(name="livelog-stats", daemon=True)
+        self.interval = interval
+        self.file = file
+        self._stats = stats
+        self._stopped = Event()
+
+    def run(self):
+        """Dump stats every `interval` seconds until stopped."""
+
+        while not self._stopped.wait(self.interval):
+            self.dump()
+
+    def stop(self):
+        """Stop dumping and dump final stats."""
+
+        if not self._stopped.is_set():
+            self._stopped.set()
+            self.dump()
+
+    def dump(self):
+        """Write current stats."""
+
+        line = dumps({"time": time(), **self._stats()}) + "\n"
+        if self.file is None:
+            stderr.write(line)
+            stderr.flush()
+            return
+        with open(self.file, "a") as f:
+            f.write(line)
@@ -0,0 +1,81 @@
+# -*- coding: utf-8 -*-
+
+from time import localtime, monotonic_ns, strftime, time_ns
+from .errors import ClockDoesNotExist, TimestampFormatDoesNotExist
+
+
+class TimestampFormatter:
+    """Record timestamp formatter.
+
+    The date and time part of the timestamp is only formatted once per second,
+    other calls only format milliseconds.
+
+    Attributes:
+        CLOCKS (tuple): Available clocks, "time_ns" follows system time while
+            "monotonic" starts from system time and is then immune to system
+            time changes
+        FORMATS (dict): Available formats and their second resolution pattern
+
+    Raises:
+        ClockDoesNotExist: If user provide an unknown clock
+        TimestampFormatDoesNotExist: If user provide an unknown format
+    """
+
+    CLOCKS = ("time_ns", "monotonic")
+    FORMATS = {
+        "time": "%H:%M:%S.",
+        "iso": "%Y-%m-%dT%H:%M:%S.",
+    }
+
+    def __init__(self, clock: str = "time_ns", format: str = "time"):
+        """TimestampFormatter initialization.
+
+        Args:
+            clock (str, optional): Clock to be used. Defaults to "time_ns".
+            format (str, optional): Timestamp format, "time" for HH:MM:SS.mmm
+                or "iso" for ISO 8601 date and time. Defaults to "time".
+        """
+
+        clock = clock.lower()
+        if clock not in self.CLOCKS:
+            raise ClockDoesNotExist(clock)
+        format = format.lower()
+        if format not in self.FORMATS:
+            raise TimestampFormatDoesNotExist(format)
+
+        if clock == "monotonic":
+            offset = time_ns() - monotonic_ns()
+            self.clock = lambda: monotonic_ns() + offset
+        else:
+            self.clock = time_ns
+        self._pattern = self.FORMATS[format]
+        # Second and its formatted prefix, stored together so concurrent
+        # callers never see them out of sync.
+        self._cache = (None, "")
+
+    def __call__(self):
+        """Format current time.
+
+        Returns:
+            str: Formatted timestamp
+        """
+
+        return self.format(self.clock())
+
+    def format(self, timestamp: int):
+        """Format provided timestamp.
+
+        Args:
+            timestamp (int): Epoch timestamp in nanoseconds
+
+        Returns:
+            str: Formatted timestamp
+        """
+
+        second, remainder = divmod(timestamp, 1_000_000_000)
+        cached_second, prefix = self._cache
+        if second != cached_second:
+            prefix = strftime(self._pattern, localtime(second))
+            self._cache = (second, prefix)
+
+        return f"{prefix}{remainder // 1_000_000:03d}"
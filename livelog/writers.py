@@ -0,0 +1,1032 @@
+# -*- coding: utf-8 -*-
+
+import os
+from os import stat, fstat
+from gzip import open as gzip_open
+from shutil import copyfileobj
+from time import monotonic, time
+from atexit import register
+from collections import deque
+from threading import Condition, Lock, Thread, Timer
+from weakref import WeakSet
+from errno import EMSGSIZE
+from .errors import OverflowPolicyDoesNotExist
+from .compression import Compressor
+from .network import datagram_socket
+from .formats import INDEX_ENTRY, RECORD_HEADER
+
+try:
+    from fcntl import flock, LOCK_EX, LOCK_NB, LOCK_SH, LOCK_UN
+except ImportError:
+    # Windows, only the atomic append part of AtomicWriter is available.
+    flock = None
+
+_open_writers = WeakSet()
+_APPEND_FLAGS = os.O_WRONLY | os.O_APPEND | os.O_CREAT | getattr(os, "O_BINARY", 0)
+
+
+@register
+def _close_open_writers():
+    """Flush and close every writer still holding a file at interpreter
+    shutdown.
+    """
+
+    for writer in list(_open_writers):
+        writer.close()
+
+
+class FileWriter:
+    """Default writer, open the log file, append a record and close it.
+
+    Each record is appended with a single `os.write` call on an `O_APPEND`
+    descriptor so records written by concurrent threads never interleave,
+    without any lock.
+
+    Attributes:
+        path (Path): Log file path
+        dropped (int): Count of records dropped instead of being written
+        flushes (int): Count of buffered records writes to log file
+    """
+
+    dropped = 0
+    flushes = 0
+    # Whether the file is written by other processes.
+    shared = False
+
+    def __init__(self, path):
+        """FileWriter initialization.
+
+        Args:
+            path (Path): Log file path
+        """
+
+        self.path = path
+
+    def write(self, data: bytes):
+        """Append provided data to log file.
+
+        Args:
+            data (bytes): Formatted record(s)
+        """
+
+        fd = os.open(self.path, _APPEND_FLAGS, 0o644)
+        try:
+            os.write(fd, data)
+        finally:
+            os.close(fd)
+
+    def flush(self):
+        """Records are written immediately, nothing to flush."""
+
+    def close(self):
+        """No file handle is kept open, nothing to close."""
+
+    def size(self):
+        """Get log file current size.
+
+        Returns:
+            int: Size in bytes
+        """
+
+        try:
+            return stat(self.path).st_size
+        except FileNotFoundError:
+            return 0
+
+    def rotate(self, rotate):
+        """Release log file while it is rotated.
+
+        Args:
+            rotate (function): Function moving log file away
+        """
+
+        rotate()
+
+
+class BufferedWriter(FileWriter):
+    """Writer keeping the log file open and buffering records.
+
+    Buffer is written once it reaches `buffer_size` bytes or
+    `flush_interval` seconds after its first record. The file is reopened if
+    it has been renamed or deleted (e.g. by log rotation) since last write.
+
+    Attributes:
+        path (Path): Log file path
+        buffer_size (int): Buffered bytes count triggering a flush
+        flush_interval (float): Maximum delay before buffered records are
+            written, 0 to only flush on size or close
+    """
+
+    def __init__(self, path, buffer_size: int = 8192, flush_interval: float = 1.0):
+        """BufferedWriter initialization.
+
+        Args:
+            path (Path): Log file path
+            buffer_size (int, optional): Buffer size. Defaults to 8192.
+            flush_interval (float, optional): Flush interval in seconds.
+                Defaults to 1.0.
+        """
+
+        super().__init__(path)
+        self.buffer_size = buffer_size
+        self.flush_interval = flush_interval
+
+        self.flushes = 0
+        self._buffer = []
+        self._buffered = 0
+        self._handle = None
+        self._inode = None
+        self._timer = None
+        self._lock = Lock()
+
+    def write(self, data: bytes):
+        """Buffer provided data and flush if needed.
+
+        Args:
+            data (bytes): Formatted record(s)
+        """
+
+        with self._lock:
+            if not self._buffer:
+                # Buffered records are written at exit even if the file has
+                # never been opened.
+                _open_writers.add(self)
+            self._buffer.append(data)
+            self._buffered += len(data)
+            if self._buffered >= self.buffer_size:
+                self._flush()
+            elif self._timer is None and self.flush_interval > 0:
+                self._timer = Timer(self.flush_interval, self.flush)
+                self._timer.daemon = True
+                self._timer.start()
+
+    def flush(self):
+        """Write buffered records to log file."""
+
+        with self._lock:
+            self._flush()
+
+    def close(self):
+        """Flush buffered records and close log file."""
+
+        with self._lock:
+            self._flush()
+            if self._handle is not None:
+                self._handle.close()
+                self._handle = None
+            _open_writers.discard(self)
+
+    def rotate(self, rotate):
+        """Write buffered records and close log file while it is rotated.
+
+        Args:
+            rotate (function): Function moving log file away
+        """
+
+        with self._lock:
+            self._flush()
+            if self._handle is not None:
+                self._handle.close()
+                self._handle = None
+            rotate()
+
+    def _flush(self):
+        """Write buffered records, caller must hold the lock."""
+
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if not self._buffer:
+            return
+
+        handle = self._open()
+        handle.write(b"".join(self._buffer))
+        handle.flush()
+        self.flushes += 1
+        self._buffer.clear()
+        self._buffered = 0
+
+    def _open(self):
+        """Get an handle on current log file, reopening it if the path now
+        points to another file.
+
+        Returns:
+            BufferedWriter: Log file handle
+        """
+
+        if self._handle is not None:
+            try:
+                if stat(self.path).st_ino == self._inode:
+                    return self._handle
+            except FileNotFoundError:
+                pass
+            self._handle.close()
+
+        self._handle = open(self.path, "ab")
+        self._inode = fstat(self._handle.fileno()).st_ino
+        _open_writers.add(self)
+        return self._handle
+
+
+class CompressedWriter(BufferedWriter):
+    """Buffered writer compressing records in a single stream.
+
+    Every buffer flush is a sync point, data written so far being decodable
+    even if the stream is not finished yet. The stream is finished when the
+    file is closed or rotated, a new one being started in the new file.
+
+    Attributes:
+        path (Path): Log file path
+        compression (str): Compression, "gzip" or "zstd"
+    """
+
+    def __init__(
+        self,
+        path,
+        compression: str = "gzip",
+        buffer_size: int = 8192,
+        flush_interval: float = 1.0,
+    ):
+        """CompressedWriter initialization.
+
+        Args:
+            path (Path): Log file path
+            compression (str, optional): Compression. Defaults to "gzip".
+            buffer_size (int, optional): Buffer size. Defaults to 8192.
+            flush_interval (float, optional): Flush interval in seconds.
+                Defaults to 1.0.
+        """
+
+        super().__init__(path, buffer_size=buffer_size, flush_interval=flush_interval)
+        self.compression = compression
+        self._compressor = Compressor(compression)
+
+    def close(self):
+        """Flush buffered records, finish stream and close log file."""
+
+        with self._lock:
+            self._flush()
+            self._finish()
+            _open_writers.discard(self)
+
+    def rotate(self, rotate):
+        """Write buffered records and finish stream while log file is rotated.
+
+        Args:
+            rotate (function): Function moving log file away
+        """
+
+        with self._lock:
+            self._flush()
+            self._finish()
+            rotate()
+
+    def _flush(self):
+        """Compress and write buffered records up to a sync point, caller
+        must hold the lock.
+        """
+
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if not self._buffer:
+            return
+
+        handle = self._open()
+        compressor = self._compressor
+        handle.write(compressor.compress(b"".join(self._buffer)) + compressor.sync())
+        handle.flush()
+        self.flushes += 1
+        self._buffer.clear()
+        self._buffered = 0
+
+    def _finish(self):
+        """End stream and close log file, caller must hold the lock."""
+
+        if self._handle is None:
+            return
+        self._handle.write(self._compressor.finish())
+        self._handle.close()
+        self._handle = None
+        self._compressor = Compressor(self.compression)
+
+    def _open(self):
+        """Get an handle on current log file, starting a new stream if the
+        file has been replaced.
+
+        Returns:
+            BufferedWriter: Log file handle
+        """
+
+        handle = self._handle
+        new_handle = super()._open()
+        if handle is not None and new_handle is not handle:
+            self._compressor = Compressor(self.compression)
+        return new_handle
+
+
+class ThreadedWriter(FileWriter):
+    """Writer handing records to a background thread through a bounded queue.
+
+    The thread drains the queue by batches and writes them with a target
+    writer, which is flushed every time the queue gets empty.
+
+    Attributes:
+        OVERFLOW_POLICIES (tuple): Available behaviors when queue is full
+        path (Path): Log file path
+        queue_size (int): Maximum count of queued records
+        overflow (str): Behavior when queue is full, either block caller until
+            space is available, drop oldest queued record or drop new record
+        dropped (int): Count of dropped records
+
+    Raises:
+        OverflowPolicyDoesNotExist: If user provide an unknown overflow policy
+    """
+
+    OVERFLOW_POLICIES = ("block", "drop_oldest", "drop_newest")
+
+    def __init__(
+        self,
+        path,
+        target: FileWriter,
+        queue_size: int = 10000,
+        overflow: str = "block",
+    ):
+        """ThreadedWriter initialization.
+
+        Args:
+            path (Path): Log file path
+            target (FileWriter): Writer used by the background thread
+            queue_size (int, optional): Maximum queued records. Defaults to 10000.
+            overflow (str, optional): Overflow policy. Defaults to "block".
+        """
+
+        super().__init__(path)
+        overflow = overflow.lower()
+        if overflow not in self.OVERFLOW_POLICIES:
+            raise OverflowPolicyDoesNotExist(overflow)
+        self.queue_size = queue_size
+        self.overflow = overflow
+        self.dropped = 0
+
+        self._target = target
+        self._queue = deque()
+        # Queued records and records being written by the thread.
+        self._pending = 0
+        self._closed = False
+        self._condition = Condition()
+        self._thread = Thread(target=self._run, name="livelog-writer", daemon=True)
+        self._thread.start()
+        _open_writers.add(self)
+
+    @property
+    def flushes(self):
+        return self._target.flushes
+
+    def write(self, data: bytes):
+        """Queue provided data, applying overflow policy if queue is full.
+
+        Args:
+            data (bytes): Formatted record(s)
+        """
+
+        with self._condition:
+            if self._closed:
+                self._target.write(data)
+                return
+            if len(self._queue) >= self.queue_size:
+                if self.overflow == "drop_newest":
+                    self.dropped += 1
+                    return
+                if self.overflow == "drop_oldest":
+                    self._queue.popleft()
+                    self._pending -= 1
+                    self.dropped += 1
+                else:
+                    while len(self._queue) >= self.queue_size:
+                        self._condition.wait()
+            self._queue.append(data)
+            self._pending += 1
+            self._condition.notify_all()
+
+    def flush(self):
+        """Wait for every queued record to be written."""
+
+        with self._condition:
+            while self._pending:
+                self._condition.wait()
+        self._target.flush()
+
+    def close(self):
+        """Write queued records, stop background thread and close target."""
+
+        with self._condition:
+            if self._closed:
+                return
+            while self._pending:
+                self._condition.wait()
+            self._closed = True
+            self._condition.notify_all()
+        self._thread.join()
+        self._target.close()
+        _open_writers.discard(self)
+
+    def _run(self):
+        """Background thread loop, write queued records by batches."""
+
+        while True:
+            with self._condition:
+                while not self._queue and not self._closed:
+                    self._condition.wait()
+                if self._closed and not self._queue:
+                    return
+                batch = list(self._queue)
+                self._queue.clear()
+                self._condition.notify_all()
+
+            try:
+                self._target.write(b"".join(batch))
+                if not self._queue:
+                    self._target.flush()
+            except OSError:
+                self.dropped += len(batch)
+
+            with self._condition:
+                self._pending -= len(batch)
+                self._condition.notify_all()
+
+
+class AtomicWriter(FileWriter):
+    """Writer safe to share a log file between processes.
+
+    Each record is appended with a single `os.write` call on an `O_APPEND`
+    descriptor so concurrent records never interleave. Records larger than
+    `max_record_size` bytes are truncated to keep writes small enough to be
+    atomic, batches are split on record boundaries.
+
+    Preexisting content is erased only by the first process opening the file:
+    every process holds a shared lock on a `.lock` file next to the log file
+    for its whole lifetime, a process able to take an exclusive lock on it
+    knows it is alone.
+
+    The log file is reopened if another process rotated it, this is checked
+    at most once per second.
+
+    Attributes:
+        path (Path): Log file path
+        max_record_size (int): Maximum record size in bytes
+        text (bool): If records are newline terminated, size guard is only
+            applied to text records
+    """
+
+    shared = True
+
+    def __init__(
+        self,
+        path,
+        erase: bool = True,
+        max_record_size: int = 65536,
+        text: bool = True,
+    ):
+        """AtomicWriter initialization.
+
+        Args:
+            path (Path): Log file path
+            erase (bool, optional): Erase preexisting content if first
+                process. Defaults to True.
+            max_record_size (int, optional): Maximum record size in bytes.
+                Defaults to 65536.
+            text (bool, optional): Are records newline terminated ? Defaults to True.
+        """
+
+        super().__init__(path)
+        self.max_record_size = max_record_size
+        self.text = text
+
+        self._fd = self._open()
+        self._next_check = monotonic() + 1
+        self._lock_fd = None
+        if flock is None:
+            if erase:
+                os.ftruncate(self._fd, 0)
+            return
+
+        # Exclusive lock on the log file itself serializes initializations.
+        flock(self._fd, LOCK_EX)
+        try:
+            self._lock_fd = os.open(f"{path}.lock", os.O_RDWR | os.O_CREAT, 0o644)
+            try:
+                flock(self._lock_fd, LOCK_EX | LOCK_NB)
+                first = True
+            except BlockingIOError:
+                first = False
+            if first and erase:
+                os.ftruncate(self._fd, 0)
+            flock(self._lock_fd, LOCK_SH)
+        finally:
+            flock(self._fd, LOCK_UN)
+
+    def write(self, data: bytes):
+        """Append provided data to log file, one `os.write` per chunk of
+        records.
+
+        Args:
+            data (bytes): Formatted record(s)
+        """
+
+        self._ensure_open()
+        if monotonic() >= self._next_check:
+            self._next_check = monotonic() + 1
+            if self._moved():
+                self._reopen()
+
+        if len(data) <= self.max_record_size or not self.text:
+            os.write(self._fd, data)
+            return
+
+        chunk = b""
+        for record in data.splitlines(keepends=True):
+            if len(record) > self.max_record_size:
+                record = record[: self.max_record_size - 1] + b"\n"
+            if len(chunk) + len(record) > self.max_record_size:
+                os.write(self._fd, chunk)
+                chunk = b""
+            chunk += record
+        if chunk:
+            os.write(self._fd, chunk)
+
+    def size(self):
+        """Get log file current size, including other processes writes.
+
+        Returns:
+            int: Size in bytes
+        """
+
+        self._ensure_open()
+        return fstat(self._fd).st_size
+
+    def rotate(self, rotate):
+        """Rotate log file unless another process already did.
+
+        Args:
+            rotate (function): Function moving log file away
+        """
+
+        self._ensure_open()
+        if flock is not None:
+            flock(self._fd, LOCK_EX)
+        try:
+            if not self._moved():
+                rotate()
+        finally:
+            if flock is not None:
+                flock(self._fd, LOCK_UN)
+        self._reopen()
+
+    def _open(self):
+        """Open log file in append mode.
+
+        Returns:
+            int: File descriptor
+        """
+
+        return os.open(self.path, _APPEND_FLAGS, 0o644)
+
+    def _ensure_open(self):
+        """Open log file and take shared lock again if writer has been
+        closed, as records may still come after, like from exit hooks.
+        """
+
+        if self._fd is not None:
+            return
+        self._fd = self._open()
+        self._next_check = monotonic() + 1
+        if flock is not None:
+            self._lock_fd = os.open(f"{self.path}.lock", os.O_RDWR | os.O_CREAT, 0o644)
+            flock(self._lock_fd, LOCK_SH)
+
+    def _reopen(self):
+        """Replace file descriptor with a new one on current log file."""
+
+        fd = self._open()
+        os.close(self._fd)
+        self._fd = fd
+
+    def _moved(self):
+        """Check if log file path now points to another file.
+
+        Returns:
+            bool: Log file has been moved
+        """
+
+        try:
+            return stat(self.path).st_ino != fstat(self._fd).st_ino
+        except FileNotFoundError:
+            return True
+
+    def close(self):
+        """Close log file descriptor and release lock file."""
+
+        for fd in (self._fd, self._lock_fd):
+            if fd is not None:
+                os.close(fd)
+        self._fd = self._lock_fd = None
+
+
+class RotatingWriter(FileWriter):
+    """Writer rotating log file once it reaches a maximum size or a time
+    interval has elapsed.
+
+    Rotated files are renamed `<file>.1`, `<file>.2` and so on, `<file>.1`
+    being the most recent. Time based rotations are aligned on multiples of
+    the interval since epoch, so processes sharing a file agree on when to
+    rotate.
+
+    A rotation failing because the log file cannot be renamed, like on
+    Windows while another process or a reader holds it open, is skipped and
+    retried after `RETRY_INTERVAL` seconds, records being appended to the
+    current file meanwhile.
+
+    Attributes:
+        RETRY_INTERVAL (float): Seconds before retrying a failed rotation
+        path (Path): Log file path
+        max_bytes (int): Size triggering a rotation, 0 to disable
+        interval (float): Seconds between rotations, 0 to disable
+        backup_count (int): Maximum count of rotated files kept
+        compress (bool): If rotated files should be gzipped, from a background
+            thread
+    """
+
+    RETRY_INTERVAL = 1.0
+
+    def __init__(
+        self,
+        path,
+        target: FileWriter,
+        max_bytes: int = 0,
+        interval: float = 0,
+        backup_count: int = 5,
+        compress: bool = False,
+    ):
+        """RotatingWriter initialization.
+
+        Args:
+            path (Path): Log file path
+            target (FileWriter): Writer of current log file
+            max_bytes (int, optional): Maximum size. Defaults to 0.
+            interval (float, optional): Rotation interval. Defaults to 0.
+            backup_count (int, optional): Rotated files kept. Defaults to 5.
+            compress (bool, optional): Gzip rotated files. Defaults to False.
+        """
+
+        super().__init__(path)
+        self.max_bytes = max_bytes
+        self.interval = interval
+        self.backup_count = backup_count
+        self.compress = compress
+
+        self._target = target
+        self._size = target.size()
+        try:
+            self._period = self._get_period(stat(path).st_mtime)
+        except FileNotFoundError:
+            self._period = self._get_period(time())
+        self._compressor = None
+        self._next_attempt = 0
+        self._lock = Lock()
+
+    @property
+    def dropped(self):
+        return self._target.dropped
+
+    @property
+    def flushes(self):
+        return self._target.flushes
+
+    def write(self, data: bytes):
+        """Rotate log file if needed and write provided data.
+
+        Args:
+            data (bytes): Formatted record(s)
+        """
+
+        with self._lock:
+            if self._should_rotate(len(data)):
+                try:
+                    self._target.rotate(self._rotate)
+                except PermissionError:
+                    self._next_attempt = monotonic() + self.RETRY_INTERVAL
+                else:
+                    self._size = self._target.size()
+                    self._period = self._get_period(time())
+            self._target.write(data)
+            self._size += len(data)
+
+    def flush(self):
+        """Flush target writer."""
+
+        self._target.flush()
+
+    def close(self):
+        """Close target writer and wait for pending compression."""
+
+        self._target.close()
+        if self._compressor is not None:
+            self._compressor.join()
+
+    def _get_period(self, timestamp: float):
+        """Get the rotation period a timestamp belongs to.
+
+        Args:
+            timestamp (float): Epoch timestamp
+
+        Returns:
+            int: Period index
+        """
+
+        if not self.interval:
+            return 0
+        return int(timestamp // self.interval)
+
+    def _should_rotate(self, length: int):
+        """Check if log file should be rotated before writing.
+
+        Args:
+            length (int): Length of data to be written
+
+        Returns:
+            bool: Log file should be rotated
+        """
+
+        if self._next_attempt and monotonic() < self._next_attempt:
+            return False
+        if self.max_bytes:
+            size = self._target.size() if self._target.shared else self._size
+            if size > 0 and size + length > self.max_bytes:
+                return True
+        return bool(self.interval) and self._get_period(time()) != self._period
+
+    def _rotate(self):
+        """Shift rotated files and move current log file away."""
+
+        if self._compressor is not None:
+            self._compressor.join()
+
+        path = str(self.path)
+        for i in range(self.backup_count - 1, 0, -1):
+            for suffix in ("", ".gz"):
+                source = f"{path}.{i}{suffix}"
+                if os.path.exists(source):
+                    os.replace(source, f"{path}.{i + 1}{suffix}")
+
+        if not os.path.exists(path):
+            return
+        if self.backup_count < 1:
+            os.remove(path)
+            return
+        os.replace(path, f"{path}.1")
+        if self.compress:
+            self._compressor = Thread(
+                target=_compress, args=(f"{path}.1",), name="livelog-compressor"
+            )
+            self._compressor.start()
+
+
+class IndexWriter(FileWriter):
+    """Writer maintaining a sparse sidecar index of a binary log file.
+
+    An entry mapping a record timestamp to its offset is appended to
+    `<file>.idx` every time `interval` bytes have been written since the
+    previous one. The index only covers the current log file, it is reset
+    when the file is erased or rotated.
+
+    Attributes:
+        path (Path): Log file path
+        interval (int): Bytes written between index entries
+    """
+
+    def __init__(self, path, target: FileWriter, interval: int = 65536):
+        """IndexWriter initialization.
+
+        Args:
+            path (Path): Log file path
+            target (FileWriter): Writer of binary records
+            interval (int, optional): Bytes between index entries. Defaults to 65536.
+        """
+
+        super().__init__(path)
+        self.interval = interval
+
+        self._target = target
+        self._index_path = f"{path}.idx"
+        self._lock = Lock()
+        self._size = target.size()
+        if self._size == 0:
+            self._reset()
+        else:
+            self._indexed = self._size
+
+    @property
+    def dropped(self):
+        return self._target.dropped
+
+    @property
+    def flushes(self):
+        return self._target.flushes
+
+    def write(self, data: bytes):
+        """Index first record of provided data if needed and write it.
+
+        Args:
+            data (bytes): Binary record(s)
+        """
+
+        with self._lock:
+            if self._size - self._indexed >= self.interval:
+                timestamp = RECORD_HEADER.unpack_from(data)[2]
+                with open(self._index_path, "ab") as f:
+                    f.write(INDEX_ENTRY.pack(timestamp, self._size))
+                self._indexed = self._size
+            self._target.write(data)
+            self._size += len(data)
+
+    def flush(self):
+        """Flush target writer."""
+
+        self._target.flush()
+
+    def close(self):
+        """Close target writer."""
+
+        self._target.close()
+
+    def size(self):
+        """Get log file size, including buffered records.
+
+        Returns:
+            int: Size in bytes
+        """
+
+        return self._size
+
+    def rotate(self, rotate):
+        """Rotate log file and reset index.
+
+        Args:
+            rotate (function): Function moving log file away
+        """
+
+        with self._lock:
+            self._target.rotate(rotate)
+            self._size = self._target.size()
+            self._reset()
+
+    def _reset(self):
+        """Remove index entries and index next record."""
+
+        if os.path.exists(self._index_path):
+            os.remove(self._index_path)
+        self._indexed = -self.interval
+
+
+class SocketWriter(FileWriter):
+    """Writer sending records as datagrams to a listening reader, over a Unix
+    domain socket or UDP, and falling back to the log file.
+
+    Sends never block: records which cannot be sent, because no reader is
+    listening, its receive buffer is full or they are too large for a
+    datagram, are written by the target writer instead. Connection is
+    retried at most every `RETRY_INTERVAL` seconds.
+
+    As UDP does not report a missing listener right away, the record sent
+    right after a reader stops may be lost.
+
+    Attributes:
+        RETRY_INTERVAL (float): Minimum seconds between connection attempts
+        path (Path): Log file path
+        address (str): Reader HOST:PORT or Unix socket path
+        sent (int): Count of records sent to the reader
+    """
+
+    RETRY_INTERVAL = 1.0
+
+    def __init__(self, path, address: str, target: FileWriter):
+        """SocketWriter initialization.
+
+        Args:
+            path (Path): Log file path
+            address (str): Reader HOST:PORT or Unix socket path
+            target (FileWriter): Writer of records which cannot be sent
+        """
+
+        super().__init__(path)
+        self.address = address
+        self.sent = 0
+
+        self._target = target
+        self._socket = None
+        self._retry = 0
+        self._lock = Lock()
+        self._connect()
+
+    @property
+    def dropped(self):
+        return self._target.dropped
+
+    @property
+    def flushes(self):
+        return self._target.flushes
+
+    def write(self, data: bytes):
+        """Send provided data, or write it to log file if it cannot be sent.
+
+        Args:
+            data (bytes): Formatted record(s)
+        """
+
+        sock = self._socket
+        if sock is None:
+            sock = self._connect()
+        if sock is not None:
+            try:
+                sock.send(data)
+                self.sent += 1
+                return
+            except BlockingIOError:
+                pass
+            except OSError as e:
+                if e.errno != EMSGSIZE:
+                    self._disconnect(sock)
+        self._target.write(data)
+
+    def flush(self):
+        """Flush target writer."""
+
+        self._target.flush()
+
+    def close(self):
+        """Close socket and target writer."""
+
+        sock = self._socket
+        if sock is not None:
+            self._disconnect(sock)
+        self._target.close()
+
+    def size(self):
+        """Get log file size.
+
+        Returns:
+            int: Size in bytes
+        """
+
+        return self._target.size()
+
+    def rotate(self, rotate):
+        """Rotate log file with target writer.
+
+        Args:
+            rotate (function): Function moving log file away
+        """
+
+        self._target.rotate(rotate)
+
+    def _connect(self):
+        """Connect to the reader if retry delay has elapsed.
+
+        Returns:
+            socket: Connected socket, None if no reader is listening
+        """
+
+        with self._lock:
+            if self._socket is None and monotonic() >= self._retry:
+                self._retry = monotonic() + self.RETRY_INTERVAL
+                try:
+                    self._socket = datagram_socket(self.address)
+                except OSError:
+                    pass
+            return self._socket
+
+    def _disconnect(self, sock):
+        """Close a socket whose reader is gone.
+
+        Args:
+            sock (socket): Socket to be closed
+        """
+
+        with self._lock:
+            if self._socket is sock:
+                self._socket = None
+                self._retry = monotonic() + self.RETRY_INTERVAL
+        sock.close()
+
+
+def _compress(path: str):
+    """Gzip a rotated log file and remove the original.
+
+    Args:
+        path (str): Rotated log file path
+    """
+
+    with open(path, "rb") as source, gzip_open(f"{path}.gz", "wb") as destination:
+        copyfileobj(source, destination)
+    os.remove(path)
@@ -0,0 +1,126 @@
+from re import findall
+from asyncio import run, sleep, wait_for
+from pathlib import Path
+from subprocess import check_call
+from sys import executable
+from livelog import AsyncLogger
+from livelog.reader import Reader
+
+
+def test_default(tmp_path):
+    log_file = tmp_path / "test.log"
+
+    async def main():
+        async with AsyncLogger(file=log_file) as logger:
+            await logger.debug("0")
+            await logger.info("1")
+            await logger.warn("2")
+            await logger.error("3")
+
+    run(main())
+    with open(log_file, "r") as f:
+        logs = f.read()
+
+    assert (
+        len(findall(r"(DBUG \| [0-9]{2}:[0-9]{2}:[0-9]{2}.[0-9]{3} - 0)", logs)) == 1
+    )
+    assert (
+        len(findall(r"(INFO \| [0-9]{2}:[0-9]{2}:[0-9]{2}.[0-9]{3} - 1)", logs)) == 1
+    )
+    assert (
+        len(findall(r"(WARN \| [0-9]{2}:[0-9]{2}:[0-9]{2}.[0-9]{3} - 2)", logs)) == 1
+    )
+    assert (
+        len(findall(r"(ERR! \| [0-9]{2}:[0-9]{2}:[0-9]{2}.[0-9]{3} - 3)", logs)) == 1
+    )
+
+
+def test_nowait(tmp_path):
+    log_file = tmp_path / "test.log"
+
+    async def main():
+        logger = AsyncLogger(file=log_file, level="INFO")
+        for i in range(1000):
+            logger.debug_nowait(str(i))
+            logger.info_nowait(str(i))
+        await sleep(0)
+        await logger.flush()
+        await logger.close()
+
+    run(main())
+    with open(log_file, "r") as f:
+        logs = f.read()
+
+    assert len(findall("INFO", logs)) == 1000
+    assert len(findall("DBUG", logs)) == 0
+
+
+def test_nowait_queue_full(tmp_path):
+    log_file = tmp_path / "test.log"
+
+    async def main():
+        logger = AsyncLogger(file=log_file, queue_size=10)
+        for i in range(20):
+            logger.info_nowait(str(i))
+        await logger.close()
+        return logger.dropped
+
+    assert run(main()) == 10
+
+
+def test_write_error(tmp_path):
+    log_file = tmp_path / "test.log"
+
+    async def main():
+        logger = AsyncLogger(file=log_file)
+        write = logger._writer.write
+
+        def fail(data):
+            logger._writer.write = write
+            raise OSError("disk full")
+
+        logger._writer.write = fail
+        await logger.info("lost")
+        await wait_for(logger.flush(), 1)
+        await logger.info("written")
+        await wait_for(logger.close(), 1)
+        return logger.dropped
+
+    assert run(main()) == 1
+    assert log_file.read_text().endswith("- written\n")
+
+
+def test_reader_compatibility(tmp_path, capfd):
+    log_file = tmp_path / "test.log"
+
+    async def main():
+        async with AsyncLogger(file=log_file) as logger:
+            await logger.info("info")
+            await logger.error("error")
+
+    run(main())
+    Reader(file=log_file, level="DEBUG", nocolors=True)
+    out, _ = capfd.readouterr()
+
+    assert (
+        len(findall(r"(INFO \| [0-9]{2}:[0-9]{2}:[0-9]{2}.[0-9]{3} - info)", out)) == 1
+    )
+    assert (
+        len(findall(r"(ERR! \| [0-9]{2}:[0-9]{2}:[0-9]{2}.[0-9]{3} - error)", out))
+        == 1
+    )
+
+
+def test_write_queued_at_exit(tmp_path):
+    log_file = tmp_path / "test.log"
+    # Event loop never runs the flusher task.
+    script = (
+        "from asyncio import new_event_loop, set_event_loop\n"
+        "from livelog import AsyncLogger\n"
+        "set_event_loop(new_event_loop())\n"
+        f"logger = AsyncLogger(file={str(log_file)!r})\n"
+        "logger.info_nowait('hello')\n"
+    )
+    check_call([executable, "-c", script], cwd=Path(__file__).parent.parent)
+
+    assert log_file.read_text().endswith("- hello\n")
@@ -0,0 +1,31 @@
+from livelog import bench
+
+
+def test_bench_methods(tmp_path):
+    results = bench.bench_methods(tmp_path, 10)
+
+    assert len(results) == len(bench.METHODS) * len(bench.CONFIGURATIONS)
+    assert all(result["value"] > 0 for result in results)
+
+
+def test_bench_latency(tmp_path):
+    results = bench.bench_latency(tmp_path, 3, refresh_rate=100)
+
+    assert [result["statistic"] for result in results] == ["median", "p99", "max"]
+    assert results[0]["lost"] == 0
+
+
+def test_bench_handler(tmp_path):
+    results = bench.bench_handler(tmp_path, 10, threads=2)
+
+    assert len(results) == 12
+    assert all(result["value"] > 0 for result in results)
+
+
+def test_bench_reader_filter(tmp_path):
+    results = bench.bench_reader_filter(tmp_path, 20)
+    shown = {(result["filter"], result["colors"]): result["shown"] for result in results}
+
+    assert shown[("none", False)] == 20
+    assert shown[("level", True)] == 10
+    assert shown[("grep", False)] == 4
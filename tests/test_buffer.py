@@ -0,0 +1,48 @@
+from re import compile
+from livelog.buffer import LineBuffer
+
+
+def test_buffer_eviction():
+    buffer = LineBuffer(3)
+    for i in range(5):
+        buffer.append(i % 4, f"line {i}\n")
+
+    assert len(buffer) == 3
+    assert buffer.first == 2
+    assert [buffer.get(sequence) for sequence in range(2, 5)] == [
+        "line 2\n",
+        "line 3\n",
+        "line 4\n",
+    ]
+
+
+def test_buffer_compaction():
+    buffer = LineBuffer(10)
+    for i in range(1000):
+        buffer.append(0, f"line {i}\n")
+
+    assert len(buffer._arena) < 2 * 10 * len("line 999\n")
+    assert buffer.get(999) == "line 999\n"
+    assert buffer.get(990) == "line 990\n"
+
+
+def test_buffer_select():
+    buffer = LineBuffer(10)
+    for level in (0, 1, 3, LineBuffer.NO_LEVEL, 2):
+        buffer.append(level, "line\n")
+
+    assert buffer.select(2) == [2, 3, 4]
+    assert buffer.select(0) == [0, 1, 2, 3, 4]
+
+
+def test_buffer_search():
+    buffer = LineBuffer(10)
+    for word in ("alpha", "beta", "gamma", "beta", "délta"):
+        buffer.append(0, f"{word}\n")
+    sequences = buffer.select(0)
+
+    assert buffer.search(compile(b"beta"), sequences, 0) == 1
+    assert buffer.search(compile(b"beta"), sequences, 2) == 3
+    assert buffer.search(compile(b"beta"), sequences, 2, backward=True) == 1
+    assert buffer.search(compile("délta".encode()), sequences, 0) == 4
+    assert buffer.search(compile(b"omega"), sequences, 0) is None
@@ -37,3 +37,44 @@ def test_custom_level(reader_test_file):
     out, _ = process.communicate()
     assert "INFO" in str(out)
     assert "DBUG" not in str(out)
+
+
+def test_last_lines(reader_test_file):
+    process = Popen(
+        f"python3 -m livelog -f {reader_test_file} -n 1 --nocolors".split(),
+        stdout=PIPE,
+    )
+    out, _ = process.communicate()
+    assert "ERR!" in str(out)
+    assert "WARN" not in str(out)
+
+
+def test_invalid_poll_interval(reader_test_file):
+    for option in ("--poll-interval", "--max-poll-interval"):
+        process = Popen(
+            f"python3 -m livelog -f {reader_test_file} --poll {option} -1".split(),
+            stderr=PIPE,
+        )
+        _, err = process.communicate()
+        assert process.returncode == 2
+        assert option in str(err)
+
+
+def test_invalid_refresh_rate(reader_test_file):
+    process = Popen(
+        f"python3 -m livelog -f {reader_test_file} --refresh-rate 0".split(),
+        stderr=PIPE,
+    )
+    _, err = process.communicate()
+    assert process.returncode == 2
+    assert "--refresh-rate" in str(err)
+
+
+def test_invalid_field(reader_test_file):
+    process = Popen(
+        f"python3 -m livelog -f {reader_test_file} --field foo".split(),
+        stderr=PIPE,
+    )
+    _, err = process.communicate()
+    assert process.returncode == 2
+    assert 'Invalid field filter "foo"' in str(err)
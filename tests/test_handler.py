@@ -0,0 +1,80 @@
+from logging import getLogger, WARNING, Formatter
+from re import fullmatch
+from livelog import LivelogHandler
+
+
+def make_logger(name, handler):
+    logger = getLogger(name)
+    logger.propagate = False
+    logger.setLevel(1)
+    logger.handlers = [handler]
+    return logger
+
+
+def read_lines(path):
+    with open(path, "r") as f:
+        return f.read().splitlines()
+
+
+def test_handler_levels(tmp_path):
+    log_file = tmp_path / "test.log"
+    handler = LivelogHandler(file=log_file)
+    logger = make_logger("livelog.test.levels", handler)
+    logger.critical("critical")
+    logger.error("error")
+    logger.warning("warning %d", 1)
+    logger.info("info")
+    logger.debug("debug")
+    logger.log(5, "trace")
+    handler.close()
+
+    lines = read_lines(log_file)
+    assert [line[:4] for line in lines] == [
+        "ERR!",
+        "ERR!",
+        "WARN",
+        "INFO",
+        "DBUG",
+        "DBUG",
+    ]
+    assert fullmatch(
+        r"WARN \| [0-9]{2}:[0-9]{2}:[0-9]{2}\.[0-9]{3} - warning 1", lines[2]
+    )
+
+
+def test_handler_level_and_buffering(tmp_path):
+    log_file = tmp_path / "test.log"
+    handler = LivelogHandler(file=log_file, level=WARNING, flush_interval=0)
+    logger = make_logger("livelog.test.buffering", handler)
+    logger.info("filtered")
+    logger.warning("kept")
+    assert not log_file.exists() or read_lines(log_file) == []
+
+    handler.flush()
+    assert [line[-4:] for line in read_lines(log_file)] == ["kept"]
+    handler.close()
+
+
+def test_handler_exception(tmp_path):
+    log_file = tmp_path / "test.log"
+    handler = LivelogHandler(file=log_file, buffered=False)
+    logger = make_logger("livelog.test.exception", handler)
+    try:
+        1 / 0
+    except ZeroDivisionError:
+        logger.exception("failed")
+
+    lines = read_lines(log_file)
+    assert lines[0].endswith(" - failed")
+    assert lines[1] == "Traceback (most recent call last):"
+    assert lines[-1] == "ZeroDivisionError: division by zero"
+
+
+def test_handler_formatter(tmp_path):
+    log_file = tmp_path / "test.log"
+    handler = LivelogHandler(file=log_file, buffered=False)
+    handler.setFormatter(Formatter("%(name)s: %(message)s"))
+    logger = make_logger("livelog.test.formatter", handler)
+    logger.info("0")
+
+    assert read_lines(log_file)[0].endswith(" - livelog.test.formatter: 0")
@@ -1,6 +1,11 @@
 from pytest import raises
 from pathlib import Path
 from re import findall
+from json import loads
+from time import time
+from functools import partial
+from subprocess import check_call
+from sys import executable
 from livelog import Logger, LoggerSingleton, errors
 
 
@@ -234,3 +239,217 @@ def test_insufficient_permissions(restricted_dir, system_is_windows):
 def test_unknow_log_level(log_file):
     with raises(errors.LogLevelDoesNotExist):
         Logger(file=log_file, level="TEST")
+
+
+def test_lazy_arguments(log_file):
+    logger = Logger(file=log_file)
+    logger.info("%s + %d", "one", 2)
+    logger.debug(lambda: "lazy")
+    with open(log_file, "r") as f:
+        logs = f.read()
+
+    assert len(findall(r"(INFO \| [0-9:.]{12} - one \+ 2\n)", logs)) == 1
+    assert len(findall(r"(DBUG \| [0-9:.]{12} - lazy\n)", logs)) == 1
+
+
+def test_lazy_arguments_not_rendered(log_file):
+    def fail():
+        raise AssertionError("Filtered message rendered")
+
+    logger = Logger(file=log_file, level="ERROR")
+    logger.debug(fail)
+    logger.info("%s", fail)
+    logger.warn(fail)
+    logger.enabled = False
+    logger.error(fail)
+
+
+def test_level_change(log_file):
+    logger = Logger(file=log_file, level="ERROR")
+    logger.debug("0")
+    logger.level = "DEBUG"
+    logger.debug("1")
+    logger.enabled = False
+    logger.debug("2")
+    logger.enabled = True
+    logger.debug("3")
+    with open(log_file, "r") as f:
+        logs = f.read()
+
+    assert len(findall(r"(DBUG \| [0-9:.]{12} - [13]\n)", logs)) == 2
+    assert len(findall(r"(DBUG \| [0-9:.]{12} - [02]\n)", logs)) == 0
+
+
+def test_fields(log_file):
+    logger = Logger(file=log_file)
+    logger.info("0", user="foo", count=2)
+    with open(log_file, "r") as f:
+        logs = f.read()
+
+    assert len(findall(r"(INFO \| [0-9:.]{12} - 0 user=foo count=2\n)", logs)) == 1
+
+
+def test_json_format(log_file):
+    logger = Logger(file=log_file, format="json")
+    logger.info("multi\nline", user="foo", level="ignored")
+    logger.debug("%d", 1)
+    with open(log_file, "r") as f:
+        records = [loads(line) for line in f]
+
+    assert records[0]["level"] == "INFO"
+    assert records[0]["message"] == "multi\nline"
+    assert records[0]["user"] == "foo"
+    assert abs(records[0]["timestamp"] - time()) < 60
+    assert records[1]["level"] == "DEBUG"
+    assert records[1]["message"] == "1"
+
+
+def test_unknown_format(log_file):
+    with raises(errors.LogFormatDoesNotExist):
+        Logger(file=log_file, format="TEST")
+
+
+def test_stats(log_file):
+    logger = Logger(file=log_file, level="INFO", stats=True)
+    logger.error("0")
+    logger.info("1")
+    logger.info("2")
+    logger.debug("3")
+    stats = logger.stats()
+
+    assert stats["written"] == {"ERROR": 1, "WARNING": 0, "INFO": 2, "DEBUG": 0}
+    assert stats["filtered"] == {"ERROR": 0, "WARNING": 0, "INFO": 0, "DEBUG": 1}
+    assert stats["bytes"] == Path(log_file).stat().st_size
+    assert stats["write_time"] > 0
+    assert stats["dropped"] == 0
+
+
+def test_stats_disabled(log_file):
+    logger = Logger(file=log_file)
+    assert "_write" not in logger.__dict__
+    with raises(errors.StatsAreDisabled):
+        logger.stats()
+
+
+def test_stats_dump(tmp_path):
+    stats_file = tmp_path / "stats.jsonl"
+    logger = Logger(
+        file=tmp_path / "test.log",
+        buffered=True,
+        stats=True,
+        stats_interval=60,
+        stats_file=stats_file,
+    )
+    logger.info("0")
+    logger.close()
+
+    with open(stats_file, "r") as f:
+        records = [loads(line) for line in f]
+    assert len(records) == 1
+    assert records[0]["written"]["INFO"] == 1
+    assert records[0]["flushes"] == 1
+
+
+def read_lines(log_file):
+    with open(log_file, "r") as f:
+        return f.read().splitlines()
+
+
+def test_rate_limit_message(log_file):
+    logger = Logger(file=log_file, rate_limit=0.001, rate_burst=3, stats=True)
+    for i in range(10):
+        logger.warn("hot %d", i)
+        logger.info("other")
+        logger.error("never limited")
+
+    lines = read_lines(log_file)
+    assert [line[-5:] for line in lines if "hot" in line] == ["hot 0", "hot 1", "hot 2"]
+    assert len([line for line in lines if "other" in line]) == 3
+    assert len([line for line in lines if "never limited" in line]) == 10
+    assert logger.stats()["suppressed"] == 14
+
+
+def test_rate_limit_call_site(log_file):
+    logger = Logger(file=log_file, rate_limit=0.001, rate_burst=2, rate_key="call_site")
+    for i in range(5):
+        logger.info(str(i))
+    for i in range(5):
+        logger.info(str(i))
+
+    assert len(read_lines(log_file)) == 4
+
+
+def test_rate_limit_bounded_keys(log_file):
+    logger = Logger(file=log_file, rate_limit=0.001, rate_burst=1, max_keys=10)
+    for i in range(1000):
+        logger.info(f"{i}")
+
+    assert len(logger._limiter._buckets) == 10
+
+
+def test_rate_limit_lazy_message_not_rendered(log_file):
+    logger = Logger(file=log_file, rate_limit=0.001, rate_burst=1)
+    rendered = []
+    message = lambda: rendered.append(1) or "0"
+    for _ in range(5):
+        logger.info(message)
+
+    assert rendered == [1]
+
+
+def test_rate_limit_inline_lazy_message(log_file):
+    logger = Logger(file=log_file, rate_limit=0.001, rate_burst=1)
+    for i in range(100):
+        logger.info(lambda: f"lazy {i}")
+        logger.info(partial(str, i))
+
+    lines = read_lines(log_file)
+    assert len(lines) == 2
+    assert lines[0].endswith(" - lazy 0")
+    assert lines[1].endswith(" - 0")
+    assert len(logger._limiter._buckets) == 2
+
+
+def test_unknown_rate_key(log_file):
+    with raises(errors.RateLimitKeyDoesNotExist):
+        Logger(file=log_file, rate_limit=1, rate_key="TEST")
+
+
+def test_sampling(log_file):
+    logger = Logger(file=log_file, sample_rate=0.1)
+    for i in range(1000):
+        logger.debug("0")
+        logger.warn("1")
+
+    lines = read_lines(log_file)
+    assert 20 < len([line for line in lines if line.startswith("DBUG")]) < 250
+    assert len([line for line in lines if line.startswith("WARN")]) == 1000
+
+
+def test_collapse_duplicates(log_file):
+    logger = Logger(file=log_file, collapse_duplicates=True)
+    for _ in range(5):
+        logger.info("same")
+    logger.warn("different")
+    logger.warn("different")
+    logger.close()
+
+    assert [line.split(" - ")[1] for line in read_lines(log_file)] == [
+        "same",
+        "last message repeated 4 times",
+        "different",
+        "last message repeated 1 times",
+    ]
+
+
+def test_collapse_duplicates_at_exit(tmp_path):
+    log_file = tmp_path / "test.log"
+    script = (
+        "from livelog import Logger\n"
+        f"logger = Logger(file={str(log_file)!r}, collapse_duplicates=True)\n"
+        "for _ in range(5):\n"
+        "    logger.info('same')\n"
+    )
+    check_call([executable, "-c", script], cwd=Path(__file__).parent.parent)
+
+    assert log_file.read_text().endswith("- last message repeated 4 times\n")
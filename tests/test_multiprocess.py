@@ -0,0 +1,98 @@
+from re import fullmatch
+from multiprocessing import Process
+from livelog import Logger
+
+WORKERS = 8
+LINES = 500
+PAYLOAD = "x" * 300
+
+
+def log_lines(log_file, worker):
+    logger = Logger(file=log_file, multiprocess=True)
+    for i in range(LINES):
+        logger.info(f"{worker}-{i}-{PAYLOAD}")
+    logger.close()
+
+
+def test_no_torn_lines(tmp_path):
+    log_file = tmp_path / "test.log"
+    logger = Logger(file=log_file, multiprocess=True)
+    logger.error("first")
+
+    processes = [
+        Process(target=log_lines, args=(log_file, worker)) for worker in range(WORKERS)
+    ]
+    for process in processes:
+        process.start()
+    for process in processes:
+        process.join()
+    logger.close()
+
+    with open(log_file, "r") as f:
+        lines = f.read().splitlines()
+
+    assert "first" in lines[0]
+    assert len(lines) == WORKERS * LINES + 1
+    records = set()
+    for line in lines[1:]:
+        match = fullmatch(
+            r"INFO \| [0-9]{2}:[0-9]{2}:[0-9]{2}\.[0-9]{3} - ([0-9]+-[0-9]+)-(x+)",
+            line,
+        )
+        assert match is not None
+        assert match.group(2) == PAYLOAD
+        records.add(match.group(1))
+    assert len(records) == WORKERS * LINES
+
+
+def test_first_process_erases(tmp_path, system_is_windows):
+    if system_is_windows:
+        return
+
+    log_file = tmp_path / "test.log"
+    with open(log_file, "w") as f:
+        f.write("previous run\n")
+
+    first = Logger(file=log_file, multiprocess=True)
+    first.info("0")
+    second = Logger(file=log_file, multiprocess=True)
+    second.info("1")
+    first.close()
+    second.close()
+
+    with open(log_file, "r") as f:
+        logs = f.read()
+
+    assert "previous run" not in logs
+    assert "- 0" in logs
+    assert "- 1" in logs
+
+
+def test_record_size_guard(tmp_path):
+    log_file = tmp_path / "test.log"
+    logger = Logger(file=log_file, multiprocess=True)
+    logger._writer.max_record_size = 100
+    logger.info("x" * 200)
+    logger.info("y")
+    logger.close()
+
+    with open(log_file, "r") as f:
+        lines = f.read().splitlines()
+
+    assert len(lines) == 2
+    assert len(lines[0]) == 99
+    assert lines[1].endswith("- y")
+
+
+def test_write_after_close(tmp_path):
+    log_file = tmp_path / "test.log"
+    logger = Logger(file=log_file, multiprocess=True, max_bytes=1000)
+    logger.info("0")
+    logger.close()
+    logger.info("1")
+    logger.close()
+
+    with open(log_file, "r") as f:
+        lines = f.read().splitlines()
+
+    assert [line[-1] for line in lines] == ["0", "1"]
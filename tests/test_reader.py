@@ -1,9 +1,16 @@
 from re import findall
+from gzip import compress
+from time import mktime
+from datetime import datetime
+from time import sleep
+from threading import Thread
 from pytest import raises
 from pathlib import Path
-from colorama import Style, Fore
-from livelog.reader import Reader
-from livelog import errors
+from colorama import Style, Fore, Back
+from livelog.reader import Reader, MultiReader, InteractiveReader
+from livelog.formats import format_binary, read_index
+from livelog.remote import _Tail
+from livelog import Logger, errors
 
 
 def escape(string):
@@ -157,3 +164,583 @@ def test_reader_insufficient_permissions(restricted_dir, system_is_windows):
 def test_reader_unknow_log_level(reader_test_file):
     with raises(errors.LogLevelDoesNotExist):
         Reader(file=reader_test_file, level="TEST", nocolors=True)
+
+
+def test_reader_follows_rotation(tmp_path, capfd):
+    log_file = tmp_path / "test.log"
+    logger = Logger(file=log_file, max_bytes=100)
+    logger.info("0")
+    reader = Reader(file=log_file, level="DEBUG", nocolors=True)
+    for i in range(1, 6):
+        logger.info(str(i))
+    reader.print_output()
+    logger.info("6")
+    reader.print_output()
+    out, _ = capfd.readouterr()
+
+    assert findall(r"INFO \| [0-9:.]{12} - ([0-9])\n", out) == list("0123456")
+
+
+def test_reader_truncated_file(tmp_path, capfd):
+    log_file = tmp_path / "test.log"
+    logger = Logger(file=log_file)
+    logger.info("0" * 10)
+    reader = Reader(file=log_file, level="DEBUG", nocolors=True)
+    logger = Logger(file=log_file)
+    logger.info("1")
+    reader.print_output()
+    out, _ = capfd.readouterr()
+
+    assert findall(r"INFO \| [0-9:.]{12} - ([0-9]+)\n", out) == ["0" * 10, "1"]
+
+
+def test_reader_non_ascii(tmp_path, capfd):
+    log_file = tmp_path / "test.log"
+    logger = Logger(file=log_file)
+    logger.info("été ☀")
+    reader = Reader(file=log_file, level="DEBUG", nocolors=True)
+    logger.info("hiver ❄")
+    reader.print_output()
+    out, _ = capfd.readouterr()
+
+    assert findall(r"INFO \| [0-9:.]{12} - (.*)\n", out) == ["été ☀", "hiver ❄"]
+    assert reader.read_index == log_file.stat().st_size
+
+
+def test_reader_chunks(tmp_path, capfd):
+    log_file = tmp_path / "test.log"
+    log_file.touch()
+    reader = Reader(file=log_file, level="DEBUG", nocolors=True)
+    reader.CHUNK_SIZE = 7
+    logger = Logger(file=log_file, erase=False)
+    for i in range(100):
+        logger.info(f"{i} é")
+    reader.print_output()
+    out, _ = capfd.readouterr()
+
+    assert findall(r"INFO \| [0-9:.]{12} - ([0-9]+) é\n", out) == [
+        str(i) for i in range(100)
+    ]
+
+
+def test_reader_partial_line(tmp_path, capfd):
+    log_file = tmp_path / "test.log"
+    log_file.touch()
+    reader = Reader(file=log_file, level="DEBUG", nocolors=True)
+    with open(log_file, "a") as f:
+        f.write("INFO | 12:00:00.000 - par")
+    reader.print_output()
+    with open(log_file, "a") as f:
+        f.write("tial\n")
+    reader.print_output()
+    out, _ = capfd.readouterr()
+
+    assert findall(r"INFO \| [0-9:.]{12} - (.*)\n", out) == ["partial"]
+
+
+def test_reader_coalesce_events(tmp_path, capfd):
+    log_file = tmp_path / "test.log"
+    log_file.touch()
+    reader = Reader(file=log_file, level="DEBUG", nocolors=True, refresh_rate=10)
+    renders = []
+    print_output = reader.print_output
+    reader.print_output = lambda: renders.append(print_output())
+    reader.start_rendering()
+
+    logger = Logger(file=log_file, erase=False)
+    for i in range(1000):
+        logger.info(str(i))
+        reader.on_modified()
+    sleep(0.5)
+    out, _ = capfd.readouterr()
+
+    assert len(findall(r"INFO \| [0-9:.]{12} - [0-9]+\n", out)) == 1000
+    assert 0 < len(renders) <= 6
+
+
+def test_reader_max_lines(tmp_path, capfd):
+    log_file = tmp_path / "test.log"
+    logger = Logger(file=log_file)
+    for i in range(100):
+        logger.info(str(i))
+    Reader(file=log_file, level="DEBUG", nocolors=True, max_lines=10)
+    out, _ = capfd.readouterr()
+
+    assert out.startswith("... 90 lines skipped ...\n")
+    assert findall(r"INFO \| [0-9:.]{12} - ([0-9]+)\n", out) == [
+        str(i) for i in range(90, 100)
+    ]
+
+
+def test_reader_continuation_lines(tmp_path, capfd):
+    log_file = tmp_path / "test.log"
+    logger = Logger(file=log_file)
+    logger.debug("debug\ndebug continuation")
+    logger.error("error\nerror continuation")
+    with open(log_file, "a") as f:
+        f.write("not a record\n")
+    Reader(file=log_file, level="INFO", nocolors=False)
+    out, _ = capfd.readouterr()
+
+    assert "debug" not in out
+    assert f"{Fore.RED}error continuation" in out
+    assert "not a record" in out
+
+
+def test_reader_unknown_lines_nocolors(tmp_path, capfd):
+    log_file = tmp_path / "test.log"
+    with open(log_file, "w") as f:
+        f.write("?\nDBUG | 12:00:00.000 - debug\nno tag\nINFO | 12:00:00.000 - info\n")
+    Reader(file=log_file, level="INFO", nocolors=True)
+    out, _ = capfd.readouterr()
+
+    assert out == "?\nINFO | 12:00:00.000 - info\n"
+
+
+def write_records(log_file, count):
+    with open(log_file, "w") as f:
+        for i in range(count):
+            f.write(f"INFO | 12:{i // 60:02d}:{i % 60:02d}.000 - {i}\n")
+            if i % 7 == 0:
+                f.write("continuation\n")
+
+
+def test_reader_last_lines(tmp_path, capfd):
+    log_file = tmp_path / "test.log"
+    write_records(log_file, 100)
+    Reader(file=log_file, level="DEBUG", nocolors=True, lines=3)
+    out, _ = capfd.readouterr()
+
+    assert out.splitlines() == [
+        "INFO | 12:01:38.000 - 98",
+        "continuation",
+        "INFO | 12:01:39.000 - 99",
+    ]
+
+
+def test_reader_from_end(tmp_path, capfd):
+    log_file = tmp_path / "test.log"
+    write_records(log_file, 100)
+    reader = Reader(file=log_file, level="DEBUG", nocolors=True, from_end=True)
+    with open(log_file, "a") as f:
+        f.write("INFO | 13:00:00.000 - new\n")
+    reader.print_output()
+    out, _ = capfd.readouterr()
+
+    assert out.splitlines() == ["INFO | 13:00:00.000 - new"]
+
+
+def test_reader_since(tmp_path, capfd):
+    log_file = tmp_path / "test.log"
+    write_records(log_file, 1000)
+    Reader(file=log_file, level="DEBUG", nocolors=True, since="12:15:30")
+    out, _ = capfd.readouterr()
+
+    assert out.splitlines()[0] == "INFO | 12:15:30.000 - 930"
+    assert out.splitlines()[-1] == "INFO | 12:16:39.000 - 999"
+
+
+def test_reader_since_invalid(reader_test_file):
+    with raises(errors.TimeFormatIsInvalid):
+        Reader(file=reader_test_file, level="DEBUG", nocolors=True, since="12h")
+
+
+def test_reader_json(tmp_path, capfd):
+    log_file = tmp_path / "test.log"
+    logger = Logger(file=log_file, format="json")
+    logger.debug("debug", user="foo")
+    logger.info("info", user="bar")
+    logger.error("error\ncontinuation", user="foo")
+    Reader(file=log_file, level="INFO", nocolors=True)
+    out, _ = capfd.readouterr()
+
+    assert out.splitlines()[0].startswith("INFO | ")
+    assert out.splitlines()[0].endswith(" - info user=bar")
+    assert out.splitlines()[1].endswith(" - error")
+    assert out.splitlines()[2] == "continuation user=foo"
+
+
+def test_reader_json_fields(tmp_path, capfd):
+    log_file = tmp_path / "test.log"
+    logger = Logger(file=log_file, format="json")
+    logger.debug("debug", user="foo")
+    logger.info("info", user="bar")
+    logger.error("error", user="foo", count=1)
+    Reader(file=log_file, level="DEBUG", nocolors=True, fields={"user": "foo"})
+    out, _ = capfd.readouterr()
+
+    assert len(out.splitlines()) == 2
+    assert out.splitlines()[1].endswith(" - error user=foo count=1")
+
+
+def test_reader_json_fields_values(tmp_path, capfd):
+    log_file = tmp_path / "test.log"
+    logger = Logger(file=log_file, format="json")
+    logger.info("ok", ok=True, user=None, count=1)
+    logger.info("failed", ok=False, user="foo", count=1.5)
+    Reader(
+        file=log_file,
+        level="DEBUG",
+        nocolors=True,
+        fields={"ok": "true", "user": "null"},
+    )
+    out, _ = capfd.readouterr()
+
+    assert out.splitlines()[0].endswith(" - ok ok=true user=null count=1")
+    assert len(out.splitlines()) == 1
+
+
+def test_reader_binary(tmp_path, capfd):
+    log_file = tmp_path / "test.log"
+    logger = Logger(file=log_file, format="binary")
+    logger.debug("debug")
+    logger.info("info é", user="foo")
+    reader = Reader(file=log_file, level="DEBUG", nocolors=True)
+    logger.error("error\ncontinuation")
+    reader.print_output()
+    out, _ = capfd.readouterr()
+
+    assert findall(r"(DBUG|INFO|ERR!) \| [0-9:.]{12} - (.*)\n", out) == [
+        ("DBUG", "debug"),
+        ("INFO", "info é user=foo"),
+        ("ERR!", "error"),
+    ]
+    assert out.endswith("\ncontinuation\n")
+
+
+def test_reader_binary_partial_record(tmp_path, capfd):
+    log_file = tmp_path / "test.log"
+    logger = Logger(file=log_file, format="binary")
+    logger.info("0")
+    reader = Reader(file=log_file, level="DEBUG", nocolors=True)
+    reader.CHUNK_SIZE = 5
+    for i in range(1, 10):
+        logger.info(str(i))
+    reader.print_output()
+    out, _ = capfd.readouterr()
+
+    assert findall(r"INFO \| [0-9:.]{12} - ([0-9])\n", out) == list("0123456789")
+
+
+def write_binary_records(log_file, count):
+    logger = Logger(file=log_file, format="binary")
+    logger._writer.interval = 1024
+    base = int(mktime(datetime(2022, 1, 1, 12, 0, 0).timetuple()))
+    for i in range(count):
+        logger._writer.write(
+            format_binary("INFO", (base + i) * 1_000_000_000, str(i), {})
+        )
+    logger.close()
+
+
+def test_reader_binary_since(tmp_path, capfd):
+    log_file = tmp_path / "test.log"
+    write_binary_records(log_file, 1000)
+    assert len(read_index(f"{log_file}.idx")) > 10
+
+    Reader(file=log_file, level="DEBUG", nocolors=True, since="12:15:30")
+    out, _ = capfd.readouterr()
+
+    assert out.splitlines()[0] == "INFO | 12:15:30.000 - 930"
+    assert out.splitlines()[-1] == "INFO | 12:16:39.000 - 999"
+
+
+def test_reader_binary_last_lines(tmp_path, capfd):
+    log_file = tmp_path / "test.log"
+    write_binary_records(log_file, 1000)
+
+    Reader(file=log_file, level="DEBUG", nocolors=True, lines=2)
+    out, _ = capfd.readouterr()
+
+    assert out.splitlines() == [
+        "INFO | 12:16:38.000 - 998",
+        "INFO | 12:16:39.000 - 999",
+    ]
+
+
+def test_reader_compressed(tmp_path, capfd):
+    log_file = tmp_path / "test.log"
+    logger = Logger(file=log_file, compression="gzip")
+    logger.info("0")
+    reader = Reader(file=log_file, level="DEBUG", nocolors=True)
+    reader.CHUNK_SIZE = 5
+    for i in range(1, 10):
+        logger.info(str(i))
+    reader.print_output()
+    logger.close()
+    reader.print_output()
+    out, _ = capfd.readouterr()
+
+    assert findall(r"INFO \| [0-9:.]{12} - ([0-9])\n", out) == list("0123456789")
+    assert reader.read_index == log_file.stat().st_size
+
+
+def test_reader_compressed_binary_last_lines(tmp_path, capfd):
+    log_file = tmp_path / "test.log"
+    with Logger(file=log_file, format="binary", compression="gzip") as logger:
+        for i in range(100):
+            logger.info(str(i))
+    reader = Reader(file=log_file, level="DEBUG", nocolors=True, lines=2)
+    with Logger(
+        file=log_file, erase=False, format="binary", compression="gzip"
+    ) as logger:
+        logger.info("new")
+    reader.print_output()
+    out, _ = capfd.readouterr()
+
+    assert findall(r"INFO \| [0-9:.]{12} - (.*)\n", out) == ["98", "99", "new"]
+
+
+def test_reader_compressed_since(tmp_path, monkeypatch):
+    log_file = tmp_path / "test.log"
+    write_records(log_file, 1000)
+    log_file.write_bytes(compress(log_file.read_bytes()))
+    monkeypatch.setattr(Reader, "CHUNK_SIZE", 64)
+
+    tail = _Tail(file=log_file, level="DEBUG", nocolors=True, since="12:15:30")
+    tail.start()
+    assert tail.read_index < log_file.stat().st_size
+    rows = [row for rows in iter(tail.get_new_lines, None) for row in rows]
+
+    assert rows[0] == "INFO | 12:15:30.000 - 930\n"
+    assert rows[-1] == "INFO | 12:16:39.000 - 999\n"
+
+
+def write_patterns_file(log_file):
+    with open(log_file, "w") as f:
+        f.write("INFO | 12:00:00.000 - user alice logged in\n")
+        f.write("  with token abc\n")
+        f.write("WARN | 12:00:01.000 - user bob failed\n")
+        f.write("ERR! | 12:00:02.000 - disk full\n")
+        f.write("DBUG | 12:00:03.000 - user alice heartbeat\n")
+
+
+def test_reader_grep(tmp_path, capfd):
+    log_file = tmp_path / "test.log"
+    write_patterns_file(log_file)
+
+    Reader(file=log_file, level="INFO", nocolors=True, grep=["alice", "disk"])
+    out, _ = capfd.readouterr()
+
+    assert out.splitlines() == [
+        "INFO | 12:00:00.000 - user alice logged in",
+        "  with token abc",
+        "ERR! | 12:00:02.000 - disk full",
+    ]
+
+
+def test_reader_exclude_and_regex(tmp_path, capfd):
+    log_file = tmp_path / "test.log"
+    write_patterns_file(log_file)
+
+    Reader(
+        file=log_file,
+        level="DEBUG",
+        nocolors=True,
+        regex=[r"user \w+ (logged|failed|heartbeat)"],
+        exclude=["bob", "heart"],
+    )
+    out, _ = capfd.readouterr()
+
+    assert out.splitlines() == [
+        "INFO | 12:00:00.000 - user alice logged in",
+        "  with token abc",
+    ]
+
+
+def test_reader_grep_escaped(tmp_path, capfd):
+    log_file = tmp_path / "test.log"
+    with open(log_file, "w") as f:
+        f.write("INFO | 12:00:00.000 - a.b\n")
+        f.write("INFO | 12:00:00.000 - axb\n")
+
+    Reader(file=log_file, level="DEBUG", nocolors=True, grep=["a.b"])
+    out, _ = capfd.readouterr()
+
+    assert out.splitlines() == ["INFO | 12:00:00.000 - a.b"]
+
+
+def test_reader_highlight(tmp_path, capfd):
+    log_file = tmp_path / "test.log"
+    write_patterns_file(log_file)
+
+    Reader(file=log_file, level="ERROR", nocolors=False, grep=["full"], highlight=True)
+    out, _ = capfd.readouterr()
+
+    assert f"disk {Back.YELLOW}{Fore.BLACK}full{Back.RESET}{Fore.RED}" in out
+
+
+def test_reader_invalid_regex(tmp_path):
+    log_file = tmp_path / "test.log"
+    log_file.touch()
+    with raises(errors.PatternIsInvalid):
+        Reader(file=log_file, level="DEBUG", nocolors=True, regex=["("])
+
+
+def test_reader_regex_inline_flags(tmp_path, capfd):
+    log_file = tmp_path / "test.log"
+    with open(log_file, "w") as f:
+        f.write("INFO | 12:00:00.000 - FOO\n")
+        f.write("INFO | 12:00:00.000 - bar\n")
+        f.write("INFO | 12:00:00.000 - baz\n")
+
+    Reader(
+        file=log_file, level="DEBUG", nocolors=True, regex=["(?i)foo", "(?x) b a r"]
+    )
+    out, _ = capfd.readouterr()
+
+    assert out.splitlines() == [
+        "INFO | 12:00:00.000 - FOO",
+        "INFO | 12:00:00.000 - bar",
+    ]
+
+
+def test_multi_reader_merge(tmp_path, capfd):
+    with open(tmp_path / "a.log", "w") as f:
+        f.write("INFO | 12:00:00.000 - a0\n")
+        f.write("  a0 continuation\n")
+        f.write("INFO | 12:00:02.000 - a2\n")
+    with open(tmp_path / "b.log", "w") as f:
+        f.write("INFO | 12:00:01.000 - b1\n")
+        f.write("DBUG | 12:00:03.000 - b3\n")
+
+    MultiReader(files=[tmp_path / "*.log"], level="INFO", nocolors=True)
+    out, _ = capfd.readouterr()
+
+    assert out.splitlines() == [
+        "[a.log] INFO | 12:00:00.000 - a0",
+        "[a.log]   a0 continuation",
+        "[b.log] INFO | 12:00:01.000 - b1",
+        "[a.log] INFO | 12:00:02.000 - a2",
+    ]
+
+
+def test_multi_reader_new_file(tmp_path, capfd):
+    first = tmp_path / "a.log"
+    first.write_text("INFO | 12:00:00.000 - a0\n")
+    reader = MultiReader(files=[first, tmp_path / "b.log"], level="DEBUG", nocolors=True)
+    capfd.readouterr()
+
+    second = tmp_path / "b.log"
+    second.write_text("INFO | 12:00:01.000 - b1\n")
+
+    class Event:
+        src_path = str(second.resolve())
+
+    reader.dispatch(Event())
+    out, _ = capfd.readouterr()
+
+    assert out == "[b.log] INFO | 12:00:01.000 - b1\n"
+    assert reader.directories == [str(tmp_path.resolve())]
+
+
+def test_reader_poll(tmp_path, capfd):
+    log_file = tmp_path / "test.log"
+    log_file.write_text("INFO | 12:00:00.000 - 0\n")
+    reader = Reader(
+        file=log_file,
+        level="DEBUG",
+        nocolors=True,
+        poll_interval=0.01,
+        max_poll_interval=0.05,
+    )
+    capfd.readouterr()
+    reads = []
+    get_new_lines = reader.get_new_lines
+    reader.get_new_lines = lambda: reads.append(1) or get_new_lines()
+    Thread(target=reader.poll, daemon=True).start()
+    sleep(0.1)
+    reads.clear()
+    sleep(0.3)
+    assert reads == []
+
+    with open(log_file, "a") as f:
+        f.write("INFO | 12:00:01.000 - 1\n")
+    sleep(0.3)
+    out, _ = capfd.readouterr()
+
+    assert out == "INFO | 12:00:01.000 - 1\n"
+
+
+def test_reader_poll_interval_bounds(reader_test_file):
+    reader = Reader(
+        file=reader_test_file,
+        level="DEBUG",
+        nocolors=True,
+        poll_interval=0,
+        max_poll_interval=-1,
+    )
+
+    assert reader.poll_interval == Reader.MIN_POLL_INTERVAL
+    assert reader.max_poll_interval == Reader.MIN_POLL_INTERVAL
+
+
+def test_multi_reader_poll_new_file(tmp_path, capfd):
+    (tmp_path / "a.log").write_text("INFO | 12:00:00.000 - a0\n")
+    reader = MultiReader(
+        files=[tmp_path / "*.log"], level="DEBUG", nocolors=True, poll_interval=0.01
+    )
+    capfd.readouterr()
+    Thread(target=reader.poll, daemon=True).start()
+
+    (tmp_path / "b.log").write_text("INFO | 12:00:01.000 - b1\n")
+    sleep(0.3)
+    out, _ = capfd.readouterr()
+
+    assert out == "[b.log] INFO | 12:00:01.000 - b1\n"
+
+
+def test_interactive_reader(tmp_path, capfd):
+    log_file = tmp_path / "test.log"
+    with open(log_file, "w") as f:
+        for i in range(20):
+            f.write(f"{'INFO' if i % 2 else 'DBUG'} | 12:00:00.000 - {i}\n")
+    reader = InteractiveReader(file=log_file, level="DEBUG", nocolors=True, page_size=4)
+
+    def page(command):
+        capfd.readouterr()
+        assert reader.command(command)
+        return capfd.readouterr()[0].splitlines()
+
+    assert page("b")[-1] == "-- 13-16/20 DBUG -- "
+    assert page("g")[0] == "DBUG | 12:00:00.000 - 0"
+    assert page("/ - 7$")[0] == "INFO | 12:00:00.000 - 7"
+    assert page("l INFO") == [
+        "INFO | 12:00:00.000 - 13",
+        "INFO | 12:00:00.000 - 15",
+        "INFO | 12:00:00.000 - 17",
+        "INFO | 12:00:00.000 - 19",
+        "-- 7-10/10 INFO following -- ",
+    ]
+    assert not reader.command("q")
+
+
+def test_interactive_reader_visible_lines(tmp_path, capfd):
+    log_file = tmp_path / "test.log"
+    log_file.write_text("start\n")
+    reader = InteractiveReader(
+        file=log_file, level="INFO", nocolors=True, buffer_size=5, page_size=2
+    )
+    with open(log_file, "a") as f:
+        for i in range(10):
+            f.write(f"{'INFO' if i % 2 else 'DBUG'} | 12:00:00.000 - {i}\n")
+    reader.print_output()
+    out, _ = capfd.readouterr()
+
+    assert reader._visible_lines() == reader.buffer.select(1) == [6, 8, 10]
+    assert out.splitlines()[-1] == "-- 2-3/3 INFO following -- "
+    reader.command("l DEBUG")
+    assert reader._visible_lines() == [6, 7, 8, 9, 10]
+
+
+def test_reader_stats(tmp_path, capfd):
+    log_file = tmp_path / "test.log"
+    write_patterns_file(log_file)
+    reader = Reader(file=log_file, level="WARNING", nocolors=True, stats=True)
+    stats = reader.stats()
+
+    assert stats["lines_parsed"] == 5
+    assert stats["lines_filtered"] == 3
+    assert stats["renders"] == 1
+    assert stats["events"] == 1
+    assert stats["render_time"] > 0
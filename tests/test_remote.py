@@ -0,0 +1,181 @@
+from re import findall
+from asyncio import get_event_loop, run, sleep, wait_for
+from pathlib import Path
+from threading import Thread
+from time import sleep as sleep_
+from pytest import raises
+from livelog import Logger, errors
+from livelog.network import datagram_socket
+from livelog.remote import (
+    DROPPED,
+    ListenReader,
+    LogServer,
+    RemoteReader,
+    _Client,
+    parse_address,
+)
+
+
+def test_parse_address():
+    assert parse_address("localhost:4680") == ("localhost", 4680)
+    assert parse_address("/tmp/livelog.sock") == ("/tmp/livelog.sock", None)
+    with raises(errors.AddressIsInvalid):
+        parse_address("localhost")
+
+
+def test_unix_socket_unavailable(monkeypatch):
+    monkeypatch.setattr("livelog.remote.start_unix_server", None)
+    with raises(errors.AddressIsInvalid):
+        RemoteReader("/tmp/livelog.sock", level="DEBUG", nocolors=True)
+    RemoteReader("localhost:4680", level="DEBUG", nocolors=True)
+
+
+def serve_and_connect(log_file, address, level, capfd):
+    async def main():
+        server = LogServer(log_file, address, poll_interval=0.01, from_end=True)
+        await server.start()
+        reader = RemoteReader(address, level=level, nocolors=True)
+        client = get_event_loop().create_task(reader.connect())
+        await sleep(0.1)
+
+        logger = Logger(file=log_file, erase=False)
+        logger.debug("0")
+        logger.info("1\ncontinuation")
+        logger.error("2")
+        await sleep(0.2)
+        await server.close()
+        try:
+            await wait_for(client, 1)
+        except Exception:
+            pass
+
+    run(main())
+    out, _ = capfd.readouterr()
+    return out
+
+
+def test_serve_tcp(tmp_path, capfd):
+    log_file = tmp_path / "test.log"
+    Logger(file=log_file).debug("before")
+    out = serve_and_connect(log_file, "127.0.0.1:46801", "INFO", capfd)
+
+    assert findall(r"(INFO|ERR!) \| [0-9:.]{12} - ([0-9])\n", out) == [
+        ("INFO", "1"),
+        ("ERR!", "2"),
+    ]
+    assert "continuation\n" in out
+    assert "before" not in out
+
+
+def test_serve_unix_socket(tmp_path, capfd, system_is_windows):
+    if system_is_windows:
+        return
+
+    log_file = tmp_path / "test.log"
+    log_file.touch()
+    out = serve_and_connect(log_file, str(tmp_path / "test.sock"), "DEBUG", capfd)
+
+    assert findall(r"[A-Z!]{4} \| [0-9:.]{12} - ([0-9])\n", out) == ["0", "1", "2"]
+
+
+def test_serve_yields_between_chunks(tmp_path):
+    log_file = tmp_path / "test.log"
+    logger = Logger(file=log_file)
+    for i in range(1000):
+        logger.info(str(i))
+
+    async def main():
+        server = LogServer(log_file, "127.0.0.1:46802")
+        server._tail.CHUNK_SIZE = 1024
+        await server.start()
+        await sleep(0)
+        await sleep(0)
+        read_index = server._tail.read_index
+        await server.close()
+        return read_index
+
+    assert 0 < run(main()) < log_file.stat().st_size
+
+
+class _Writer:
+    def __init__(self):
+        self.data = b""
+
+    def write(self, data):
+        self.data += data
+
+    async def drain(self):
+        pass
+
+
+def test_client_drops_oldest_lines(capfd):
+    async def main():
+        writer = _Writer()
+        client = _Client(writer, "DEBUG", buffer_size=2)
+        client.push([f"INFO | 12:00:00.000 - {i}\n" for i in range(5)])
+        client.push(["\x001\n"])
+        task = get_event_loop().create_task(client.send())
+        await sleep(0.01)
+        task.cancel()
+        return writer.data.decode()
+
+    data = run(main())
+    assert data.startswith(f"{DROPPED}4\n")
+    assert data.endswith("- 4\n1\n")
+
+    reader = RemoteReader("127.0.0.1:46801", level="DEBUG", nocolors=True)
+    reader.receive(data.encode() + b"\x00continuation\n")
+    out, _ = capfd.readouterr()
+    assert out.splitlines() == [
+        "... 4 lines skipped ...",
+        "INFO | 12:00:00.000 - 4",
+        "1",
+        "\x00continuation",
+    ]
+
+
+def test_listen(tmp_path, capfd, system_is_windows):
+    if system_is_windows:
+        return
+
+    address = str(tmp_path / "test.sock")
+    reader = ListenReader(address, level="INFO", nocolors=True)
+    Thread(target=reader.listen, daemon=True).start()
+    while not Path(address).exists():
+        sleep_(0.01)
+
+    logger = Logger(file=tmp_path / "test.log", socket=address)
+    logger.debug("0")
+    logger.info("1\ncontinuation")
+    logger.error("2", user="foo")
+    json_logger = Logger(file=tmp_path / "test.log", socket=address, format="json")
+    json_logger.warn("3")
+    sleep_(0.2)
+    out, _ = capfd.readouterr()
+
+    assert out.splitlines()[1] == "continuation"
+    assert findall(r"(INFO|ERR!|WARN) \| [0-9:.]{12} - (.*)\n", out) == [
+        ("INFO", "1"),
+        ("ERR!", "2 user=foo"),
+        ("WARN", "3"),
+    ]
+    assert not (tmp_path / "test.log").exists()
+
+
+def test_listen_address_in_use(tmp_path, system_is_windows):
+    if system_is_windows:
+        return
+
+    data_file = tmp_path / "data.txt"
+    data_file.write_text("data")
+    with raises(errors.AddressIsInUse):
+        datagram_socket(str(data_file), bind=True)
+    assert data_file.read_text() == "data"
+
+    address = str(tmp_path / "test.sock")
+    listener = datagram_socket(address, bind=True)
+    with raises(errors.AddressIsInUse):
+        datagram_socket(address, bind=True)
+
+    listener.close()
+    datagram_socket(address, bind=True).close()
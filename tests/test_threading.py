@@ -0,0 +1,76 @@
+from re import fullmatch
+from threading import Barrier, Thread
+from pytest import mark
+from livelog import Logger, LoggerSingleton
+from livelog.logger import Singleton
+
+THREADS = 32
+LINES = 200
+# Larger than default buffered I/O size so a record needs a single write call
+# to stay whole.
+PAYLOAD = "x" * 10000
+
+
+def run_threads(target):
+    barrier = Barrier(THREADS)
+
+    def run(worker):
+        barrier.wait()
+        target(worker)
+
+    threads = [Thread(target=run, args=(worker,)) for worker in range(THREADS)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+
+@mark.parametrize(
+    "options",
+    [{}, {"buffered": True, "buffer_size": 4096}, {"threaded": True}],
+    ids=["default", "buffered", "threaded"],
+)
+def test_no_torn_lines(tmp_path, options):
+    log_file = tmp_path / "test.log"
+    logger = Logger(file=log_file, **options)
+
+    def log_lines(worker):
+        for i in range(LINES):
+            logger.info(f"{worker}-{i}-{PAYLOAD}")
+
+    run_threads(log_lines)
+    logger.close()
+
+    with open(log_file, "r") as f:
+        lines = f.read().splitlines()
+    assert len(lines) == THREADS * LINES
+    records = set()
+    for line in lines:
+        match = fullmatch(
+            r"INFO \| [0-9]{2}:[0-9]{2}:[0-9]{2}\.[0-9]{3} - ([0-9]+-[0-9]+)-(x+)",
+            line,
+        )
+        assert match is not None
+        assert match.group(2) == PAYLOAD
+        records.add(match.group(1))
+    assert len(records) == THREADS * LINES
+
+
+def test_singleton_concurrent_creation(tmp_path):
+    log_file = tmp_path / "test.log"
+    Singleton._instances.pop(LoggerSingleton, None)
+    instances = []
+
+    def create(worker):
+        logger = LoggerSingleton(file=log_file)
+        logger.info(str(worker))
+        instances.append(logger)
+
+    try:
+        run_threads(create)
+    finally:
+        Singleton._instances.pop(LoggerSingleton, None)
+
+    assert len({id(instance) for instance in instances}) == 1
+    with open(log_file, "r") as f:
+        assert len(f.read().splitlines()) == THREADS
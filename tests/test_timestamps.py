@@ -0,0 +1,57 @@
+from re import fullmatch
+from time import localtime, mktime
+from datetime import datetime
+from pytest import raises
+from livelog import Logger, errors
+from livelog.timestamps import TimestampFormatter
+
+
+def test_time_format():
+    formatter = TimestampFormatter()
+    assert fullmatch(r"[0-9]{2}:[0-9]{2}:[0-9]{2}\.[0-9]{3}", formatter())
+
+
+def test_iso_format():
+    formatter = TimestampFormatter(format="iso")
+    assert fullmatch(
+        r"[0-9]{4}-[0-9]{2}-[0-9]{2}T[0-9]{2}:[0-9]{2}:[0-9]{2}\.[0-9]{3}",
+        formatter(),
+    )
+
+
+def test_cached_second():
+    formatter = TimestampFormatter()
+    second = int(mktime(datetime(2022, 1, 1, 12, 30, 15).timetuple()))
+    base = second * 1_000_000_000
+
+    assert formatter.format(base + 1_000_000) == "12:30:15.001"
+    assert formatter.format(base + 999_999_999) == "12:30:15.999"
+    assert formatter.format(base + 1_000_000_000) == "12:30:16.000"
+
+
+def test_monotonic_clock():
+    formatter = TimestampFormatter(clock="monotonic")
+    now = localtime()
+    assert formatter()[:2] == f"{now.tm_hour:02d}"
+
+
+def test_logger_iso_format(tmp_path):
+    log_file = tmp_path / "test.log"
+    logger = Logger(file=log_file, timestamp_format="iso")
+    logger.info("0")
+    with open(log_file, "r") as f:
+        logs = f.read()
+
+    assert fullmatch(
+        r"INFO \| [0-9]{4}-[0-9]{2}-[0-9]{2}T[0-9:]{8}\.[0-9]{3} - 0\n", logs
+    )
+
+
+def test_unknown_clock(tmp_path):
+    with raises(errors.ClockDoesNotExist):
+        Logger(file=tmp_path / "test.log", clock="TEST")
+
+
+def test_unknown_timestamp_format(tmp_path):
+    with raises(errors.TimestampFormatDoesNotExist):
+        Logger(file=tmp_path / "test.log", timestamp_format="TEST")
@@ -0,0 +1,318 @@
+from os import rename
+from subprocess import run
+from sys import executable
+from gzip import open as gzip_open
+from time import sleep
+from zlib import decompressobj
+from pathlib import Path
+from threading import Event
+from pytest import mark, raises
+from livelog import Logger, errors
+from livelog.writers import FileWriter, ThreadedWriter
+from livelog.formats import RECORD_MARKER, read_index
+from livelog.network import datagram_socket
+
+
+class BlockingWriter(FileWriter):
+    def __init__(self):
+        super().__init__(None)
+        self.written = []
+        self.release = Event()
+
+    def write(self, data):
+        self.release.wait()
+        self.written.append(data)
+
+
+def read(path):
+    if not Path(path).exists():
+        return ""
+    with open(path, "r") as f:
+        return f.read()
+
+
+def test_buffered_flush_on_close(tmp_path):
+    log_file = tmp_path / "test.log"
+    logger = Logger(file=log_file, buffered=True, flush_interval=0)
+    logger.debug("0")
+    logger.info("1")
+    assert read(log_file) == ""
+
+    logger.close()
+    logs = read(log_file)
+    assert "DBUG" in logs
+    assert "INFO" in logs
+
+
+def test_buffered_flush_on_size(tmp_path):
+    log_file = tmp_path / "test.log"
+    logger = Logger(file=log_file, buffered=True, buffer_size=100, flush_interval=0)
+    for i in range(9):
+        logger.debug(str(i))
+
+    assert 0 < len(read(log_file).splitlines()) < 9
+    logger.close()
+    assert len(read(log_file).splitlines()) == 9
+
+
+def test_buffered_flush_on_interval(tmp_path):
+    log_file = tmp_path / "test.log"
+    logger = Logger(file=log_file, buffered=True, flush_interval=0.1)
+    logger.debug("0")
+    sleep(0.5)
+
+    assert "DBUG" in read(log_file)
+    logger.close()
+
+
+def test_buffered_context_manager(tmp_path):
+    log_file = tmp_path / "test.log"
+    with Logger(file=log_file, buffered=True, flush_interval=0) as logger:
+        logger.error("0")
+
+    assert "ERR!" in read(log_file)
+
+
+def test_buffered_reopen_on_rename(tmp_path):
+    log_file = tmp_path / "test.log"
+    logger = Logger(file=log_file, buffered=True, flush_interval=0)
+    logger.debug("0")
+    logger.flush()
+    rename(log_file, tmp_path / "test.log.1")
+    logger.debug("1")
+    logger.close()
+
+    assert "- 0" in read(tmp_path / "test.log.1")
+    assert "- 1" in read(log_file)
+    assert "- 0" not in read(log_file)
+
+
+def test_threaded(tmp_path):
+    log_file = tmp_path / "test.log"
+    logger = Logger(file=log_file, threaded=True)
+    for i in range(1000):
+        logger.debug(str(i))
+    logger.flush()
+
+    assert len(read(log_file).splitlines()) == 1000
+    logger.close()
+
+
+def test_threaded_close(tmp_path):
+    log_file = tmp_path / "test.log"
+    with Logger(file=log_file, threaded=True, queue_size=10) as logger:
+        for i in range(100):
+            logger.info(str(i))
+
+    assert len(read(log_file).splitlines()) == 100
+    assert logger.dropped == 0
+
+
+def test_threaded_drop_newest():
+    target = BlockingWriter()
+    writer = ThreadedWriter(None, target=target, queue_size=2, overflow="drop_newest")
+    writer.write(b"0")
+    sleep(0.1)
+    for i in range(1, 5):
+        writer.write(str(i).encode())
+    target.release.set()
+    writer.close()
+
+    assert b"".join(target.written) == b"012"
+    assert writer.dropped == 2
+
+
+def test_threaded_drop_oldest():
+    target = BlockingWriter()
+    writer = ThreadedWriter(None, target=target, queue_size=2, overflow="drop_oldest")
+    writer.write(b"0")
+    sleep(0.1)
+    for i in range(1, 5):
+        writer.write(str(i).encode())
+    target.release.set()
+    writer.close()
+
+    assert b"".join(target.written) == b"034"
+    assert writer.dropped == 2
+
+
+def test_unknown_overflow_policy(tmp_path):
+    with raises(errors.OverflowPolicyDoesNotExist):
+        Logger(file=tmp_path / "test.log", threaded=True, overflow="TEST")
+
+
+def test_rotation_size(tmp_path):
+    log_file = tmp_path / "test.log"
+    logger = Logger(file=log_file, max_bytes=100, backup_count=2)
+    for i in range(12):
+        logger.info(str(i))
+    logger.close()
+
+    assert sorted(path.name for path in tmp_path.iterdir()) == [
+        "test.log",
+        "test.log.1",
+        "test.log.2",
+    ]
+    assert all(len(read(path)) <= 100 for path in tmp_path.iterdir())
+    assert read(log_file).endswith("- 11\n")
+    assert read(tmp_path / "test.log.1").endswith("- 7\n")
+
+
+def test_rotation_interval(tmp_path):
+    log_file = tmp_path / "test.log"
+    logger = Logger(file=log_file, rotate_interval=0.2)
+    logger.info("0")
+    sleep(0.3)
+    logger.info("1")
+    logger.close()
+
+    assert "- 0" in read(tmp_path / "test.log.1")
+    assert "- 1" in read(log_file)
+
+
+def test_rotation_compress(tmp_path):
+    log_file = tmp_path / "test.log"
+    logger = Logger(file=log_file, max_bytes=50, compress_rotated=True, buffered=True)
+    for i in range(4):
+        logger.info(str(i))
+    logger.close()
+
+    with gzip_open(tmp_path / "test.log.1.gz", "rt") as f:
+        assert f.read().endswith("- 1\n")
+    assert not (tmp_path / "test.log.1").exists()
+
+
+def test_rotation_failure(tmp_path):
+    log_file = tmp_path / "test.log"
+    logger = Logger(file=log_file, max_bytes=50)
+    writer = logger._writer
+    rotate = writer._rotate
+
+    def fail():
+        raise PermissionError("file is in use")
+
+    writer._rotate = fail
+    for i in range(3):
+        logger.info(str(i))
+    assert [line[-1] for line in read(log_file).splitlines()] == ["0", "1", "2"]
+
+    writer._rotate = rotate
+    writer._next_attempt = 0
+    logger.info("3")
+    assert read(log_file).endswith("- 3\n")
+    assert read(tmp_path / "test.log.1").endswith("- 2\n")
+
+
+def test_rotation_multiprocess(tmp_path, system_is_windows):
+    # Files held open by other processes cannot be renamed on Windows.
+    if system_is_windows:
+        return
+
+    log_file = tmp_path / "test.log"
+    first = Logger(file=log_file, max_bytes=100, multiprocess=True)
+    second = Logger(file=log_file, max_bytes=100, multiprocess=True)
+    for i in range(4):
+        first.info(str(i))
+        second.info(str(i))
+    first.close()
+    second.close()
+
+    lines = []
+    for path in tmp_path.glob("test.log*"):
+        if not path.name.endswith(".lock"):
+            lines += read(path).splitlines()
+    assert len(lines) == 8
+
+
+def test_binary_index(tmp_path):
+    log_file = tmp_path / "test.log"
+    logger = Logger(file=log_file, format="binary")
+    logger._writer.interval = 100
+    for i in range(100):
+        logger.info(str(i))
+    logger.close()
+
+    entries = read_index(f"{log_file}.idx")
+    assert entries[0][1] == 0
+    assert len(entries) > 10
+    with open(log_file, "rb") as f:
+        data = f.read()
+    for _, offset in entries:
+        assert data[offset : offset + 1] == RECORD_MARKER
+
+    Logger(file=log_file, format="binary")
+    assert read_index(f"{log_file}.idx") == []
+
+
+def test_compression(tmp_path):
+    log_file = tmp_path / "test.log"
+    logger = Logger(file=log_file, compression="gzip")
+    logger.info("0")
+
+    # Records are readable before the stream is finished.
+    with open(log_file, "rb") as f:
+        assert decompressobj(31).decompress(f.read()).endswith(b"- 0\n")
+
+    logger.info("1")
+    logger.close()
+    with gzip_open(log_file, "rt") as f:
+        lines = f.read().splitlines()
+    assert [line[-1] for line in lines] == ["0", "1"]
+
+
+def test_compression_rotation(tmp_path):
+    log_file = tmp_path / "test.log"
+    logger = Logger(file=log_file, compression="gzip", max_bytes=50, buffered=True)
+    for i in range(4):
+        logger.info(str(i))
+    logger.close()
+
+    with gzip_open(tmp_path / "test.log.1", "rt") as f:
+        assert f.read().endswith("- 1\n")
+    with gzip_open(log_file, "rt") as f:
+        assert f.read().endswith("- 3\n")
+
+
+def test_unavailable_compression(tmp_path):
+    with raises(errors.CompressionIsUnavailable):
+        Logger(file=tmp_path / "test.log", compression="lz4")
+    with raises(errors.CompressionIsUnavailable):
+        Logger(file=tmp_path / "test.log", compression="gzip", multiprocess=True)
+
+
+def test_socket_fallback(tmp_path, system_is_windows):
+    if system_is_windows:
+        return
+
+    log_file = tmp_path / "test.log"
+    address = str(tmp_path / "test.sock")
+    logger = Logger(file=log_file, socket=address)
+    logger.info("0")
+    assert read(log_file).endswith("- 0\n")
+
+    listener = datagram_socket(address, bind=True)
+    logger._writer._retry = 0
+    logger.info("1")
+    assert listener.recv(1024).endswith(b"- 1\n")
+    assert logger._writer.sent == 1
+
+    listener.close()
+    logger.info("2")
+    logger.close()
+    assert [line[-1] for line in read(log_file).splitlines()] == ["0", "2"]
+
+
+@mark.parametrize(
+    "options", ["buffered=True", "buffered=True, compression='gzip'"]
+)
+def test_buffered_flush_at_exit(tmp_path, options):
+    log_file = tmp_path / "test.log"
+    script = (
+        "from livelog import Logger\n"
+        f"logger = Logger(file={str(log_file)!r}, {options})\n"
+        "logger.info('hello')\n"
+    )
+    run([executable, "-c", script], check=True, cwd=Path(__file__).parent.parent)
+
+    with gzip_open(log_file, "rt") if "gzip" in options else open(log_file) as f:
+        assert f.read().endswith("- hello\n")